@@ -1,14 +1,19 @@
 import os
 import re
 import pandas as pd
-from PyPDF2 import PdfReader
 import warnings
+from modulo_ingesta import SECCIONES, procesar_directorio
+from modulo_filas import a_dataframe
+from modulo_secciones import tokenizar_secciones, extraer_bloques_con_lugar
+from modulo_combinar import asegurar_columnas, marcar_procedimiento
 
 warnings.filterwarnings("ignore", category=FutureWarning)  # Ocultar warning futuro
 
 # --- CONFIGURACIÓN ---
 DIRECTORIO_PDFS = r"C:\Users\ecastro\Desktop\PARTES"
 SALIDA_EXCEL = r"C:\Users\ecastro\Desktop\resultado_detallado_corregido.xlsx"
+WORKERS = os.cpu_count() or 1  # procesos para leer los PDF en paralelo (1 = secuencial)
+DIRECTORIO_CACHE = os.path.join(DIRECTORIO_PDFS, ".cache")  # texto y registros ya extraídos (None = sin cache)
 
 # --- FUNCIONES DE APOYO ---
 def limpiar_dni(dni):
@@ -38,56 +43,14 @@ def extraer_todos(patron, texto, limpiar=None):
         resultados.append(dato)
     return resultados
 
-def extraer_bloques_con_lugar(tipo, texto):
-    bloques = re.findall(
-        rf"({tipo} .*?)(?=IMPUTADO|VICTIMA|DROGA|ELEMENTO|VEHICULO|ARMA|$)",
-        texto, re.IGNORECASE | re.DOTALL
-    )
-    resultados = []
-    for bloque in bloques:
-        if not re.search(r"(Tipo:|Nombres:|Incautacion:|Marca:)", bloque, re.IGNORECASE):
-            continue
-        idx = texto.find(bloque)
-        lugar_match = re.findall(r"LUGAR\s+(\d+)", texto[:idx], re.IGNORECASE)
-        lugar_nro = lugar_match[-1] if lugar_match else "1"
-        resultados.append((bloque, lugar_nro))
-    return resultados
-
 def rellenar_vacios(diccionario):
     """Reemplaza valores vacíos por '-' en un diccionario (excepto números)."""
     return {k: (v if (v not in ["", None]) else "-") for k, v in diccionario.items()}
 
-def asegurar_columnas(df, columnas, df_lugares):
-    """
-    Asegura que un DataFrame tenga columnas predefinidas.
-    Si está vacío, crea filas usando Archivo y Lugar Nro de df_lugares,
-    y rellena los demás campos con "-".
-    """
-    if df.empty:
-        filas = []
-        for _, row in df_lugares.iterrows():
-            fila = {col: "-" for col in columnas}
-            fila["Archivo"] = row["Archivo"]
-            fila["Lugar Nro"] = str(row["Lugar Nro"])
-            filas.append(fila)
-        return pd.DataFrame(filas, columns=columnas)
-    return df
-
-# --- TABLAS ACUMULADAS ---
-cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros = ([] for _ in range(9))
-
-# --- PROCESAR TODOS LOS PDF ---
-for archivo in os.listdir(DIRECTORIO_PDFS):
-    if not archivo.lower().endswith(".pdf"):
-        continue
-
-    ruta_pdf = os.path.join(DIRECTORIO_PDFS, archivo)
-    print(f"Procesando: {archivo}")
-
-    reader = PdfReader(ruta_pdf)
-    texto = ""
-    for page in reader.pages:
-        texto += page.extract_text()
+# --- EXTRACCIÓN DE UN PARTE ---
+def extraer_parte(archivo, texto):
+    """Devuelve las filas de cada apartado extraídas del texto de un parte operativo"""
+    cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros = ([] for _ in range(9))
 
     # --- CABECERA ---
     fecha_hora = extraer_unico(r"Fecha y Hora:\s*([\d\-]+\s*-\s*\d{2}:\d{2})", texto)
@@ -140,8 +103,11 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
             "Coordenadas": coords[i] if i < len(coords) else "-",
         })
 
+    # Ubicar todos los apartados y su LUGAR en una sola pasada
+    secciones = tokenizar_secciones(texto)
+
     # --- ARMAS ---
-    for bloque, lugar in extraer_bloques_con_lugar("ARMA", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("ARMA", secciones):
         armas.append(rellenar_vacios({
             "Archivo": archivo,
             "Lugar Nro": lugar,
@@ -157,7 +123,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         }))
 
     # --- DROGAS ---
-    for bloque, lugar in extraer_bloques_con_lugar("DROGA", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("DROGA", secciones):
         drogas.append(rellenar_vacios({
             "Archivo": archivo,
             "Lugar Nro": lugar,
@@ -168,7 +134,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         }))
 
     # --- ELEMENTOS ---
-    for bloque, lugar in extraer_bloques_con_lugar("ELEMENTO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("ELEMENTO", secciones):
         elementos.append(rellenar_vacios({
             "Archivo": archivo,
             "Lugar Nro": lugar,
@@ -182,7 +148,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         }))
 
     # --- IMPUTADOS ---
-    for bloque, lugar in extraer_bloques_con_lugar("IMPUTADO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("IMPUTADO", secciones):
         imputados.append(rellenar_vacios({
             "Archivo": archivo,
             "Lugar Nro": lugar,
@@ -201,7 +167,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         }))
 
     # --- VÍCTIMAS ---
-    for bloque, lugar in extraer_bloques_con_lugar("VICTIMA", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("VICTIMA", secciones):
         victimas.append(rellenar_vacios({
             "Archivo": archivo,
             "Lugar Nro": lugar,
@@ -216,7 +182,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         }))
 
     # --- VEHÍCULOS ---
-    for bloque, lugar in extraer_bloques_con_lugar("VEHICULO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("VEHICULO", secciones):
         vehiculos.append(rellenar_vacios({
             "Archivo": archivo,
             "Lugar Nro": lugar,
@@ -239,74 +205,77 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         "Caballos": extraer_unico(r"Caballos:\s*(\d+)", texto) or "-"
     })
 
-# --- CREAR DATAFRAMES Y FORZAR FILAS VACÍAS ---
-cols_arm = ["Archivo","Lugar Nro","Tipo","Detalles","Marca","Modelo","Calibre",
-            "Numeración","Pedido de Secuestro","Observaciones","Cantidad de Armamento"]
-cols_dro = ["Archivo","Lugar Nro","Tipo","Cantidad","Medición","Observaciones"]
-cols_ele = ["Archivo","Lugar Nro","Incautación","Tipo","Subtipo","Cantidad",
-            "Medición","Aforo","Observaciones"]
-cols_imp = ["Archivo","Lugar Nro","Nombres","Apellidos","Edad","Género","DNI",
-            "Nacionalidad","Domicilio","Situación Procesal","Posee Captura",
-            "Motivo Captura","Alias","Banda Criminal"]
-cols_vic = ["Archivo","Lugar Nro","Nombres","Apellidos","Edad","Género","DNI",
-            "Nacionalidad","Domicilio","Cantidad de Victimas"]
-cols_veh = ["Archivo","Lugar Nro","Marca","Modelo","Dominio","Tipo","Detalles"]
-
-df_cab = pd.DataFrame(cabeceras)
-df_lug = pd.DataFrame(lugares)
-df_arm = asegurar_columnas(pd.DataFrame(armas), cols_arm, df_lug)
-df_dro = asegurar_columnas(pd.DataFrame(drogas), cols_dro, df_lug)
-df_ele = asegurar_columnas(pd.DataFrame(elementos), cols_ele, df_lug)
-df_imp = asegurar_columnas(pd.DataFrame(imputados), cols_imp, df_lug)
-df_vic = asegurar_columnas(pd.DataFrame(victimas), cols_vic, df_lug)
-df_veh = asegurar_columnas(pd.DataFrame(vehiculos), cols_veh, df_lug)
-df_otr = pd.DataFrame(otros)
-
-# --- GUARDAR Y UNIFICAR ---
-with pd.ExcelWriter(SALIDA_EXCEL) as writer:
-    df_cab.to_excel(writer, sheet_name="Cabecera", index=False)
-    df_lug.to_excel(writer, sheet_name="Lugares", index=False)
-    df_arm.to_excel(writer, sheet_name="Armas", index=False)
-    df_dro.to_excel(writer, sheet_name="Drogas", index=False)
-    df_ele.to_excel(writer, sheet_name="Elementos", index=False)
-    df_imp.to_excel(writer, sheet_name="Imputados", index=False)
-    df_vic.to_excel(writer, sheet_name="Victimas", index=False)
-    df_veh.to_excel(writer, sheet_name="Vehiculos", index=False)
-    df_otr.to_excel(writer, sheet_name="Otros", index=False)
-
-    # Convertir Lugar Nro a str
-    for df in [df_lug, df_arm, df_dro, df_ele, df_imp, df_vic, df_veh]:
-        if "Lugar Nro" in df.columns:
-            df["Lugar Nro"] = df["Lugar Nro"].astype(str)
-
-    # Base inicial
-    unificado = df_lug.merge(df_cab, on="Archivo", how="left").merge(df_otr, on="Archivo", how="left")
-
-    def unir(df_origen, df_apartado, nombre):
-        if df_apartado.empty:
-            return df_origen
-        if "Lugar Nro" in df_apartado.columns:
-            df_apartado["Lugar Nro"] = df_apartado["Lugar Nro"].astype(str)
-        return df_origen.merge(df_apartado, on=["Archivo", "Lugar Nro"], how="left", suffixes=("", f"_{nombre}"))
-
-    # Unir todo
-    unificado = unir(unificado, df_arm, "Arma")
-    unificado = unir(unificado, df_dro, "Droga")
-    unificado = unir(unificado, df_ele, "Elemento")
-    unificado = unir(unificado, df_imp, "Imputado")
-    unificado = unir(unificado, df_vic, "Victima")
-    unificado = unir(unificado, df_veh, "Vehiculo")
-
-    # Campo Procedimiento
-    unificado["Procedimiento"] = "-"
-    combinaciones_vistas = set()
-    for idx, row in unificado.iterrows():
-        clave = (row["Archivo"], row["Lugar Nro"])
-        if clave not in combinaciones_vistas:
-            unificado.at[idx, "Procedimiento"] = 1
-            combinaciones_vistas.add(clave)
-
-    unificado = unificado.fillna("-").infer_objects(copy=False)
-    unificado.to_excel(writer, sheet_name="Unificado", index=False)
-
-print(f"Procesamiento completo. Archivo guardado en {SALIDA_EXCEL}")
+    return dict(zip(SECCIONES, (cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros)))
+
+
+if __name__ == "__main__":
+    # --- PROCESAR PDFs ---
+    tablas = procesar_directorio(DIRECTORIO_PDFS, extraer_parte, workers=WORKERS,
+                                  directorio_cache=DIRECTORIO_CACHE)
+    cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros = (tablas[s] for s in SECCIONES)
+
+    # --- CREAR DATAFRAMES Y FORZAR FILAS VACÍAS ---
+    cols_arm = ["Archivo","Lugar Nro","Tipo","Detalles","Marca","Modelo","Calibre",
+                "Numeración","Pedido de Secuestro","Observaciones","Cantidad de Armamento"]
+    cols_dro = ["Archivo","Lugar Nro","Tipo","Cantidad","Medición","Observaciones"]
+    cols_ele = ["Archivo","Lugar Nro","Incautación","Tipo","Subtipo","Cantidad",
+                "Medición","Aforo","Observaciones"]
+    cols_imp = ["Archivo","Lugar Nro","Nombres","Apellidos","Edad","Género","DNI",
+                "Nacionalidad","Domicilio","Situación Procesal","Posee Captura",
+                "Motivo Captura","Alias","Banda Criminal"]
+    cols_vic = ["Archivo","Lugar Nro","Nombres","Apellidos","Edad","Género","DNI",
+                "Nacionalidad","Domicilio","Cantidad de Victimas"]
+    cols_veh = ["Archivo","Lugar Nro","Marca","Modelo","Dominio","Tipo","Detalles"]
+
+    df_cab = a_dataframe(cabeceras)
+    df_lug = a_dataframe(lugares)
+    df_arm = asegurar_columnas(a_dataframe(armas), cols_arm, df_lug)
+    df_dro = asegurar_columnas(a_dataframe(drogas), cols_dro, df_lug)
+    df_ele = asegurar_columnas(a_dataframe(elementos), cols_ele, df_lug)
+    df_imp = asegurar_columnas(a_dataframe(imputados), cols_imp, df_lug)
+    df_vic = asegurar_columnas(a_dataframe(victimas), cols_vic, df_lug)
+    df_veh = asegurar_columnas(a_dataframe(vehiculos), cols_veh, df_lug)
+    df_otr = a_dataframe(otros)
+
+    # --- GUARDAR Y UNIFICAR ---
+    with pd.ExcelWriter(SALIDA_EXCEL) as writer:
+        df_cab.to_excel(writer, sheet_name="Cabecera", index=False)
+        df_lug.to_excel(writer, sheet_name="Lugares", index=False)
+        df_arm.to_excel(writer, sheet_name="Armas", index=False)
+        df_dro.to_excel(writer, sheet_name="Drogas", index=False)
+        df_ele.to_excel(writer, sheet_name="Elementos", index=False)
+        df_imp.to_excel(writer, sheet_name="Imputados", index=False)
+        df_vic.to_excel(writer, sheet_name="Victimas", index=False)
+        df_veh.to_excel(writer, sheet_name="Vehiculos", index=False)
+        df_otr.to_excel(writer, sheet_name="Otros", index=False)
+
+        # Convertir Lugar Nro a str
+        for df in [df_lug, df_arm, df_dro, df_ele, df_imp, df_vic, df_veh]:
+            if "Lugar Nro" in df.columns:
+                df["Lugar Nro"] = df["Lugar Nro"].astype(str)
+
+        # Base inicial
+        unificado = df_lug.merge(df_cab, on="Archivo", how="left").merge(df_otr, on="Archivo", how="left")
+
+        def unir(df_origen, df_apartado, nombre):
+            if df_apartado.empty:
+                return df_origen
+            if "Lugar Nro" in df_apartado.columns:
+                df_apartado["Lugar Nro"] = df_apartado["Lugar Nro"].astype(str)
+            return df_origen.merge(df_apartado, on=["Archivo", "Lugar Nro"], how="left", suffixes=("", f"_{nombre}"))
+
+        # Unir todo
+        unificado = unir(unificado, df_arm, "Arma")
+        unificado = unir(unificado, df_dro, "Droga")
+        unificado = unir(unificado, df_ele, "Elemento")
+        unificado = unir(unificado, df_imp, "Imputado")
+        unificado = unir(unificado, df_vic, "Victima")
+        unificado = unir(unificado, df_veh, "Vehiculo")
+
+        # Campo Procedimiento
+        unificado["Procedimiento"] = marcar_procedimiento(unificado)
+
+        unificado = unificado.fillna("-").infer_objects(copy=False)
+        unificado.to_excel(writer, sheet_name="Unificado", index=False)
+
+    print(f"Procesamiento completo. Archivo guardado en {SALIDA_EXCEL}")
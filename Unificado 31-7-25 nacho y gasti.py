@@ -1,9 +1,13 @@
 import os
 import re
 import pandas as pd
-from PyPDF2 import PdfReader
 import warnings
-from dependencias import mapeo_dependencias
+from modulo_dependencias import dependencia_del_texto, indice_dependencias, resolver_dependencia
+from modulo_secciones import tokenizar_secciones, extraer_bloques_con_lugar
+from modulo_esquema import ESQUEMA, a_mayusculas, extraer_campos, extraer_listas
+from modulo_coordenadas import formatear_coordenadas, parsear_coordenadas
+from modulo_combinar import asegurar_columnas, expandir_y_combinar, marcar_procedimiento
+from modulo_pdf import paginas_pdf
 
 warnings.filterwarnings("ignore", category=FutureWarning)
 
@@ -13,12 +17,6 @@ SALIDA_EXCEL = r"C:\Users\ignac\OneDrive\Desktop\resultado_detallado_corregido.x
 
 
 # --- FUNCIONES AUXILIARES ---
-def limpiar_dni(dni):
-    return re.sub(r"\D", "", dni)
-
-def a_mayusculas(valor):
-    return valor.strip().upper() if isinstance(valor, str) else valor
-
 def extraer_unico(patron, texto, limpiar=None):
     match = re.search(patron, texto, re.IGNORECASE | re.DOTALL)
     if match:
@@ -28,121 +26,25 @@ def extraer_unico(patron, texto, limpiar=None):
         return dato
     return ""
 
-def extraer_todos(patron, texto, limpiar=None):
-    matches = re.findall(patron, texto, re.IGNORECASE | re.DOTALL)
-    return [limpiar(m.strip()) if limpiar else m.strip() for m in matches]
-
-def obtener_nombre_dependencia(codigo):
-    """Obtiene el código y nombre completo de la dependencia basado en el código"""
-    if not codigo or codigo == "-":
-        return "-"
-    nombre = mapeo_dependencias.get(str(codigo))
+def obtener_nombre_dependencia(codigo, texto_dependencia=""):
+    """
+    Obtiene el código y nombre completo de la dependencia basado en el código;
+    si falta o no está en la tabla, por el nombre de la línea "Dependencia:"
+    """
+    codigo, nombre = resolver_dependencia(codigo, texto_dependencia)
     if nombre:
         return f"{codigo} - {nombre}"
-    else:
-        return f"CÓDIGO {codigo} NO ENCONTRADO"
-
-
-def limpiar_coordenadas(coordenadas):
-    """Limpia y formatea las coordenadas como números decimales separados por coma"""
-    if not coordenadas or coordenadas == "-":
+    if not codigo or codigo == "-":
         return "-"
-    
-    # Función para convertir grados, minutos, segundos a decimales
-    def gms_a_decimal(grados, minutos, segundos=0):
-        return grados + (minutos / 60) + (segundos / 3600)
-    
-    # Detectar formato grados-minutos-segundos (ej: 34°36'13.32"S)
-    patron_gms = r"(\d+)°\s*(\d+)'\s*(?:(\d+(?:\.\d+)?))?"
-    matches_gms = re.findall(patron_gms, coordenadas)
-    
-    if matches_gms:
-        coords_decimales = []
-        for match in matches_gms:
-            grados = int(match[0])
-            minutos = int(match[1]) if match[1] else 0
-            segundos = float(match[2]) if match[2] else 0
-            decimal = gms_a_decimal(grados, minutos, segundos)
-            
-            # Verificar si es Sur o Oeste para hacerlo negativo
-            if 'S' in coordenadas.upper() or 'W' in coordenadas.upper():
-                if coords_decimales == []:  # Primera coordenada
-                    if 'S' in coordenadas.upper():
-                        decimal = -decimal
-                else:  # Segunda coordenada
-                    if 'W' in coordenadas.upper():
-                        decimal = -decimal
-            
-            coords_decimales.append(f"{decimal:.6f}")
-        
-        if coords_decimales:
-            return ",".join(coords_decimales)
-    
-    # Detectar formato grados-minutos (ej: 34°36.222'S)
-    patron_gm = r"(\d+)°\s*(\d+(?:\.\d+)?)'?"
-    matches_gm = re.findall(patron_gm, coordenadas)
-    
-    if matches_gm:
-        coords_decimales = []
-        for match in matches_gm:
-            grados = int(match[0])
-            minutos = float(match[1])
-            decimal = gms_a_decimal(grados, minutos)
-            
-            # Verificar si es Sur o Oeste para hacerlo negativo
-            if 'S' in coordenadas.upper() or 'W' in coordenadas.upper():
-                if coords_decimales == []:  # Primera coordenada
-                    if 'S' in coordenadas.upper():
-                        decimal = -decimal
-                else:  # Segunda coordenada
-                    if 'W' in coordenadas.upper():
-                        decimal = -decimal
-            
-            coords_decimales.append(f"{decimal:.6f}")
-        
-        if coords_decimales:
-            return ",".join(coords_decimales)
-    
-    # Si no es formato grados-minutos, proceder con limpieza normal
-    # Remover paréntesis, corchetes y otros caracteres no numéricos excepto punto, coma, espacio y signo menos
-    coordenadas_limpias = re.sub(r'[^\d\.\,\s\-]', '', coordenadas)
-    
-    # Reemplazar espacios múltiples por uno solo
-    coordenadas_limpias = re.sub(r'\s+', ' ', coordenadas_limpias).strip()
-    
-    # Si tiene espacios, reemplazarlos por comas (formato lat lon -> lat,lon)
-    if ' ' in coordenadas_limpias and ',' not in coordenadas_limpias:
-        coordenadas_limpias = coordenadas_limpias.replace(' ', ',')
-    
-    return coordenadas_limpias if coordenadas_limpias else "-"
+    return f"CÓDIGO {codigo} NO ENCONTRADO"
 
-def extraer_bloques_con_lugar(tipo, texto):
-    bloques = re.findall(
-        rf"({tipo} .*?)(?=IMPUTADO|VICTIMA|DROGA|ELEMENTO|VEHICULO|ARMA|$)",
-        texto, re.IGNORECASE | re.DOTALL
-    )
-    resultados = []
-    for bloque in bloques:
-        if not re.search(r"(Tipo:|Nombres:|Incautacion:|Marca:)", bloque, re.IGNORECASE):
-            continue
-        idx = texto.find(bloque)
-        lugar_match = re.findall(r"LUGAR\s+(\d+)", texto[:idx], re.IGNORECASE)
-        lugar_nro = lugar_match[-1] if lugar_match else "1"
-        resultados.append((bloque, lugar_nro))
-    return resultados
 
 def rellenar_vacios(diccionario):
     return {k: (v if (v not in ["", None]) else "-") for k, v in diccionario.items()}
 
 def asegurar_columnas1(df, columnas, df_lugares):
     if df.empty:
-        filas = []
-        for _, row in df_lugares.iterrows():
-            fila = {col: "-" for col in columnas}
-            fila["Archivo"] = row["Archivo"]
-            fila["Lugar Nro"] = str(row["Lugar Nro"])
-            filas.append(fila)
-        return pd.DataFrame(filas, columns=columnas)
+        return asegurar_columnas(df, columnas, df_lugares)
     
     columnas_objetivo = [
     "Tipo", "Detalles", "Marca", "Modelo", 
@@ -153,52 +55,6 @@ def asegurar_columnas1(df, columnas, df_lugares):
     df = df[~(df[columnas_objetivo] == "-").all(axis=1)]
     return df
 
-def asegurar_columnas(df, columnas, df_lugares):
-    if df.empty:
-        filas = []
-        for _, row in df_lugares.iterrows():
-            fila = {col: "-" for col in columnas}
-            fila["Archivo"] = row["Archivo"]
-            fila["Lugar Nro"] = str(row["Lugar Nro"])
-            filas.append(fila)
-        return pd.DataFrame(filas, columns=columnas)
-    return df
-
-def expandir_y_combinar(*dfs, claves=("Archivo", "Lugar Nro")):
-    dfs = [df.reset_index(drop=True) for df in dfs]
-    claves_comunes = pd.concat([df[list(claves)].drop_duplicates() for df in dfs]).drop_duplicates()
-
-    resultado = []
-    for _, clave in claves_comunes.iterrows():
-        subconjuntos = []
-        max_len = 0
-
-        for df in dfs:
-            sub = df[(df[claves[0]] == clave[claves[0]]) & (df[claves[1]] == clave[claves[1]])].copy()
-            if sub.empty:
-                fila_vacia = {col: "-" for col in df.columns}
-                fila_vacia[claves[0]] = clave[claves[0]]
-                fila_vacia[claves[1]] = clave[claves[1]]
-                sub = pd.DataFrame([fila_vacia], columns=df.columns)
-            subconjuntos.append(sub.reset_index(drop=True))
-            max_len = max(max_len, len(sub))
-
-        subconjuntos_ext = []
-        for sub in subconjuntos:
-            if len(sub) < max_len:
-                fila_vacia = {col: "-" for col in sub.columns}
-                fila_vacia[claves[0]] = clave[claves[0]]
-                fila_vacia[claves[1]] = clave[claves[1]]
-                repetidas = pd.DataFrame([fila_vacia] * (max_len - len(sub)), columns=sub.columns)
-                sub = pd.concat([sub, repetidas], ignore_index=True)
-            subconjuntos_ext.append(sub)
-
-        combinado = pd.concat(subconjuntos_ext, axis=1)
-        combinado = combinado.loc[:, ~combinado.columns.duplicated()]
-        resultado.append(combinado)
-
-    return pd.concat(resultado, ignore_index=True)
-
 def renombrar_apartado(df, prefijo):
     if df.empty:
         return df
@@ -222,8 +78,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
     ruta_pdf = os.path.join(DIRECTORIO_PDFS, archivo)
     print(f"Procesando: {archivo}")
 
-    reader = PdfReader(ruta_pdf)
-    texto = "".join(page.extract_text() for page in reader.pages)
+    texto = "".join(paginas_pdf(ruta_pdf))
     
     # Normalizar texto para soportar PDFs sin "<"
     texto_norm = texto.replace("\n", " ")
@@ -231,7 +86,9 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
     texto_norm = re.sub(r"\s*-\s*", "-", texto_norm)
 
     # --- CABECERA ---
-    fecha_hora = extraer_unico(r"Fecha y Hora:\s*([\d\-]+\s*-\s*\d{2}:\d{2})", texto_norm)
+    cab = extraer_campos(ESQUEMA["cabecera"], texto)
+    cab_norm = extraer_campos(ESQUEMA["cabecera_norm"], texto_norm)
+    fecha_hora = cab_norm["Fecha y Hora"]
     fecha, hora = "", ""
     if fecha_hora:
         partes = fecha_hora.split("-")
@@ -243,12 +100,8 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
     # Extraer código de dependencia y obtener nombre completo
 
     dependencia = a_mayusculas(extraer_unico(r"(\d*)-P.*", archivo))
-    nombre_dependencia = obtener_nombre_dependencia(dependencia)
+    nombre_dependencia = obtener_nombre_dependencia(dependencia, dependencia_del_texto(texto))
     
-    delito2 = a_mayusculas(extraer_unico(r"Delito 2:\s*(.+?)\s*<", texto)) or "-"
-    delito3 = a_mayusculas(extraer_unico(r"Delito 3:\s*(.+?)\s*<", texto)) or "-"
-    detalle_delito = a_mayusculas(extraer_unico(r"Detalle de Delito:\s*(.+?)\s*<", texto)) or "-"
-
     cabeceras.append({
         "Archivo": archivo,
         "Parte Operativo": a_mayusculas(extraer_unico(r"(.*)\.pdf", archivo)),
@@ -256,123 +109,77 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         "Dependencia": dependencia if dependencia else "-",
         "Fecha": fecha if fecha else "-",
         "Hora": hora if hora else "-",
-        "Sumario": a_mayusculas(extraer_unico(r"Sumario:\s*(.+?)\s*<", texto)),
-        "Delito": a_mayusculas(extraer_unico(r"Delito 1:\s*(.+?)\s*<", texto)),
-        "Delito 2": delito2,
-        "Delito 3": delito3,
-        "Detalle de Delito": detalle_delito,
-        "Modalidad": a_mayusculas(extraer_unico(r"Modalidad 1:\s*(.+?)\s*<", texto)),
-        "Tipo Intervención": a_mayusculas(extraer_unico(r"Tipo de Intervenci[oó]n:\s*([^\n<]+)", texto_norm)),
-        "Juzgado / Fiscalía": a_mayusculas(extraer_unico(r"Juzgado\s*/?\s*Fiscal[ií]a\s*:?\s*([\s\S]+?)(?=<|\n|$)", texto)),
-        "Secretaría": a_mayusculas(extraer_unico(r"Secretaria:\s*(.+?)\s*<", texto)),
-        "Causa Nro.": a_mayusculas(extraer_unico(r"Causa Nro.:\s*(.+?)\s*<", texto)),
-        "Carátula": a_mayusculas(extraer_unico(r"Caratula:\s*(.+?)\s*<", texto)),        
+        "Sumario": cab["Sumario"],
+        "Delito": cab["Delito"],
+        "Delito 2": cab["Delito 2"],
+        "Delito 3": cab["Delito 3"],
+        "Detalle de Delito": cab["Detalle de Delito"],
+        "Modalidad": cab["Modalidad"],
+        "Tipo Intervención": cab_norm["Tipo Intervención"],
+        "Juzgado / Fiscalía": cab["Juzgado / Fiscalía"],
+        "Secretaría": cab["Secretaría"],
+        "Causa Nro.": cab["Causa Nro."],
+        "Carátula": cab["Carátula"],
     })
     
     
     # --- LUGARES ---
-    calles = extraer_todos(r"Calle:\s*(.+?)\s*<", texto)
-    localidades = extraer_todos(r"Localidad:\s*(.+?)\s*<", texto)
-    departamentos = extraer_todos(r"Departamento / Partido / Comuna:\s*(.+?)\s*<", texto)
-    provincias = extraer_todos(r"Provincia:\s*(.+?)\s*<", texto)
-    coords = extraer_todos(r"Coordenadas:\s*([^\n<]+)", texto)
-    for i in range(len(calles)):
+    listas = extraer_listas(ESQUEMA["lugares"], texto)
+    for i in range(len(listas["Calle"])):
         lugares.append({
             "Archivo": archivo,
             "Lugar Nro": i+1,
-            "Calle": a_mayusculas(calles[i]),
-            "Localidad": a_mayusculas(localidades[i]) if i < len(localidades) else "-",
-            "Departamento / Comuna": a_mayusculas(departamentos[i]) if i < len(departamentos) else "-",
-            "Provincia": a_mayusculas(provincias[i]) if i < len(provincias) else "-",
-            "Coordenadas": limpiar_coordenadas(coords[i]) if i < len(coords) else "-",
+            **{col: valores[i] if i < len(valores) else "-" for col, valores in listas.items()},
         })
 
+    # Ubicar todos los apartados y su LUGAR en una sola pasada
+    secciones = tokenizar_secciones(texto)
+
     # --- OTROS APARTADOS ---
-    for bloque, lugar in extraer_bloques_con_lugar("ARMA", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("ARMA", secciones):
         armas.append(rellenar_vacios({
             "Archivo": archivo, "Lugar Nro": lugar,
-            "Tipo": a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque)),
-            "Detalles": a_mayusculas(extraer_unico(r"Detalles:\s*([^\n<]+)", bloque)),
-            "Marca": a_mayusculas(extraer_unico(r"Marca:\s*([^\n<]+)", bloque)),
-            "Modelo": a_mayusculas(extraer_unico(r"Modelo:\s*([^\n<]+)", bloque)),
-            "Calibre": a_mayusculas(extraer_unico(r"Calibre:\s*([^\n<]+)", bloque)),
-            "Numeración": a_mayusculas(extraer_unico(r"Numeracion:\s*([^\n<]+)", bloque)),
-            "Pedido de Secuestro": a_mayusculas(extraer_unico(r"Pedido de Secuestro:\s*([^\n<]+)", bloque)),
-            "Observaciones": a_mayusculas(extraer_unico(r"Observaciones:\s*(.+?)\s*(?=<|$)", bloque)),
+            **extraer_campos(ESQUEMA["armas"], bloque),
             "Cantidad de Armamento": 1
         }))
-    for bloque, lugar in extraer_bloques_con_lugar("DROGA", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("DROGA", secciones):
         drogas.append(rellenar_vacios({
             "Archivo": archivo, "Lugar Nro": lugar,
-            "Tipo": a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque)),
-            "Cantidad": extraer_unico(r"Cantidad:\s*([\d.,]+)", bloque),
-            "Medición": a_mayusculas(extraer_unico(r"Medicion:\s*([^\n<]+)", bloque)),
-            "Observaciones": a_mayusculas(extraer_unico(r"Observaciones:\s*(.+?)\s*(?=<|$)", bloque))
+            **extraer_campos(ESQUEMA["drogas"], bloque)
         }))
-    for bloque, lugar in extraer_bloques_con_lugar("ELEMENTO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("ELEMENTO", secciones):
         elementos.append(rellenar_vacios({
             "Archivo": archivo, "Lugar Nro": lugar,
-            "Incautación": a_mayusculas(extraer_unico(r"Incautacion:\s*([^\n<]+)", bloque)),
-            "Tipo": a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque)),
-            "Subtipo": a_mayusculas(extraer_unico(r"Subtipo:\s*([^\n<]+)", bloque)),
-            "Cantidad": extraer_unico(r"Cantidad:\s*([\d.,]+)", bloque),
-            "Medición": a_mayusculas(extraer_unico(r"Medicion:\s*([^\n<]+)", bloque)),
-            "Aforo": extraer_unico(r"Aforo:\$([\d.,]*)", bloque),
-            "Observaciones": a_mayusculas(extraer_unico(r"Observaciones:\s*(.+?)\s*(?=<|$)", bloque))
+            **extraer_campos(ESQUEMA["elementos"], bloque)
         }))
-    for bloque, lugar in extraer_bloques_con_lugar("IMPUTADO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("IMPUTADO", secciones):
         imputados.append(rellenar_vacios({
             "Archivo": archivo, "Lugar Nro": lugar,
-            "Nombres": a_mayusculas(extraer_unico(r"Nombres:\s*([^\n<]+)", bloque)),
-            "Apellidos": a_mayusculas(extraer_unico(r"Apellidos:\s*([^\n<]+)", bloque)),
-            "Edad": extraer_unico(r"Edad:\s*(\d+)", bloque),
-            "Género": a_mayusculas(extraer_unico(r"Genero:\s*([^\n<]+)", bloque)),
-            "DNI": extraer_unico(r"DNI:\s*([.\d]+)", bloque, limpiar=limpiar_dni),
-            "Nacionalidad": a_mayusculas(extraer_unico(r"Nacionalidad:\s*([^\n<]+)", bloque)),
-            "Domicilio": a_mayusculas(extraer_unico(r"Domicilio:\s*([^\n<]+)", bloque)),
-            "Situación Procesal": a_mayusculas(extraer_unico(r"Situacion\s*Procesal\s*:\s*([\w\s]+)", bloque)),
-            "Posee Captura": a_mayusculas(extraer_unico(r"Posee\s*Captura\s*:\s*([\w\s]+)", bloque)),
-            "Motivo Captura": a_mayusculas(extraer_unico(r"Motivo del Pedido de Captura:\s*([^\n<]+)", bloque)),
-            "Alias": a_mayusculas(extraer_unico(r"Alias:\s*([^\n<]+)", bloque)) or "-",
-            "Banda Criminal": a_mayusculas(extraer_unico(r"Banda Criminal:\s*([^\n<]+)", bloque)) or "-"
+            **extraer_campos(ESQUEMA["imputados"], bloque)
         }))
-    for bloque, lugar in extraer_bloques_con_lugar("VICTIMA", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("VICTIMA", secciones):
         victimas.append(rellenar_vacios({
             "Archivo": archivo, "Lugar Nro": lugar,
-            "Nombres": a_mayusculas(extraer_unico(r"Nombres:\s*([^\n<]+)", bloque)),
-            "Apellidos": a_mayusculas(extraer_unico(r"Apellidos:\s*([^\n<]+)", bloque)),
-            "Edad": extraer_unico(r"Edad:\s*(\d+)", bloque),
-            "Género": a_mayusculas(extraer_unico(r"Genero:\s*([^\n<]+)", bloque)),
-            "DNI": extraer_unico(r"DNI:\s*([.\d]+)", bloque, limpiar=limpiar_dni),
-            "Nacionalidad": a_mayusculas(extraer_unico(r"Nacionalidad:\s*([^\n<]+)", bloque)),
-            "Domicilio": a_mayusculas(extraer_unico(r"Domicilio:\s*([^\n<]+)", bloque)),
+            **extraer_campos(ESQUEMA["victimas"], bloque),
             "Cantidad de Victimas": 1
         }))
-    for bloque, lugar in extraer_bloques_con_lugar("VEHICULO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("VEHICULO", secciones):
         vehiculos.append(rellenar_vacios({
             "Archivo": archivo, "Lugar Nro": lugar,
-            "Marca": a_mayusculas(extraer_unico(r"Marca:\s*([^\n<]+)", bloque)),
-            "Modelo": a_mayusculas(extraer_unico(r"Modelo:\s*([^\n<]+)", bloque)),
-            "Dominio": a_mayusculas(extraer_unico(r"Dominio:\s*([^\n<]+)", bloque)),
-            "Tipo": a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque)),
-            "Detalles": a_mayusculas(extraer_unico(r"Detalles:\s*(.+?)\s*(?=<|$)", bloque))
+            **extraer_campos(ESQUEMA["vehiculos"], bloque)
         }))
 
-    otros.append({
-        "Archivo": archivo,
-        "Efectivos": extraer_unico(r"Efectivos:\s*(\d+)", texto) or "-",
-        "Moviles": extraer_unico(r"Moviles:\s*(\d+)", texto) or "-",
-        "Motos": extraer_unico(r"Motos:\s*(\d+)", texto) or "-",
-        "Canes": extraer_unico(r"Canes:\s*(\d+)", texto) or "-",
-        "Morphrapid": extraer_unico(r"Morphrapid:\s*(\d+)", texto) or "-",
-        "Scanners": extraer_unico(r"Scanners:\s*(\d+)", texto) or "-",
-        "Caballos": extraer_unico(r"Caballos:\s*(\d+)", texto) or "-"
-    })
+    otros.append({"Archivo": archivo, **extraer_campos(ESQUEMA["otros"], texto)})
 
 
 # --- CREAR DATAFRAMES Y RENOMBRAR ---
 df_cab = pd.DataFrame(cabeceras)
 df_lug = pd.DataFrame(lugares)
+# Coordenadas: todas juntas a lat/lon decimales, con el estado de cada una
+if "Coordenadas" in df_lug.columns:
+    coordenadas = parsear_coordenadas(df_lug["Coordenadas"])
+    df_lug["Coordenadas"] = formatear_coordenadas(coordenadas, df_lug["Coordenadas"])
+    df_lug = pd.concat([df_lug, coordenadas], axis=1)
 df_arm = renombrar_apartado(asegurar_columnas1(pd.DataFrame(armas), ["Archivo","Lugar Nro","Tipo","Detalles","Marca","Modelo","Calibre",
                                                 "Numeración","Pedido de Secuestro","Observaciones","Cantidad de Armamento"], df_lug), "Arma")
 df_dro = renombrar_apartado(asegurar_columnas(pd.DataFrame(drogas), ["Archivo","Lugar Nro","Tipo","Cantidad","Medición","Observaciones"], df_lug), "Droga")
@@ -403,13 +210,7 @@ unificado = (
 )
 
 # --- CAMPO PROCEDIMIENTO ---
-unificado["Procedimiento"] = "-"
-vistos = set()
-for idx, row in unificado.iterrows():
-    clave = (row["Archivo"], row["Lugar Nro"])
-    if clave not in vistos:
-        unificado.at[idx, "Procedimiento"] = 1
-        vistos.add(clave)
+unificado["Procedimiento"] = marcar_procedimiento(unificado)
 
 # --- CAMPO LP ---
 unificado["LP"] = "1111"
@@ -428,4 +229,4 @@ with pd.ExcelWriter(SALIDA_EXCEL) as writer:
     unificado.to_excel(writer, sheet_name="Unificado", index=False)
 
 print(f"Procesamiento completo. Archivo guardado en {SALIDA_EXCEL}")
-print(f"Se procesaron {len(mapeo_dependencias)} códigos de dependencia")
\ No newline at end of file
+print(f"Se procesaron {len(indice_dependencias()['nombres'])} códigos de dependencia")
\ No newline at end of file
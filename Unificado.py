@@ -1,22 +1,78 @@
 import os
 import re
 import pandas as pd
-from PyPDF2 import PdfReader
 import warnings
+from modulo_ingesta import SECCIONES, iterar_directorio, procesar_directorio
+from modulo_secciones import tokenizar_secciones, extraer_bloques_con_lugar
+from modulo_esquema import ESQUEMA, ESQUEMA_NO_LEE, a_mayusculas, extraer_campos, extraer_listas
+from modulo_formato import NO_LEE, clasificar_formato
+from modulo_calidad import calidad_parte
+from modulo_dependencias import VERSION_DEPENDENCIAS, codigo_por_nombre, dependencia_del_texto
+from modulo_combinar import asegurar_columnas, expandir_y_combinar, marcar_procedimiento
+from modulo_excel import abrir_libro, agregar_a_libro, agregar_filas, cerrar_libro, libro_bloqueado
+from modulo_columnar import guardar_columnar
+from modulo_filas import a_dataframe, acumular_filas, iterar_filas, nueva_tabla
+from modulo_sqlite import abrir_base, guardar_partes, leer_tablas
+from modulo_metricas import (abrir_metricas, cerrar_metricas, guardar_metricas, medir,
+                             registrar_archivo, resumen_metricas)
+from modulo_incremental import (cargar_manifiesto, guardar_manifiesto, mover_a_en_la_base,
+                                partes_nuevos, registrar_partes, reiniciar_manifiesto)
+from modulo_vigilancia import esperar_pdfs
+from modulo_objetos import TIPOS, antecedentes, cargar_indice_objetos, guardar_indice_objetos, indexar_objetos, nuevo_indice_objetos
+from modulo_personas import cargar_indice, guardar_indice, indexar_partes, nuevo_indice, reincidentes
 
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 # --- CONFIGURACIÓN ---
 DIRECTORIO_PDFS = r"C:\Users\ecastro\Desktop\PARTES"
 SALIDA_EXCEL = r"C:\Users\ecastro\Desktop\resultado_detallado_corregido.xlsx"
+WORKERS = os.cpu_count() or 1  # procesos para leer los PDF en paralelo (1 = secuencial)
+DIRECTORIO_CACHE = os.path.join(DIRECTORIO_PDFS, ".cache")  # texto y registros ya extraídos (None = sin cache)
+DIRECTORIO_ESTADO = os.path.join(DIRECTORIO_PDFS, ".cache")  # manifiesto.json, personas.json y objetos.json entre corridas (si se borra, el modo incremental vuelve a cargar todo)
+SALIDA_STREAMING = False  # escribir cada parte en el Excel apenas se procesa (memoria constante)
+TAMANO_LOTE = None  # modo por lotes: partes que se procesan y escriben juntos en el Excel (memoria acotada; None = todos juntos)
+SALIDA_COLUMNAR = None  # carpeta para guardar además cada hoja en Parquet/Feather (None = solo Excel; requiere pyarrow)
+FORMATO_COLUMNAR = "parquet"  # "parquet" o "feather"
+SALIDA_SQLITE = None  # base SQLite donde se guardan además (o se actualizan) los partes procesados (None = sin base)
+EXCEL_DESDE_SQLITE = False  # no leer PDF: armar el Excel con todo lo que hay en SALIDA_SQLITE
+MODO_INCREMENTAL = False  # procesar solo los partes nuevos (ver manifiesto.json en DIRECTORIO_ESTADO) y agregarlos al Excel existente
+MODO_VIGILANCIA = False  # quedarse vigilando la carpeta y agregar cada parte nuevo al Excel apenas llega (Ctrl+C para salir)
+MOVER_A_EN_LA_BASE = False  # en modo incremental o vigilancia, mover los PDF procesados a EN LA BASE
+DIRECTORIO_EN_LA_BASE = os.path.join(DIRECTORIO_PDFS, "EN LA BASE")
+HOJA_REINCIDENTES = False  # índice de imputados y víctimas por DNI (personas.json en DIRECTORIO_ESTADO) y hoja "Reincidentes"
+INDICE_OBJETOS = False  # dominios y numeraciones de todas las corridas (objetos.json en DIRECTORIO_ESTADO) y sus otros partes en Vehiculos y Armas
+REPORTE_METRICAS = None  # JSON con tiempos por archivo y por etapa, páginas, bytes y filas (None = sin reporte)
+VERSION_DATOS = VERSION_DEPENDENCIAS  # tablas que usa extraer_parte: si cambian, el cache no reutiliza registros viejos
 
-# --- FUNCIONES AUXILIARES ---
-def limpiar_dni(dni):
-    return re.sub(r"\D", "", dni)
+# --- HOJAS ---
+HOJAS = ["Cabecera", "Lugares", "Armas", "Drogas", "Elementos", "Imputados", "Victimas", "Vehiculos", "Otros", "Unificado"]
+COLUMNAS_LUGARES = ["Archivo","Lugar Nro","Calle","Localidad","Departamento / Comuna","Provincia","Coordenadas"]
+# (sección, hoja, sufijo de las columnas en Unificado, columnas)
+APARTADOS = [
+    ("armas", "Armas", "Arma", ["Archivo","Lugar Nro","Tipo","Detalles","Marca","Modelo","Calibre",
+                                "Numeración","Pedido de Secuestro","Observaciones","Cantidad de Armamento"]),
+    ("drogas", "Drogas", "Droga", ["Archivo","Lugar Nro","Tipo","Cantidad","Medición","Observaciones"]),
+    ("elementos", "Elementos", "Elemento", ["Archivo","Lugar Nro","Incautación","Tipo","Subtipo","Cantidad",
+                                            "Medición","Aforo","Observaciones"]),
+    ("imputados", "Imputados", "Imputado", ["Archivo","Lugar Nro","Nombres","Apellidos","Edad","Género","DNI",
+                                            "Nacionalidad","Domicilio","Situación Procesal","Posee Captura",
+                                            "Motivo Captura","Alias","Banda Criminal"]),
+    ("victimas", "Victimas", "Victima", ["Archivo","Lugar Nro","Nombres","Apellidos","Edad","Género","DNI",
+                                         "Nacionalidad","Domicilio","Cantidad de Victimas"]),
+    ("vehiculos", "Vehiculos", "Vehiculo", ["Archivo","Lugar Nro","Marca","Modelo","Dominio","Tipo","Detalles"]),
+]
 
-def a_mayusculas(valor):
-    return valor.strip().upper() if isinstance(valor, str) else valor
+# (palabra que abre el apartado en el texto, sección, columnas con valor fijo)
+APARTADOS_TEXTO = [
+    ("ARMA", "armas", {"Cantidad de Armamento": 1}),
+    ("DROGA", "drogas", {}),
+    ("ELEMENTO", "elementos", {}),
+    ("IMPUTADO", "imputados", {}),
+    ("VICTIMA", "victimas", {"Cantidad de Victimas": 1}),
+    ("VEHICULO", "vehiculos", {}),
+]
 
+# --- FUNCIONES AUXILIARES ---
 def extraer_unico(patron, texto, limpiar=None):
     match = re.search(patron, texto, re.IGNORECASE | re.DOTALL)
     if match:
@@ -26,289 +82,417 @@ def extraer_unico(patron, texto, limpiar=None):
         return dato
     return ""
 
-def extraer_todos(patron, texto, limpiar=None):
-    matches = re.findall(patron, texto, re.IGNORECASE | re.DOTALL)
-    return [limpiar(m.strip()) if limpiar else m.strip() for m in matches]
-
-def extraer_bloques_con_lugar(tipo, texto):
-    bloques = re.findall(
-        rf"({tipo} .*?)(?=IMPUTADO|VICTIMA|DROGA|ELEMENTO|VEHICULO|ARMA|$)",
-        texto, re.IGNORECASE | re.DOTALL
-    )
-    resultados = []
-    for bloque in bloques:
-        if not re.search(r"(Tipo:|Nombres:|Incautacion:|Marca:)", bloque, re.IGNORECASE):
-            continue
-        idx = texto.find(bloque)
-        lugar_match = re.findall(r"LUGAR\s+(\d+)", texto[:idx], re.IGNORECASE)
-        lugar_nro = lugar_match[-1] if lugar_match else "1"
-        resultados.append((bloque, lugar_nro))
-    return resultados
-
 def rellenar_vacios(diccionario):
-    return {k: (v if (v not in ["", None]) else "-") for k, v in diccionario.items()}
-
-def asegurar_columnas(df, columnas, df_lugares):
-    if df.empty:
-        filas = []
-        for _, row in df_lugares.iterrows():
-            fila = {col: "-" for col in columnas}
-            fila["Archivo"] = row["Archivo"]
-            fila["Lugar Nro"] = str(row["Lugar Nro"])
-            filas.append(fila)
-        return pd.DataFrame(filas, columns=columnas)
-    return df
-
-def expandir_y_combinar(*dfs, claves=("Archivo", "Lugar Nro")):
-    dfs = [df.reset_index(drop=True) for df in dfs]
-    claves_comunes = pd.concat([df[list(claves)].drop_duplicates() for df in dfs]).drop_duplicates()
-
-    resultado = []
-    for _, clave in claves_comunes.iterrows():
-        subconjuntos = []
-        max_len = 0
-
-        for df in dfs:
-            sub = df[(df[claves[0]] == clave[claves[0]]) & (df[claves[1]] == clave[claves[1]])].copy()
-            if sub.empty:
-                fila_vacia = {col: "-" for col in df.columns}
-                fila_vacia[claves[0]] = clave[claves[0]]
-                fila_vacia[claves[1]] = clave[claves[1]]
-                sub = pd.DataFrame([fila_vacia], columns=df.columns)
-            subconjuntos.append(sub.reset_index(drop=True))
-            max_len = max(max_len, len(sub))
-
-        subconjuntos_ext = []
-        for sub in subconjuntos:
-            if len(sub) < max_len:
-                fila_vacia = {col: "-" for col in sub.columns}
-                fila_vacia[claves[0]] = clave[claves[0]]
-                fila_vacia[claves[1]] = clave[claves[1]]
-                repetidas = pd.DataFrame([fila_vacia] * (max_len - len(sub)), columns=sub.columns)
-                sub = pd.concat([sub, repetidas], ignore_index=True)
-            subconjuntos_ext.append(sub)
-
-        combinado = pd.concat(subconjuntos_ext, axis=1)
-        combinado = combinado.loc[:, ~combinado.columns.duplicated()]
-        resultado.append(combinado)
-
-    return pd.concat(resultado, ignore_index=True)
+    """Pone "-" en los campos vacíos, sobre el mismo dict (no hace falta una copia por fila)"""
+    for k, v in diccionario.items():
+        if v in ["", None]:
+            diccionario[k] = "-"
+    return diccionario
+
+def codigo_dependencia(texto):
+    """Código de la dependencia por su nombre, para los partes sin "Codigo de Dependencia:" legible"""
+    return codigo_por_nombre(dependencia_del_texto(texto)) or ""
 
 def renombrar_apartado(df, prefijo):
-    if df.empty:
-        return df
     nuevas = {}
     for col in df.columns:
         if col not in ["Archivo", "Lugar Nro"]:
             nuevas[col] = f"{col} {prefijo}"
     return df.rename(columns=nuevas)
 
-# --- TABLAS ACUMULADAS ---
-cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros = ([] for _ in range(9))
-
-# --- PROCESAR PDFs ---
-for archivo in os.listdir(DIRECTORIO_PDFS):
-    if not archivo.lower().endswith(".pdf"):
-        continue
-
-    ruta_pdf = os.path.join(DIRECTORIO_PDFS, archivo)
-    print(f"Procesando: {archivo}")
-
-    reader = PdfReader(ruta_pdf)
-    texto = "".join(page.extract_text() for page in reader.pages)
-    
-    # Normalizar texto para soportar PDFs sin "<"
-    texto_norm = texto.replace("\n", " ")
-    texto_norm = re.sub(r"\s+", " ", texto_norm)
-    texto_norm = re.sub(r"\s*-\s*", "-", texto_norm)
+# --- EXTRACCIÓN DE UN PARTE ---
+def extraer_parte(archivo, texto):
+    """
+    Devuelve las filas de cada apartado extraídas del texto de un parte
+    operativo. El esquema se elige según el formato del texto (modulo_formato):
+    los partes sin "<" de cierre se leen con el esquema de no_lee.py.
+    """
+    formato = clasificar_formato(texto)
+    esquema = ESQUEMA_NO_LEE if formato == NO_LEE else ESQUEMA
+    cabeceras, lugares, otros = [], [], []
 
     # --- CABECERA ---
-    #fecha = extraer_unico(r"Fecha y Hora:\s*([\d]{2}-[\d]{2}-[\d]{4})", texto)
-    #hora = extraer_unico(r"Fecha y Hora:.*?-\s*(\d{2}:\d{2})", texto)
-    #fecha = extraer_unico(r"Fecha\s*y\s*Hora\s*:\s*([0-9]{2}-[0-9]{2}-[0-9]{4})", texto_norm)
-    #hora = extraer_unico(r"Fecha\s*y\s*Hora\s*:[^0-9]*([0-9]{2}:[0-9]{2})", texto_norm)
-    fecha_hora = extraer_unico(r"Fecha y Hora:\s*([\d\-]+\s*-\s*\d{2}:\d{2})", texto_norm)
+    with medir("regex cabecera"):
+        # Normalizar texto para soportar PDFs sin "<"
+        texto_norm = texto.replace("\n", " ")
+        texto_norm = re.sub(r"\s+", " ", texto_norm)
+        texto_norm = re.sub(r"\s*-\s*", "-", texto_norm)
+
+        cab = extraer_campos(esquema["cabecera"], texto)
+        cab_norm = extraer_campos(esquema["cabecera_norm"], texto_norm)
     fecha, hora = "", ""
-    if fecha_hora:
-        partes = fecha_hora.split("-")
+    if formato == NO_LEE:
+        # El esquema NO LEE ya trae la fecha (DD-MM-YYYY) y la hora por separado
+        if cab_norm["Fecha"] != "-":
+            d, m, y = cab_norm["Fecha"].split("-")
+            fecha = f"{y}-{m}-{d}"  # YYYY-MM-DD
+        if cab_norm["Hora"] != "-":
+            hora = cab_norm["Hora"]
+    elif cab_norm["Fecha y Hora"]:
+        partes = cab_norm["Fecha y Hora"].split("-")
         if len(partes) >= 3:
             d, m, y = partes[0].strip(), partes[1].strip(), partes[2].strip().split()[0]
             fecha = f"{y}-{m}-{d}"  # YYYY-MM-DD
             hora = partes[-1].strip()
-    delito2 = a_mayusculas(extraer_unico(r"Delito 2:\s*(.+?)\s*<", texto)) or "-"
-    delito3 = a_mayusculas(extraer_unico(r"Delito 3:\s*(.+?)\s*<", texto)) or "-"
-    detalle_delito = a_mayusculas(extraer_unico(r"Detalle de Delito:\s*(.+?)\s*<", texto)) or "-"
 
     cabeceras.append({
         "Archivo": archivo,
         "Parte Operativo": a_mayusculas(extraer_unico(r"(.*)\.pdf", archivo)),
-        "Código Dependencia": a_mayusculas(extraer_unico(r"Codigo de Dependencia:\s*(\d+)", texto)),
+        "Código Dependencia": cab["Código Dependencia"] or codigo_dependencia(texto),
         "Dependencia": a_mayusculas(extraer_unico(r"(\d*)-P.*", archivo)),
         "Fecha": fecha if fecha else "-",
         "Hora": hora if hora else "-",
-        "Sumario": a_mayusculas(extraer_unico(r"Sumario:\s*(.+?)\s*<", texto)),
-        "Delito": a_mayusculas(extraer_unico(r"Delito 1:\s*(.+?)\s*<", texto)),
-        "Delito 2": delito2,
-        "Delito 3": delito3,
-        "Detalle de Delito": detalle_delito,
-        "Modalidad": a_mayusculas(extraer_unico(r"Modalidad 1:\s*(.+?)\s*<", texto)),
-        "Tipo Intervención": a_mayusculas(extraer_unico(r"Tipo de Intervenci[oó]n:\s*([^\n<]+)", texto_norm)),
-        "Juzgado / Fiscalía": a_mayusculas(extraer_unico(r"Juzgado\s*/?\s*Fiscal[ií]a\s*:?\s*([\s\S]+?)(?=<|\n|$)", texto)),
-        "Secretaría": a_mayusculas(extraer_unico(r"Secretaria:\s*(.+?)\s*<", texto)),
-        "Causa Nro.": a_mayusculas(extraer_unico(r"Causa Nro.:\s*(.+?)\s*<", texto)),
-        "Carátula": a_mayusculas(extraer_unico(r"Caratula:\s*(.+?)\s*<", texto)),        
+        "Sumario": cab["Sumario"],
+        "Delito": cab["Delito"],
+        "Delito 2": cab["Delito 2"],
+        "Delito 3": cab["Delito 3"],
+        "Detalle de Delito": cab["Detalle de Delito"],
+        "Modalidad": cab["Modalidad"],
+        "Tipo Intervención": cab_norm["Tipo Intervención"],
+        "Juzgado / Fiscalía": cab["Juzgado / Fiscalía"],
+        "Secretaría": cab["Secretaría"],
+        "Causa Nro.": cab["Causa Nro."],
+        "Carátula": cab["Carátula"],
     })
     # --- LUGARES ---
-    calles = extraer_todos(r"Calle:\s*(.+?)\s*<", texto)
-    localidades = extraer_todos(r"Localidad:\s*(.+?)\s*<", texto)
-    departamentos = extraer_todos(r"Departamento / Partido / Comuna:\s*(.+?)\s*<", texto)
-    provincias = extraer_todos(r"Provincia:\s*(.+?)\s*<", texto)
-    coords = extraer_todos(r"Coordenadas:\s*([^\n<]+)", texto)
-    for i in range(len(calles)):
+    with medir("regex lugares"):
+        listas = extraer_listas(esquema["lugares"], texto)
+    for i in range(len(listas["Calle"])):
         lugares.append({
             "Archivo": archivo,
             "Lugar Nro": i+1,
-            "Calle": a_mayusculas(calles[i]),
-            "Localidad": a_mayusculas(localidades[i]) if i < len(localidades) else "-",
-            "Departamento / Comuna": a_mayusculas(departamentos[i]) if i < len(departamentos) else "-",
-            "Provincia": a_mayusculas(provincias[i]) if i < len(provincias) else "-",
-            "Coordenadas": coords[i] if i < len(coords) else "-",
+            **{col: valores[i] if i < len(valores) else "-" for col, valores in listas.items()},
         })
 
+    # Ubicar todos los apartados y su LUGAR en una sola pasada
+    with medir("tokenizar secciones"):
+        secciones = tokenizar_secciones(texto)
+
     # --- OTROS APARTADOS ---
-    for bloque, lugar in extraer_bloques_con_lugar("ARMA", texto):
-        armas.append(rellenar_vacios({
-            "Archivo": archivo, "Lugar Nro": lugar,
-            "Tipo": a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque)),
-            "Detalles": a_mayusculas(extraer_unico(r"Detalles:\s*([^\n<]+)", bloque)),
-            "Marca": a_mayusculas(extraer_unico(r"Marca:\s*([^\n<]+)", bloque)),
-            "Modelo": a_mayusculas(extraer_unico(r"Modelo:\s*([^\n<]+)", bloque)),
-            "Calibre": a_mayusculas(extraer_unico(r"Calibre:\s*([^\n<]+)", bloque)),
-            "Numeración": a_mayusculas(extraer_unico(r"Numeracion:\s*([^\n<]+)", bloque)),
-            "Pedido de Secuestro": a_mayusculas(extraer_unico(r"Pedido de Secuestro:\s*([^\n<]+)", bloque)),
-            "Observaciones": a_mayusculas(extraer_unico(r"Observaciones:\s*(.+?)\s*(?=<|$)", bloque)),
-            "Cantidad de Armamento": 1
-        }))
-    for bloque, lugar in extraer_bloques_con_lugar("DROGA", texto):
-        drogas.append(rellenar_vacios({
-            "Archivo": archivo, "Lugar Nro": lugar,
-            "Tipo": a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque)),
-            "Cantidad": extraer_unico(r"Cantidad:\s*([\d.,]+)", bloque),
-            "Medición": a_mayusculas(extraer_unico(r"Medicion:\s*([^\n<]+)", bloque)),
-            "Observaciones": a_mayusculas(extraer_unico(r"Observaciones:\s*(.+?)\s*(?=<|$)", bloque))
-        }))
-    for bloque, lugar in extraer_bloques_con_lugar("ELEMENTO", texto):
-        elementos.append(rellenar_vacios({
-            "Archivo": archivo, "Lugar Nro": lugar,
-            "Incautación": a_mayusculas(extraer_unico(r"Incautacion:\s*([^\n<]+)", bloque)),
-            "Tipo": a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque)),
-            "Subtipo": a_mayusculas(extraer_unico(r"Subtipo:\s*([^\n<]+)", bloque)),
-            "Cantidad": extraer_unico(r"Cantidad:\s*([\d.,]+)", bloque),
-            "Medición": a_mayusculas(extraer_unico(r"Medicion:\s*([^\n<]+)", bloque)),
-            "Aforo": extraer_unico(r"Aforo:\$([\d.,]*)", bloque),
-            "Observaciones": a_mayusculas(extraer_unico(r"Observaciones:\s*(.+?)\s*(?=<|$)", bloque))
-        }))
-    for bloque, lugar in extraer_bloques_con_lugar("IMPUTADO", texto):
-        imputados.append(rellenar_vacios({
-            "Archivo": archivo, "Lugar Nro": lugar,
-            "Nombres": a_mayusculas(extraer_unico(r"Nombres:\s*([^\n<]+)", bloque)),
-            "Apellidos": a_mayusculas(extraer_unico(r"Apellidos:\s*([^\n<]+)", bloque)),
-            "Edad": extraer_unico(r"Edad:\s*(\d+)", bloque),
-            "Género": a_mayusculas(extraer_unico(r"Genero:\s*([^\n<]+)", bloque)),
-            "DNI": extraer_unico(r"DNI:\s*([.\d]+)", bloque, limpiar=limpiar_dni),
-            "Nacionalidad": a_mayusculas(extraer_unico(r"Nacionalidad:\s*([^\n<]+)", bloque)),
-            "Domicilio": a_mayusculas(extraer_unico(r"Domicilio:\s*([^\n<]+)", bloque)),
-            "Situación Procesal": a_mayusculas(extraer_unico(r"Situacion\s*Procesal\s*:\s*([\w\s]+)", bloque)),
-            "Posee Captura": a_mayusculas(extraer_unico(r"Posee\s*Captura\s*:\s*([\w\s]+)", bloque)),
-            "Motivo Captura": a_mayusculas(extraer_unico(r"Motivo del Pedido de Captura:\s*([^\n<]+)", bloque)),
-            "Alias": a_mayusculas(extraer_unico(r"Alias:\s*([^\n<]+)", bloque)) or "-",
-            "Banda Criminal": a_mayusculas(extraer_unico(r"Banda Criminal:\s*([^\n<]+)", bloque)) or "-"
-        }))
-    for bloque, lugar in extraer_bloques_con_lugar("VICTIMA", texto):
-        victimas.append(rellenar_vacios({
-            "Archivo": archivo, "Lugar Nro": lugar,
-            "Nombres": a_mayusculas(extraer_unico(r"Nombres:\s*([^\n<]+)", bloque)),
-            "Apellidos": a_mayusculas(extraer_unico(r"Apellidos:\s*([^\n<]+)", bloque)),
-            "Edad": extraer_unico(r"Edad:\s*(\d+)", bloque),
-            "Género": a_mayusculas(extraer_unico(r"Genero:\s*([^\n<]+)", bloque)),
-            "DNI": extraer_unico(r"DNI:\s*([.\d]+)", bloque, limpiar=limpiar_dni),
-            "Nacionalidad": a_mayusculas(extraer_unico(r"Nacionalidad:\s*([^\n<]+)", bloque)),
-            "Domicilio": a_mayusculas(extraer_unico(r"Domicilio:\s*([^\n<]+)", bloque)),
-            "Cantidad de Victimas": 1
-        }))
-    for bloque, lugar in extraer_bloques_con_lugar("VEHICULO", texto):
-        vehiculos.append(rellenar_vacios({
-            "Archivo": archivo, "Lugar Nro": lugar,
-            "Marca": a_mayusculas(extraer_unico(r"Marca:\s*([^\n<]+)", bloque)),
-            "Modelo": a_mayusculas(extraer_unico(r"Modelo:\s*([^\n<]+)", bloque)),
-            "Dominio": a_mayusculas(extraer_unico(r"Dominio:\s*([^\n<]+)", bloque)),
-            "Tipo": a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque)),
-            "Detalles": a_mayusculas(extraer_unico(r"Detalles:\s*(.+?)\s*(?=<|$)", bloque))
-        }))
-
-    otros.append({
-        "Archivo": archivo,
-        "Efectivos": extraer_unico(r"Efectivos:\s*(\d+)", texto) or "-",
-        "Moviles": extraer_unico(r"Moviles:\s*(\d+)", texto) or "-",
-        "Motos": extraer_unico(r"Motos:\s*(\d+)", texto) or "-",
-        "Canes": extraer_unico(r"Canes:\s*(\d+)", texto) or "-",
-        "Morphrapid": extraer_unico(r"Morphrapid:\s*(\d+)", texto) or "-",
-        "Scanners": extraer_unico(r"Scanners:\s*(\d+)", texto) or "-",
-        "Caballos": extraer_unico(r"Caballos:\s*(\d+)", texto) or "-"
-    })
+    apartados = {}
+    for tipo, seccion, fijas in APARTADOS_TEXTO:
+        with medir(f"regex {seccion}"):
+            apartados[seccion] = [
+                rellenar_vacios({
+                    "Archivo": archivo, "Lugar Nro": lugar,
+                    **extraer_campos(esquema[seccion], bloque),
+                    **fijas
+                })
+                for bloque, lugar in extraer_bloques_con_lugar(tipo, secciones)
+            ]
+
+    with medir("regex otros"):
+        otros.append({
+            "Archivo": archivo,
+            **extraer_campos(esquema["otros"], texto)
+        })
+
+    filas = {"cabeceras": cabeceras, "lugares": lugares, **apartados, "otros": otros}
+    filas["formato"] = formato
+    filas["calidad"] = calidad_parte(texto, filas, formato)
+    return filas
+
+
+# --- ARMADO DE LAS HOJAS ---
+def armar_hojas(tablas, rellenar=True, metricas=None):
+    """
+    Arma los DataFrames de las hojas del Excel ({hoja: df}, en el orden de
+    HOJAS) a partir de las tablas de procesar_directorio o de las filas de un
+    solo parte.
+    Con rellenar, un apartado sin filas lleva "-" en cada lugar (asegurar_columnas).
+    """
+    with medir("armar DataFrames", metricas):
+        df_cab = a_dataframe(tablas["cabeceras"])
+        df_lug = a_dataframe(tablas["lugares"], columns=COLUMNAS_LUGARES)
+        df_otr = a_dataframe(tablas["otros"])
+        apartados = {}
+        for seccion, hoja, sufijo, columnas in APARTADOS:
+            df = a_dataframe(tablas[seccion], columns=columnas)
+            if rellenar:
+                df = asegurar_columnas(df, columnas, df_lug)
+            apartados[hoja] = renombrar_apartado(df, sufijo)
+
+        # --- FORZAR 'Lugar Nro' COMO STRING ---
+        for df in [df_lug, *apartados.values()]:
+            df["Lugar Nro"] = df["Lugar Nro"].astype(str)
+
+    # --- EXPANDIR Y UNIR ---
+    with medir("expandir_y_combinar", metricas):
+        unificado_apartados = expandir_y_combinar(*apartados.values())
+        unificado_apartados["Lugar Nro"] = unificado_apartados["Lugar Nro"].astype(str)
+
+    with medir("unir Unificado", metricas):
+        unificado = (
+            df_lug.merge(df_cab, on="Archivo", how="left")
+                  .merge(df_otr, on="Archivo", how="left")
+                  .merge(unificado_apartados, on=["Archivo","Lugar Nro"], how="left")
+        )
+
+        # --- CAMPO PROCEDIMIENTO ---
+        unificado["Procedimiento"] = marcar_procedimiento(unificado)
+
+    return {"Cabecera": df_cab, "Lugares": df_lug, **apartados, "Otros": df_otr, "Unificado": unificado}
+
+def _lotes(tamano, metricas):
+    """Tablas compactas de a tamano partes, a medida que se procesan (en orden de nombre de archivo)"""
+    tablas, cantidad = None, 0
+    for archivo, filas in iterar_directorio(DIRECTORIO_PDFS, extraer_parte, workers=WORKERS,
+                                            directorio_cache=DIRECTORIO_CACHE):
+        print(f"Procesando: {archivo} [{filas['formato']}]")
+        registrar_archivo(metricas, filas["metricas"])
+        if tablas is None:
+            tablas = {seccion: nueva_tabla() for seccion in SECCIONES}
+        for seccion in SECCIONES:
+            acumular_filas(tablas[seccion], filas.get(seccion, []))
+        cantidad += 1
+        if cantidad == tamano:
+            yield tablas
+            tablas, cantidad = None, 0
+    if tablas is not None:
+        yield tablas
+
+def exportar_por_lotes(metricas, tamano=1):
+    """
+    Procesa los PDF de a tamano partes y agrega las filas de cada lote a las
+    hojas del Excel (y a la base, si hay) apenas termina, sin juntar todo en
+    memoria: la memoria depende del tamaño del lote, no de la cantidad de PDF.
+    Unificado se arma por lote, que tiene todas las filas de sus partes, así
+    que da lo mismo que armado de una vez. Con tamano 1 es el modo streaming.
+    Si el proceso se corta por un error, el libro queda guardado con los
+    lotes ya escritos.
+    Un apartado que no tuvo ninguna fila se completa al final con "-" para
+    cada lugar, como asegurar_columnas. En ese caso (poco común) las filas de
+    Unificado de lugares sin ningún apartado quedan vacías en vez de "-".
+    Con INDICE_OBJETOS cada lote se indexa antes de anotarlo: una fila ve los
+    partes de corridas anteriores, de los lotes anteriores y de su mismo lote,
+    pero no los de lotes posteriores (sus filas ya están escritas). En la
+    corrida completa, en cambio, cada fila ve a todos los demás partes.
+    """
+    salida = abrir_libro(SALIDA_EXCEL, HOJAS + ["Reincidentes"] if HOJA_REINCIDENTES else HOJAS)
+    personas = nuevo_indice()
+    objetos = cargar_indice_objetos(DIRECTORIO_ESTADO) if INDICE_OBJETOS else None
+    lugares = []  # (Archivo, Lugar Nro) de todos los partes, para los apartados que queden vacíos
+    try:
+        for filas in _lotes(tamano, metricas):
+            guardar_en_base(filas, metricas)
+            if HOJA_REINCIDENTES:
+                with medir("índice de personas", metricas):
+                    indexar_partes(personas, filas)
+            hojas = armar_hojas(filas, rellenar=False, metricas=metricas)
+            if INDICE_OBJETOS:
+                actualizar_objetos(hojas, filas, metricas, objetos)
+            lugares.extend(zip(hojas["Lugares"]["Archivo"], hojas["Lugares"]["Lugar Nro"]))
+            with medir("escribir Excel", metricas):
+                for nombre, df in hojas.items():
+                    agregar_filas(salida, nombre, df)
+
+        df_lug = pd.DataFrame(lugares, columns=["Archivo", "Lugar Nro"])
+        for _, hoja, sufijo, columnas in APARTADOS:
+            if not salida["filas"][hoja]:
+                relleno = asegurar_columnas(pd.DataFrame(columns=columnas), columnas, df_lug)
+                agregar_filas(salida, hoja, renombrar_apartado(relleno, sufijo))
+        if HOJA_REINCIDENTES:
+            guardar_indice(DIRECTORIO_ESTADO, personas)
+            agregar_filas(salida, "Reincidentes", reincidentes(personas))
+        if INDICE_OBJETOS:
+            guardar_indice_objetos(DIRECTORIO_ESTADO, objetos)
+    finally:
+        with medir("escribir Excel", metricas):
+            cerrar_libro(salida)
+
+def guardar_en_base(tablas, metricas):
+    """Guarda (o reemplaza) los partes en SALIDA_SQLITE, si está configurada"""
+    if not SALIDA_SQLITE:
+        return
+    with medir("guardar SQLite", metricas):
+        conexion = abrir_base(SALIDA_SQLITE)
+        try:
+            guardar_partes(conexion, tablas)
+        finally:
+            conexion.close()
+
+def actualizar_personas(tablas, metricas, reiniciar=False):
+    """
+    Agrega los imputados y víctimas de las tablas al índice de personas
+    guardado en DIRECTORIO_ESTADO (con reiniciar, lo arma de cero) y
+    devuelve la hoja de reincidentes de todos los partes cargados.
+    """
+    with medir("índice de personas", metricas):
+        indice = nuevo_indice() if reiniciar else cargar_indice(DIRECTORIO_ESTADO)
+        indexar_partes(indice, tablas)
+        guardar_indice(DIRECTORIO_ESTADO, indice)
+        return reincidentes(indice)
+
+def actualizar_objetos(hojas, tablas, metricas, indice=None):
+    """
+    Agrega los dominios y numeraciones de las tablas al índice de objetos
+    (el guardado en DIRECTORIO_ESTADO, o indice si se pasa; en ese caso
+    no se guarda) y suma a Vehiculos y Armas, para cada fila, los otros
+    partes en que apareció y si en alguno tenía Pedido de Secuestro.
+    """
+    with medir("índice de objetos", metricas):
+        guardar = indice is None
+        if guardar:
+            indice = cargar_indice_objetos(DIRECTORIO_ESTADO)
+        indexar_objetos(indice, tablas)
+        if guardar:
+            guardar_indice_objetos(DIRECTORIO_ESTADO, indice)
+        for tipo, (seccion, columna) in TIPOS.items():
+            _, hoja, sufijo, _ = next(apartado for apartado in APARTADOS if apartado[0] == seccion)
+            df = hojas[hoja]
+            filas = antecedentes(indice, tipo, df[f"{columna} {sufijo}"], df["Archivo"])
+            df[f"Otros Partes {sufijo}"] = [otros for otros, _ in filas]
+            df[f"Pedido de Secuestro Previo {sufijo}"] = [pedido for _, pedido in filas]
+
+def exportar_desde_base(metricas):
+    """Arma las hojas del Excel (incluida Unificado) con los partes guardados en SALIDA_SQLITE"""
+    conexion = abrir_base(SALIDA_SQLITE)
+    try:
+        with medir("leer SQLite", metricas):
+            tablas = leer_tablas(conexion)
+    finally:
+        conexion.close()
+    hojas = armar_hojas(tablas, metricas=metricas)
+    if INDICE_OBJETOS:
+        actualizar_objetos(hojas, tablas, metricas)
+    if HOJA_REINCIDENTES:
+        hojas["Reincidentes"] = actualizar_personas(tablas, metricas, reiniciar=True)
+    with medir("escribir Excel", metricas):
+        guardar_excel(hojas)
+    print(f"Se exportaron {len(tablas['cabeceras'])} partes de {SALIDA_SQLITE}")
+
+def guardar_excel(hojas):
+    with pd.ExcelWriter(SALIDA_EXCEL) as writer:
+        for nombre, df in hojas.items():
+            df.to_excel(writer, sheet_name=nombre, index=False)
+
+def agregar_al_excel(tablas, metricas):
+    """
+    Agrega las filas al final de cada hoja del Excel existente (si no existe,
+    lo crea). La hoja de reincidentes se reescribe entera.
+    """
+    existe = os.path.exists(SALIDA_EXCEL)
+    hojas = armar_hojas(tablas, rellenar=not existe, metricas=metricas)
+    if INDICE_OBJETOS:
+        actualizar_objetos(hojas, tablas, metricas)
+    resumenes = {}
+    if HOJA_REINCIDENTES:
+        resumenes["Reincidentes"] = actualizar_personas(tablas, metricas)
+    with medir("escribir Excel", metricas):
+        if existe:
+            agregar_a_libro(SALIDA_EXCEL, hojas, reemplazar=resumenes)
+        else:
+            guardar_excel({**hojas, **resumenes})
+
+def registrar_cargados(manifiesto, nuevos):
+    """Anota los partes en el manifiesto y, si MOVER_A_EN_LA_BASE, mueve los PDF"""
+    registrar_partes(manifiesto, nuevos)
+    guardar_manifiesto(DIRECTORIO_ESTADO, manifiesto)
+    if MOVER_A_EN_LA_BASE:
+        mover_a_en_la_base(DIRECTORIO_PDFS, list(nuevos), DIRECTORIO_EN_LA_BASE)
+
+def exportar_incremental(metricas):
+    """
+    Procesa solo los partes que no figuran en el manifiesto (Parte Operativo,
+    hash del PDF y fecha de carga) ni en EN LA BASE, y agrega sus filas al
+    final de cada hoja del Excel existente (si no existe, lo crea). Después
+    los anota en el manifiesto y, si MOVER_A_EN_LA_BASE, mueve los PDF.
+    """
+    manifiesto = cargar_manifiesto(DIRECTORIO_ESTADO)
+    nuevos = partes_nuevos(DIRECTORIO_PDFS, manifiesto, DIRECTORIO_EN_LA_BASE)
+    if not nuevos:
+        print("No hay partes nuevos para procesar.")
+        return
+
+    tablas = procesar_directorio(DIRECTORIO_PDFS, extraer_parte, workers=WORKERS,
+                                  directorio_cache=DIRECTORIO_CACHE, archivos=list(nuevos), metricas=metricas)
+    guardar_en_base(tablas, metricas)
+    agregar_al_excel(tablas, metricas)
+    registrar_cargados(manifiesto, nuevos)
+    print(f"Se agregaron {len(nuevos)} partes nuevos.")
+
+def vigilar_directorio(metricas):
+    """
+    Modo vigilancia: como el incremental, pero queda esperando. Cada PDF que
+    llega a la carpeta se procesa apenas termina de copiarse (ver
+    modulo_vigilancia; los archivos de bloqueo "~$..." se ignoran) y sus filas
+    se agregan al Excel. Los partes que ya estaban se cargan en la primera
+    vuelta. Si el Excel está abierto (no se puede escribir), las filas quedan
+    pendientes y se reintenta en cada vuelta. Un PDF que falla se informa y
+    no se reintenta hasta que cambie.
+    """
+    manifiesto = cargar_manifiesto(DIRECTORIO_ESTADO)
+    pendientes = {}  # {archivo: hash} procesados pero todavía no escritos en el Excel
+    tablas = {seccion: nueva_tabla() for seccion in SECCIONES}
+    print(f"Vigilando {DIRECTORIO_PDFS} (Ctrl+C para terminar)")
+    try:
+        for listos in esperar_pdfs(DIRECTORIO_PDFS):
+            nuevos = partes_nuevos(DIRECTORIO_PDFS, manifiesto, DIRECTORIO_EN_LA_BASE, archivos=listos)
+            for archivo, sha in nuevos.items():
+                if archivo in pendientes:
+                    continue
+                try:
+                    filas = procesar_directorio(DIRECTORIO_PDFS, extraer_parte, directorio_cache=DIRECTORIO_CACHE,
+                                                archivos=[archivo], metricas=metricas)
+                except Exception as e:
+                    print(f"Error al procesar {archivo}: {e}")
+                    continue
+                guardar_en_base(filas, metricas)
+                for seccion in SECCIONES:
+                    acumular_filas(tablas[seccion], iterar_filas(filas[seccion]))
+                pendientes[archivo] = sha
+            if not pendientes:
+                continue
+            if libro_bloqueado(SALIDA_EXCEL):
+                if nuevos:
+                    print(f"Aviso: {SALIDA_EXCEL} está abierto; las filas se agregan cuando se cierre")
+                continue
+
+            agregar_al_excel(tablas, metricas)
+            registrar_cargados(manifiesto, pendientes)
+            print(f"Se agregaron {len(pendientes)} partes nuevos.")
+            pendientes = {}
+            tablas = {seccion: nueva_tabla() for seccion in SECCIONES}
+    except KeyboardInterrupt:
+        print("Vigilancia terminada.")
+
+
+if __name__ == "__main__":
+    metricas = abrir_metricas()
+    if EXCEL_DESDE_SQLITE:
+        exportar_desde_base(metricas)
+    elif SALIDA_STREAMING or TAMANO_LOTE:
+        exportar_por_lotes(metricas, 1 if SALIDA_STREAMING else TAMANO_LOTE)
+    elif MODO_VIGILANCIA:
+        vigilar_directorio(metricas)
+    elif MODO_INCREMENTAL:
+        exportar_incremental(metricas)
+    else:
+        # --- PROCESAR PDFs ---
+        tablas = procesar_directorio(DIRECTORIO_PDFS, extraer_parte, workers=WORKERS,
+                                      directorio_cache=DIRECTORIO_CACHE, metricas=metricas)
+
+        # --- GUARDAR ---
+        guardar_en_base(tablas, metricas)
+        hojas = armar_hojas(tablas, metricas=metricas)
+        if INDICE_OBJETOS:
+            actualizar_objetos(hojas, tablas, metricas)
+        if HOJA_REINCIDENTES:
+            hojas["Reincidentes"] = actualizar_personas(tablas, metricas, reiniciar=True)
+        with medir("escribir Excel", metricas):
+            guardar_excel(hojas)
+        reiniciar_manifiesto(DIRECTORIO_ESTADO, {registro["archivo"]: registro["hash"]
+                                                 for registro in metricas["archivos"]})
+        if SALIDA_COLUMNAR:
+            with medir("guardar columnar", metricas):
+                guardar_columnar(hojas, SALIDA_COLUMNAR, FORMATO_COLUMNAR)
+            print(f"Hojas en formato {FORMATO_COLUMNAR} guardadas en {SALIDA_COLUMNAR}")
+
+    print(f"Procesamiento completo. Archivo guardado en {SALIDA_EXCEL}")
 
-# --- CREAR DATAFRAMES Y RENOMBRAR ---
-df_cab = pd.DataFrame(cabeceras)
-df_lug = pd.DataFrame(lugares)
-df_arm = renombrar_apartado(asegurar_columnas(pd.DataFrame(armas), ["Archivo","Lugar Nro","Tipo","Detalles","Marca","Modelo","Calibre",
-                                                "Numeración","Pedido de Secuestro","Observaciones","Cantidad de Armamento"], df_lug), "Arma")
-df_dro = renombrar_apartado(asegurar_columnas(pd.DataFrame(drogas), ["Archivo","Lugar Nro","Tipo","Cantidad","Medición","Observaciones"], df_lug), "Droga")
-df_ele = renombrar_apartado(asegurar_columnas(pd.DataFrame(elementos), ["Archivo","Lugar Nro","Incautación","Tipo","Subtipo","Cantidad",
-                                                    "Medición","Aforo","Observaciones"], df_lug), "Elemento")
-df_imp = renombrar_apartado(asegurar_columnas(pd.DataFrame(imputados), ["Archivo","Lugar Nro","Nombres","Apellidos","Edad","Género","DNI",
-                                                    "Nacionalidad","Domicilio","Situación Procesal","Posee Captura",
-                                                    "Motivo Captura","Alias","Banda Criminal"], df_lug), "Imputado")
-df_vic = renombrar_apartado(asegurar_columnas(pd.DataFrame(victimas), ["Archivo","Lugar Nro","Nombres","Apellidos","Edad","Género","DNI",
-                                                    "Nacionalidad","Domicilio","Cantidad de Victimas"], df_lug), "Victima")
-df_veh = renombrar_apartado(asegurar_columnas(pd.DataFrame(vehiculos), ["Archivo","Lugar Nro","Marca","Modelo","Dominio","Tipo","Detalles"], df_lug), "Vehiculo")
-df_otr = pd.DataFrame(otros)
-
-# --- FORZAR 'Lugar Nro' COMO STRING ---
-for df in [df_lug, df_arm, df_dro, df_ele, df_imp, df_vic, df_veh]:
-    if "Lugar Nro" in df.columns:
-        df["Lugar Nro"] = df["Lugar Nro"].astype(str)
-
-# --- EXPANDIR Y UNIR ---
-unificado_apartados = expandir_y_combinar(df_arm, df_dro, df_ele, df_imp, df_vic, df_veh)
-if "Lugar Nro" in unificado_apartados.columns:
-    unificado_apartados["Lugar Nro"] = unificado_apartados["Lugar Nro"].astype(str)
-
-unificado = (
-    df_lug.merge(df_cab, on="Archivo", how="left")
-          .merge(df_otr, on="Archivo", how="left")
-          .merge(unificado_apartados, on=["Archivo","Lugar Nro"], how="left")
-)
-
-# --- CAMPO PROCEDIMIENTO ---
-unificado["Procedimiento"] = "-"
-vistos = set()
-for idx, row in unificado.iterrows():
-    clave = (row["Archivo"], row["Lugar Nro"])
-    if clave not in vistos:
-        unificado.at[idx, "Procedimiento"] = 1
-        vistos.add(clave)
-
-# --- GUARDAR ---
-with pd.ExcelWriter(SALIDA_EXCEL) as writer:
-    df_cab.to_excel(writer, sheet_name="Cabecera", index=False)
-    df_lug.to_excel(writer, sheet_name="Lugares", index=False)
-    df_arm.to_excel(writer, sheet_name="Armas", index=False)
-    df_dro.to_excel(writer, sheet_name="Drogas", index=False)
-    df_ele.to_excel(writer, sheet_name="Elementos", index=False)
-    df_imp.to_excel(writer, sheet_name="Imputados", index=False)
-    df_vic.to_excel(writer, sheet_name="Victimas", index=False)
-    df_veh.to_excel(writer, sheet_name="Vehiculos", index=False)
-    df_otr.to_excel(writer, sheet_name="Otros", index=False)
-    unificado.to_excel(writer, sheet_name="Unificado", index=False)
-
-print(f"Procesamiento completo. Archivo guardado en {SALIDA_EXCEL}")
+    # --- MÉTRICAS ---
+    if REPORTE_METRICAS:
+        reporte = cerrar_metricas(metricas)
+        print(resumen_metricas(reporte))
+        guardar_metricas(reporte, REPORTE_METRICAS)
+        print(f"Métricas guardadas en {REPORTE_METRICAS}")
@@ -0,0 +1,188 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import warnings
+import pandas as pd
+from modulo_cache import extraer_paginas
+from modulo_filas import a_dataframe, acumular_filas, nueva_tabla
+from modulo_ingesta import SECCIONES, listar_pdfs
+from modulo_pdf import MOTOR_PDF
+import Unificado
+import no_lee
+import procesar_partes
+import modulo_causa
+
+warnings.filterwarnings("ignore", category=FutureWarning)
+
+# --- CONFIGURACIÓN ---
+DIRECTORIO_BASE = os.path.dirname(os.path.abspath(__file__))
+CARPETAS_CORPUS = [
+    os.path.join(DIRECTORIO_BASE, "PARTES"),
+    os.path.join(DIRECTORIO_BASE, "PARTES", "EN LA BASE"),
+    os.path.join(DIRECTORIO_BASE, "PARTES", "NO LEE"),
+]
+CANTIDAD_DOCUMENTOS = 1000  # tamaño del corpus replicado (los PDF de muestra se repiten hasta llegar)
+REPETICIONES = 3  # de cada etapa se toma el mejor tiempo
+UMBRAL_REGRESION = 0.20  # falla si una etapa tarda más de un 20% por documento que en la línea de base
+LINEA_BASE = os.path.join(DIRECTORIO_BASE, ".cache", "benchmark_base.json")
+ACTUALIZAR_LINEA_BASE = False  # guardar esta corrida como nueva línea de base (si no existe se guarda siempre)
+
+
+# --- CORPUS ---
+def cargar_corpus():
+    """[(archivo, ruta)] de los PDF de muestra de las carpetas del corpus"""
+    corpus = []
+    for carpeta in CARPETAS_CORPUS:
+        if os.path.isdir(carpeta):
+            for archivo in listar_pdfs(carpeta):
+                corpus.append((archivo, os.path.join(carpeta, archivo)))
+    return corpus
+
+def replicar(corpus, cantidad):
+    """
+    Repite los documentos hasta tener cantidad. Las copias llevan otro nombre
+    de archivo ("370-PO-865-2025_2.pdf"), así Archivo sigue siendo único.
+    """
+    documentos = []
+    for i in range(cantidad):
+        archivo, texto, texto_lineas = corpus[i % len(corpus)]
+        vuelta = i // len(corpus)
+        if vuelta:
+            archivo = f"{os.path.splitext(archivo)[0]}_{vuelta + 1}.pdf"
+        documentos.append((archivo, texto, texto_lineas))
+    return documentos
+
+
+# --- ETAPAS DE CADA SCRIPT ---
+def _tablas(extractor, documentos):
+    """Filas de todos los documentos, como las acumula procesar_directorio"""
+    tablas = {seccion: nueva_tabla() for seccion in SECCIONES}
+    for archivo, texto, _ in documentos:
+        filas = extractor(archivo, texto)
+        for seccion in SECCIONES:
+            acumular_filas(tablas[seccion], filas.get(seccion, []))
+    return tablas
+
+def _hojas_por_seccion(tablas):
+    """procesar_partes.py: una hoja por apartado, sin unificar"""
+    hojas = ["Cabecera", "Lugares", "Armas", "Drogas", "Elementos", "Imputados", "Victimas", "Vehiculos", "Otros"]
+    return {hoja: a_dataframe(tablas[seccion]) for hoja, seccion in zip(hojas, SECCIONES)}
+
+def _registros_causa(documentos):
+    """modulo_causa.py: un registro por PDF con texto (el texto lleva un salto por página)"""
+    registros = []
+    for archivo, _, texto in documentos:
+        if not texto.strip():
+            continue
+        datos_pdf = modulo_causa.extraer_datos(texto)
+        datos_pdf["ARCHIVO"] = archivo
+        registros.append(datos_pdf)
+    return registros
+
+def _escribir_excel(hojas, ruta):
+    with pd.ExcelWriter(ruta) as writer:
+        for nombre, df in hojas.items():
+            df.to_excel(writer, sheet_name=nombre, index=False)
+
+# script: (campos, unificación, exportación)
+SCRIPTS = {
+    "Unificado.py": (lambda docs: _tablas(Unificado.extraer_parte, docs), Unificado.armar_hojas, _escribir_excel),
+    "no_lee.py": (lambda docs: _tablas(no_lee.extraer_parte, docs), no_lee.armar_hojas, _escribir_excel),
+    "procesar_partes.py": (lambda docs: _tablas(procesar_partes.extraer_parte, docs), _hojas_por_seccion,
+                           _escribir_excel),
+    "modulo_causa.py": (_registros_causa, lambda registros: {"Sheet1": pd.DataFrame(registros)}, _escribir_excel),
+}
+
+
+# --- MEDICIÓN ---
+def cronometrar(funcion, *args):
+    """(mejor tiempo de REPETICIONES corridas, resultado de la última)"""
+    mejor = None
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        resultado = funcion(*args)
+        segundos = time.perf_counter() - inicio
+        mejor = segundos if mejor is None else min(mejor, segundos)
+    return mejor, resultado
+
+def medir_texto(pdfs):
+    """
+    Extracción de texto con el motor de PDF configurado (la misma para los cuatro scripts). Las
+    copias del corpus replicado son los mismos bytes, así que se mide sobre
+    los PDF de muestra y se proyecta por documento.
+    """
+    def extraer_todo():
+        return [(archivo, extraer_paginas(ruta)) for archivo, ruta in pdfs]
+    segundos, paginas = cronometrar(extraer_todo)
+    corpus = [(archivo, "".join(pags), "".join(p + "\n" for p in pags)) for archivo, pags in paginas]
+    return segundos / len(pdfs), corpus
+
+def correr_benchmark():
+    pdfs = cargar_corpus()
+    if not pdfs:
+        sys.exit(f"No hay PDF de muestra en {CARPETAS_CORPUS}")
+    print(f"Corpus: {len(pdfs)} PDF de muestra, replicados a {CANTIDAD_DOCUMENTOS} documentos")
+
+    por_documento, corpus = medir_texto(pdfs)
+    resultados = {f"texto ({MOTOR_PDF})": {"texto": por_documento}}
+    documentos = replicar(corpus, CANTIDAD_DOCUMENTOS)
+
+    with tempfile.TemporaryDirectory() as temporal:
+        for script, (campos, unificar, exportar) in SCRIPTS.items():
+            print(f"Midiendo {script}...")
+            t_campos, filas = cronometrar(campos, documentos)
+            t_unificar, hojas = cronometrar(unificar, filas)
+            ruta = os.path.join(temporal, f"{os.path.splitext(script)[0]}.xlsx")
+            t_exportar, _ = cronometrar(exportar, hojas, ruta)
+            resultados[script] = {
+                "campos": t_campos / len(documentos),
+                "unificacion": t_unificar / len(documentos),
+                "exportacion": t_exportar / len(documentos),
+            }
+    return resultados
+
+
+# --- REGRESIONES ---
+def comparar(resultados, base):
+    """Lista de (script, etapa, ms actual, ms base) de las etapas que superan el umbral"""
+    regresiones = []
+    for script, etapas in resultados.items():
+        for etapa, segundos in etapas.items():
+            anterior = base.get(script, {}).get(etapa)
+            if anterior and segundos > anterior * (1 + UMBRAL_REGRESION):
+                regresiones.append((script, etapa, segundos * 1e3, anterior * 1e3))
+    return regresiones
+
+def mostrar(resultados, base):
+    print(f"\n{'Script':<22}{'Etapa':<14}{'ms/doc':>10}{'Base':>10}{'Total (s)':>11}")
+    for script, etapas in resultados.items():
+        for etapa, segundos in etapas.items():
+            anterior = base.get(script, {}).get(etapa)
+            texto_base = f"{anterior * 1e3:.3f}" if anterior else "-"
+            print(f"{script:<22}{etapa:<14}{segundos * 1e3:>10.3f}{texto_base:>10}"
+                  f"{segundos * CANTIDAD_DOCUMENTOS:>11.2f}")
+
+
+if __name__ == "__main__":
+    resultados = correr_benchmark()
+    base = {}
+    if os.path.exists(LINEA_BASE):
+        with open(LINEA_BASE, encoding="utf-8") as f:
+            base = json.load(f)["resultados"]
+    mostrar(resultados, base)
+
+    if ACTUALIZAR_LINEA_BASE or not base:
+        os.makedirs(os.path.dirname(LINEA_BASE), exist_ok=True)
+        with open(LINEA_BASE, "w", encoding="utf-8") as f:
+            json.dump({"documentos": CANTIDAD_DOCUMENTOS, "resultados": resultados}, f, indent=2)
+        print(f"\nLínea de base guardada en {LINEA_BASE}")
+    else:
+        regresiones = comparar(resultados, base)
+        for script, etapa, actual, anterior in regresiones:
+            print(f"REGRESIÓN: {script} / {etapa}: {actual:.3f} ms/doc (base {anterior:.3f}, "
+                  f"umbral {UMBRAL_REGRESION:.0%})")
+        if regresiones:
+            sys.exit(1)
+        print(f"\nSin regresiones (umbral {UMBRAL_REGRESION:.0%})")
@@ -0,0 +1,191 @@
+import glob
+import hashlib
+import json
+import os
+import sys
+import types
+from functools import lru_cache
+from modulo_metricas import anotar, medir
+from modulo_pdf import paginas_pdf, version_motor
+
+# --- CONFIGURACIÓN ---
+TAMANO_BLOQUE = 1 << 20  # bytes leídos por vez al calcular el hash
+# Módulos del proyecto (junto a este archivo) que entran en la firma de los
+# extractores: los registros se rehacen si cambia cualquiera de ellos
+PATRON_MODULOS = "modulo_*.py"
+
+
+# --- FUNCIONES ---
+def hash_bytes(datos):
+    """SHA-256 de un contenido ya leído (el mismo que hash_archivo del archivo)"""
+    with medir("hash PDF"):
+        return hashlib.sha256(datos).hexdigest()
+
+def hash_archivo(ruta):
+    """SHA-256 del contenido del archivo"""
+    h = hashlib.sha256()
+    with medir("hash PDF"), open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(TAMANO_BLOQUE), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+def clave_pdf(ruta_pdf, datos=None):
+    """
+    Clave del cache: hash del PDF + motor de PDF y su versión (otro motor u
+    otra versión puede extraer otro texto). Con datos (el PDF ya leído) no se
+    vuelve a leer el archivo.
+    """
+    sha = hash_bytes(datos) if datos is not None else hash_archivo(ruta_pdf)
+    anotar("hash", sha)
+    return f"{sha}-{version_motor()}"
+
+def _constante(valor):
+    """repr estable de una constante del código (los frozenset cambian de orden entre procesos)"""
+    if isinstance(valor, types.CodeType):
+        return _huella_codigo(valor)
+    if isinstance(valor, frozenset):
+        return "frozenset(%s)" % sorted(_constante(v) for v in valor)
+    if isinstance(valor, tuple):
+        return "(%s)" % ",".join(_constante(v) for v in valor)
+    return repr(valor)
+
+def _huella_codigo(codigo):
+    """
+    Bytecode, nombres y constantes (también las de funciones anidadas) del
+    code object. No se usa marshal: sus bytes dependen de cuántas referencias
+    tiene cada objeto en ese momento y cambian entre el proceso principal y
+    los del pool.
+    """
+    return "|".join([codigo.co_code.hex(), ",".join(codigo.co_names),
+                     ",".join(codigo.co_varnames), _constante(codigo.co_consts)])
+
+@lru_cache(maxsize=None)
+def hash_codigo(ruta_script):
+    """
+    Hash corto del archivo del script y de todos los modulo_*.py del proyecto
+    (su contenido, no el de las funciones en memoria): cambia al tocar
+    cualquier helper, regex o esquema que use el extractor. Se calcula una
+    vez por proceso.
+    """
+    carpeta = os.path.dirname(os.path.abspath(__file__))
+    rutas = set(glob.glob(os.path.join(carpeta, PATRON_MODULOS))) | {os.path.abspath(ruta_script)}
+    h = hashlib.sha1()
+    for ruta in sorted(rutas, key=os.path.basename):
+        h.update(os.path.basename(ruta).encode() + b"\0")
+        with open(ruta, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:12]
+
+def firma_extractor(extractor):
+    """
+    Identifica al extractor, al código del script y de los módulos del
+    proyecto (hash_codigo) y a las tablas que usa (VERSION_DATOS de su módulo,
+    si la define), para invalidar los registros si cambia algo. Si el módulo
+    no tiene archivo (por ejemplo en una consola) se usa el bytecode del
+    extractor solo.
+    """
+    modulo = sys.modules.get(extractor.__module__)
+    ruta = getattr(modulo, "__file__", None)
+    if ruta:
+        codigo = hash_codigo(ruta)
+    else:
+        codigo = hashlib.sha1(_huella_codigo(extractor.__code__).encode()).hexdigest()[:12]
+    datos = getattr(modulo, "VERSION_DATOS", None)
+    firma = f"{extractor.__module__}.{extractor.__qualname__}:{codigo}"
+    return f"{firma}+{datos}" if datos else firma
+
+def cargar_entrada(directorio_cache, clave):
+    """Devuelve la entrada guardada o None si no existe o está corrupta"""
+    ruta = os.path.join(directorio_cache, f"{clave}.json")
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def guardar_entrada(directorio_cache, clave, entrada):
+    """Escribe la entrada de forma atómica (archivo temporal + reemplazo)"""
+    os.makedirs(directorio_cache, exist_ok=True)
+    ruta = os.path.join(directorio_cache, f"{clave}.json")
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(entrada, f, ensure_ascii=False)
+    os.replace(temporal, ruta)
+
+def extraer_paginas(ruta_pdf, datos=None):
+    """Texto de cada página del PDF (o de datos, si ya se leyó), sin cache"""
+    paginas = list(paginas_pdf(ruta_pdf if datos is None else datos))
+    anotar("paginas", len(paginas))
+    return paginas
+
+def _entrada_pdf(ruta_pdf, directorio_cache, datos=None):
+    clave = clave_pdf(ruta_pdf, datos)
+    with medir("leer cache"):
+        entrada = cargar_entrada(directorio_cache, clave)
+    if entrada is None:
+        anotar("cache", "nuevo")
+        entrada = {"paginas": extraer_paginas(ruta_pdf, datos), "registros": {}}
+        with medir("guardar cache"):
+            guardar_entrada(directorio_cache, clave, entrada)
+    else:
+        anotar("cache", "texto")
+    anotar("paginas", len(entrada["paginas"]))
+    return clave, entrada
+
+def leer_paginas(ruta_pdf, directorio_cache=None, datos=None):
+    """
+    Texto de cada página del PDF. Con directorio_cache solo se lee el PDF
+    si su contenido no se procesó antes. Con datos se usa ese contenido ya
+    leído en lugar de abrir el archivo.
+    """
+    if not directorio_cache:
+        return extraer_paginas(ruta_pdf, datos)
+    return _entrada_pdf(ruta_pdf, directorio_cache, datos)[1]["paginas"]
+
+def iterar_paginas(ruta_pdf, directorio_cache=None, previas=()):
+    """
+    Texto de cada página del PDF, de a una. Si el PDF ya está en el cache las
+    páginas salen de ahí; si no, se extraen recién cuando se piden, así quien
+    corta antes de terminar no paga las demás. Con previas (las primeras
+    páginas, ya extraídas en una pasada que cortó antes) se sigue desde la
+    siguiente sin volver a extraerlas. Solo si se llegó a la última página
+    se guardan todas en el cache.
+    """
+    desde = len(previas)
+    if not directorio_cache:
+        yield from paginas_pdf(ruta_pdf, desde=desde)
+        return
+    clave = clave_pdf(ruta_pdf)
+    entrada = cargar_entrada(directorio_cache, clave)
+    if entrada is not None:
+        yield from entrada["paginas"][desde:]
+        return
+    paginas = list(previas)
+    for texto in paginas_pdf(ruta_pdf, desde=desde):
+        paginas.append(texto)
+        yield texto
+    guardar_entrada(directorio_cache, clave, {"paginas": paginas, "registros": {}})
+
+def leer_registros(ruta_pdf, archivo, extractor, directorio_cache, datos=None):
+    """
+    Devuelve extractor(archivo, texto) con el texto de las páginas unido sin
+    separador. Los registros quedan guardados junto al texto, por extractor y
+    nombre de archivo, y se reutilizan mientras no cambien el PDF, el script
+    del extractor ni los modulo_*.py (ver firma_extractor).
+    Con datos se usa ese contenido ya leído en lugar de abrir el archivo.
+    """
+    clave, entrada = _entrada_pdf(ruta_pdf, directorio_cache, datos)
+    firma = f"{firma_extractor(extractor)}|{archivo}"
+    registros = entrada["registros"].get(firma)
+    if registros is None:
+        registros = extractor(archivo, "".join(entrada["paginas"]))
+        # Descartar lo que dejó una versión anterior del mismo extractor
+        nombre = firma.split(":")[0]
+        entrada["registros"] = {k: v for k, v in entrada["registros"].items()
+                                if not (k.startswith(f"{nombre}:") and k.endswith(f"|{archivo}"))}
+        entrada["registros"][firma] = registros
+        with medir("guardar cache"):
+            guardar_entrada(directorio_cache, clave, entrada)
+    else:
+        anotar("cache", "registros")
+    return registros
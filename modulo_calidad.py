@@ -0,0 +1,52 @@
+import re
+from modulo_formato import SIN_TEXTO
+
+# --- CONFIGURACIÓN ---
+VACIOS = ("", "-")
+# Columnas de la cabecera que no salen del texto (se arman con el nombre del archivo)
+COLUMNAS_SIN_PUNTAJE = {"Archivo", "Parte Operativo", "Dependencia"}
+# Campos que muchas veces faltan en un parte correcto: se informan pero no bajan el puntaje
+CAMPOS_OPCIONALES = {"Delito 2", "Delito 3", "Detalle de Delito"}
+PENALIDAD_LUGARES = 0.25  # se resta al puntaje si la cantidad de "LUGAR n" no coincide con la de Calle
+PATRON_LUGAR = re.compile(r"LUGAR\s+(\d+)", re.IGNORECASE)
+
+
+# --- FUNCIONES ---
+def _vacio(valor):
+    return valor is None or str(valor).strip() in VACIOS
+
+def calidad_parte(texto, filas, formato=None):
+    """
+    Qué tan completo salió un parte, para revisar los malos sin abrir el Excel:
+    {"puntaje" (0 a 1), "cabecera_campos", "cabecera_vacios" (campos vacíos o
+    "-"), "secciones" ({sección: filas}), "apartados_encontrados",
+    "lugares_texto" (LUGAR n distintos), "lugares_calle" (filas de lugares),
+    "lugares_coinciden"}. El puntaje es la proporción de campos obligatorios
+    de la cabecera con dato, menos PENALIDAD_LUGARES si no coinciden los
+    lugares; un PDF sin texto tiene 0.
+    """
+    cabecera = filas["cabeceras"][0] if filas.get("cabeceras") else {}
+    campos = [campo for campo in cabecera if campo not in COLUMNAS_SIN_PUNTAJE]
+    vacios = [campo for campo in campos if _vacio(cabecera[campo])]
+    obligatorios = [campo for campo in campos if campo not in CAMPOS_OPCIONALES]
+    faltan = [campo for campo in vacios if campo not in CAMPOS_OPCIONALES]
+    secciones = {seccion: len(valor) for seccion, valor in filas.items()
+                 if isinstance(valor, list) and seccion not in ("cabeceras", "otros")}
+    lugares_texto = len(set(PATRON_LUGAR.findall(texto)))
+    lugares_calle = len(filas.get("lugares", []))
+
+    puntaje = 1 - len(faltan) / len(obligatorios) if obligatorios else 0.0
+    if lugares_texto != lugares_calle:
+        puntaje -= PENALIDAD_LUGARES
+    if formato == SIN_TEXTO:
+        puntaje = 0.0
+    return {
+        "puntaje": round(max(0.0, puntaje), 3),
+        "cabecera_campos": len(campos),
+        "cabecera_vacios": vacios,
+        "secciones": secciones,
+        "apartados_encontrados": sum(1 for seccion, cantidad in secciones.items() if seccion != "lugares" and cantidad),
+        "lugares_texto": lugares_texto,
+        "lugares_calle": lugares_calle,
+        "lugares_coinciden": lugares_texto == lugares_calle,
+    }
@@ -1,23 +1,25 @@
 import os
 import re
 import pandas as pd
-from PyPDF2 import PdfReader
+from modulo_documentos import abrir_almacen, cerrar_almacen, texto_documento
 
 # --- RUTAS ---
 DIR_PARTES = r"C:\Users\ecastro\Desktop\PARTES"
 RESULTADO = r"C:\Users\ecastro\Desktop\prueba_causa_raw.xlsx"
+DIRECTORIO_CACHE = os.path.join(DIR_PARTES, ".cache")  # texto ya extraído de cada PDF (None = sin cache)
+
+# Textos de los PDF compartidos entre modulo_causa y modulo_direcciones:
+# cada PDF se lee una sola vez por corrida
+ALMACEN = abrir_almacen(DIRECTORIO_CACHE)
+
+# extraer_datos solo usa la cabecera y los recursos: del PDF se lee hasta la
+# página donde empieza "LUGAR 1" (normalmente la primera)
+BLOQUES = ("cabecera", "recursos")
 
 # --- FUNCIONES ---
 def leer_pdf(path_pdf):
-    """Extrae texto completo de un PDF"""
-    try:
-        reader = PdfReader(path_pdf)
-        texto = ""
-        for page in reader.pages:
-            texto += (page.extract_text() or "") + "\n"
-        return texto
-    except:
-        return ""
+    """Extrae el texto del PDF hasta completar la cabecera y los recursos"""
+    return texto_documento(ALMACEN, path_pdf, bloques=BLOQUES)
 
 def extraer_datos(texto):
     """
@@ -110,22 +112,25 @@ def extraer_datos(texto):
 
     return datos
 
-# --- PROCESAR TODOS LOS PDFs ---
-registros = []
+if __name__ == "__main__":
+    # --- PROCESAR TODOS LOS PDFs ---
+    registros = []
+
+    for archivo in os.listdir(DIR_PARTES):
+        if not archivo.lower().endswith(".pdf"):
+            continue
 
-for archivo in os.listdir(DIR_PARTES):
-    if not archivo.lower().endswith(".pdf"):
-        continue
+        texto = leer_pdf(os.path.join(DIR_PARTES, archivo))
+        if not texto.strip():
+            continue
 
-    texto = leer_pdf(os.path.join(DIR_PARTES, archivo))
-    if not texto.strip():
-        continue
+        datos_pdf = extraer_datos(texto)
+        datos_pdf["ARCHIVO"] = archivo  # Guardamos el nombre del archivo para referencia
+        registros.append(datos_pdf)
 
-    datos_pdf = extraer_datos(texto)
-    datos_pdf["ARCHIVO"] = archivo  # Guardamos el nombre del archivo para referencia
-    registros.append(datos_pdf)
+    cerrar_almacen(ALMACEN, podar=True)
 
-# --- EXPORTAR RESULTADOS ---
-df = pd.DataFrame(registros)
-df.to_excel(RESULTADO, index=False)
-print(f"Procesados {len(df)} archivos. Resultado en: {RESULTADO}")
+    # --- EXPORTAR RESULTADOS ---
+    df = pd.DataFrame(registros)
+    df.to_excel(RESULTADO, index=False)
+    print(f"Procesados {len(df)} archivos. Resultado en: {RESULTADO}")
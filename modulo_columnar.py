@@ -0,0 +1,83 @@
+import os
+import pandas as pd
+
+# --- CONFIGURACIÓN ---
+EXTENSIONES = {"parquet": ".parquet", "feather": ".feather"}
+VACIOS = ["-", ""]  # valores que en las hojas significan "sin dato"
+
+# Columnas que no son texto. En Unificado las de los apartados llevan sufijo
+# ("Edad Imputado"), por eso se comparan por el comienzo del nombre.
+# Códigos, DNI y numeraciones quedan como texto: son identificadores.
+TIPOS_COLUMNAS = {
+    "Lugar Nro": "entero",
+    "Edad": "entero",
+    "Cantidad de Armamento": "entero",
+    "Cantidad de Victimas": "entero",
+    "Efectivos": "entero",
+    "Moviles": "entero",
+    "Motos": "entero",
+    "Canes": "entero",
+    "Morphrapid": "entero",
+    "Scanners": "entero",
+    "Caballos": "entero",
+    "Procedimiento": "entero",
+    "Fecha": "fecha",
+}
+PATRONES_TIPOS = {"entero": r"-?\d+", "fecha": r"\d{4}-\d{2}-\d{2}"}
+
+
+# --- FUNCIONES ---
+def tipo_columna(nombre):
+    """Tipo declarado de la columna ("entero", "fecha") o None si es texto"""
+    for base, tipo in TIPOS_COLUMNAS.items():
+        if nombre == base or nombre.startswith(base + " "):
+            return tipo
+    return None
+
+def tipar_columna(nombre, serie):
+    """
+    Convierte una columna de las hojas a su tipo real: Int64 o datetime según
+    TIPOS_COLUMNAS ("-" y "" pasan a <NA>) y string el resto. Si algún dato no
+    tiene el formato esperado la columna queda como texto, sin perder nada.
+    """
+    tipo = tipo_columna(nombre)
+    if serie.dtype != object:
+        if tipo == "entero" and pd.api.types.is_integer_dtype(serie):
+            return serie.astype("Int64")
+        return serie if tipo else serie.astype("string")
+    vacios = serie.isna() | serie.isin(VACIOS)
+    if tipo and serie[~vacios].astype(str).str.fullmatch(PATRONES_TIPOS[tipo]).all():
+        datos = serie.mask(vacios)
+        if tipo == "fecha":
+            return pd.to_datetime(datos, format="%Y-%m-%d")
+        return pd.to_numeric(datos).astype("Int64")
+    return serie.astype("string")
+
+def tipar_columnas(df):
+    """Copia de df con cada columna convertida por tipar_columna"""
+    return pd.DataFrame({col: tipar_columna(col, df[col]) for col in df.columns}).reset_index(drop=True)
+
+def ruta_columnar(directorio, hoja, formato="parquet"):
+    """Archivo de una hoja dentro del directorio: "Victimas" -> victimas.parquet"""
+    return os.path.join(directorio, hoja.lower() + EXTENSIONES[formato])
+
+def guardar_columnar(hojas, directorio, formato="parquet"):
+    """
+    Guarda cada hoja ({nombre: df}) como un archivo Parquet o Feather con tipos
+    reales. Necesita pyarrow.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    for hoja, df in hojas.items():
+        tipado = tipar_columnas(df)
+        ruta = ruta_columnar(directorio, hoja, formato)
+        if formato == "feather":
+            tipado.to_feather(ruta)
+        else:
+            tipado.to_parquet(ruta, index=False)
+
+def leer_columnar(directorio, hoja, columnas=None, formato="parquet"):
+    """Lee una hoja guardada con guardar_columnar, solo con las columnas pedidas"""
+    ruta = ruta_columnar(directorio, hoja, formato)
+    if formato == "feather":
+        return pd.read_feather(ruta, columns=columnas)
+    return pd.read_parquet(ruta, columns=columnas)
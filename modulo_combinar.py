@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+# --- CONFIGURACIÓN ---
+RELLENO = "-"  # valor de las celdas que un apartado no tiene para esa fila
+
+
+# --- FUNCIONES ---
+def _valores_clave(dfs, clave):
+    """Columna clave de todos los dfs, una debajo de otra"""
+    partes = [df[clave] for df in dfs if len(df)]
+    return pd.concat(partes, ignore_index=True) if partes else pd.Series(dtype=object)
+
+def _codigos_claves(dfs, claves):
+    """
+    Numera cada combinación de claves en orden de primera aparición (recorriendo
+    los DataFrames en orden) y devuelve (códigos por fila, posición de la
+    primera aparición de cada código) sobre las filas de todos los dfs unidas.
+    """
+    codigos = np.zeros(sum(len(df) for df in dfs), dtype=np.int64)
+    for clave in claves:
+        codigos_clave, unicos = pd.factorize(_valores_clave(dfs, clave))
+        codigos = codigos * max(len(unicos), 1) + codigos_clave
+    codigos, _ = pd.factorize(codigos)
+    _, primeras = np.unique(codigos, return_index=True)
+    return codigos, primeras
+
+def expandir_y_combinar(*dfs, claves=("Archivo", "Lugar Nro")):
+    """
+    Pone los DataFrames lado a lado, alineados por claves: cada clave ocupa
+    tantas filas como el df que más filas tenga para ella, y los que tengan
+    menos (o ninguna) se completan con "-". Las claves quedan en el orden en
+    que aparecen por primera vez y, si una columna se repite, vale la del
+    primer df que la tenga.
+    Se numeran las filas de cada clave (groupby + cumcount) y cada df se une
+    una sola vez contra el esqueleto (clave, orden), sin recorrer las claves.
+    """
+    dfs = [df.reset_index(drop=True) for df in dfs]
+    claves = list(claves)
+    codigos, primeras = _codigos_claves(dfs, claves)
+    n_claves = len(primeras)
+
+    # Filas por clave: el máximo entre los dfs (un df sin filas para la clave ocupa una)
+    cortes = np.cumsum([len(df) for df in dfs])[:-1]
+    codigos_df = np.split(codigos, cortes)
+    filas_por_clave = np.ones(n_claves, dtype=np.int64)
+    for codigos_uno in codigos_df:
+        filas_por_clave = np.maximum(filas_por_clave, np.bincount(codigos_uno, minlength=n_claves))
+
+    esqueleto = pd.DataFrame({"_clave": np.repeat(np.arange(n_claves), filas_por_clave)})
+    esqueleto["_orden"] = esqueleto.groupby("_clave").cumcount()
+
+    columnas = {}
+    primera_de_fila = primeras[esqueleto["_clave"].to_numpy()]
+    for clave in claves:
+        columnas[clave] = _valores_clave(dfs, clave).take(primera_de_fila).reset_index(drop=True)
+
+    for df, codigos_uno in zip(dfs, codigos_df):
+        propias = [col for col in df.columns if col not in columnas]
+        if not propias:
+            continue
+        filas = pd.DataFrame({
+            "_clave": codigos_uno,
+            "_orden": pd.Series(codigos_uno).groupby(codigos_uno).cumcount().to_numpy(),
+            "_fila": np.arange(len(df)),
+        })
+        fila = esqueleto.merge(filas, on=["_clave", "_orden"], how="left")["_fila"]
+        falta = fila.isna().to_numpy()
+        posiciones = fila.fillna(0).astype(np.int64).to_numpy()
+        for col in propias:
+            if not falta.any():
+                columnas[col] = df[col].take(posiciones).reset_index(drop=True)
+            elif falta.all():
+                columnas[col] = pd.Series(RELLENO, index=esqueleto.index, dtype=object)
+            else:
+                valores = df[col].to_numpy(dtype=object)[posiciones]
+                valores[falta] = RELLENO
+                columnas[col] = pd.Series(valores, dtype=object)
+
+    # Mismo orden de columnas que concatenar los dfs y descartar las repetidas
+    orden = list(dict.fromkeys(col for df in dfs for col in df.columns))
+    return pd.DataFrame({col: columnas[col] for col in orden})
+
+def asegurar_columnas(df, columnas, df_lugares):
+    """
+    Si el apartado no tiene filas, devuelve una por cada lugar de df_lugares
+    (Archivo y Lugar Nro como texto) con el resto de las columnas en "-".
+    Si tiene filas, lo devuelve tal cual.
+    """
+    if not df.empty:
+        return df
+    if df_lugares.empty:
+        return pd.DataFrame([], columns=columnas)
+    relleno = pd.DataFrame(RELLENO, index=pd.RangeIndex(len(df_lugares)), columns=columnas, dtype=object)
+    relleno["Archivo"] = df_lugares["Archivo"].to_numpy()
+    relleno["Lugar Nro"] = df_lugares["Lugar Nro"].astype(str).to_numpy()
+    return relleno
+
+def marcar_procedimiento(df, claves=("Archivo", "Lugar Nro")):
+    """Columna Procedimiento: 1 en la primera fila de cada clave y "-" en las demás"""
+    valores = np.full(len(df), RELLENO, dtype=object)
+    valores[~df.duplicated(subset=list(claves)).to_numpy()] = 1
+    return pd.Series(valores, index=df.index, dtype=object)
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+# --- ESTADOS DE LA COLUMNA "Estado Coordenadas" ---
+OK = "OK"
+VACIA = "VACIA"                    # sin coordenadas ("", "-")
+NO_RECONOCIDA = "NO RECONOCIDA"    # no es un par decimal, GMS ni GM
+FUERA_DE_RANGO = "FUERA DE RANGO"  # latitud > 90, longitud > 180 o minutos/segundos >= 60
+
+# --- FORMATOS ---
+# Cada componente puede ser decimal (-34.6049), grados y minutos (34°36.222'S)
+# o grados, minutos y segundos (34°36'13.32"S). El hemisferio (N/S/E/W/O de
+# Oeste) puede ir antes o después de cada componente y vale solo para ese.
+_NUMERO = r"\d+(?:\.\d+)?"
+_ETIQUETA = r"(?:(?:LATITUD|LONGITUD|LAT|LONG|LON)\.?\s*:?\s*)?"
+
+def _componente(nombre):
+    return (rf"{_ETIQUETA}(?P<{nombre}_hemisferio_antes>[NSEWO](?![A-Z]))?\s*(?P<{nombre}_signo>[-−])?\s*"
+            rf"(?P<{nombre}_grados>{_NUMERO})\s*"
+            rf"(?:(?P<{nombre}_marca>[°º])\s*(?:(?P<{nombre}_minutos>{_NUMERO})\s*['′’]?\s*"
+            rf"(?:(?P<{nombre}_segundos>{_NUMERO})\s*(?:\"|''|″|”)?)?)?)?"
+            rf"\s*(?P<{nombre}_hemisferio>[NSEWO](?![A-Z]))?")
+
+PATRON_COORDENADAS = rf"^[\s(\[]*{_componente('lat')}\s*[,;/]?\s*{_componente('lon')}[\s)\].]*$"
+
+
+# --- FUNCIONES ---
+def _componente_valor(partes, nombre):
+    """
+    (grados decimales con signo, hemisferio, minutos/segundos válidos) de un
+    componente. El signo sale del "-" o del hemisferio S/W/O de ese componente.
+    """
+    grados = pd.to_numeric(partes[f"{nombre}_grados"]).to_numpy(dtype=float)
+    minutos = pd.to_numeric(partes[f"{nombre}_minutos"]).fillna(0).to_numpy(dtype=float)
+    segundos = pd.to_numeric(partes[f"{nombre}_segundos"]).fillna(0).to_numpy(dtype=float)
+    despues, antes = partes[f"{nombre}_hemisferio"].to_numpy(), partes[f"{nombre}_hemisferio_antes"].to_numpy()
+    hemisferio = np.where(pd.notna(despues), despues, np.where(pd.notna(antes), antes, ""))
+    negativo = partes[f"{nombre}_signo"].notna().to_numpy() | np.isin(hemisferio, ["S", "W", "O"])
+    valor = grados + minutos / 60 + segundos / 3600
+    return np.where(negativo, -valor, valor), hemisferio, (minutos < 60) & (segundos < 60)
+
+def parsear_coordenadas(coordenadas):
+    """
+    Convierte de una vez toda una columna de coordenadas en texto a
+    DataFrame con "Latitud" y "Longitud" (float, NaN si no se pudo) y
+    "Estado Coordenadas" (OK, VACIA, NO RECONOCIDA o FUERA DE RANGO), con el
+    mismo índice. S y W/O dan valores negativos; si el par viene con los
+    hemisferios al revés (longitud primero) se da vuelta.
+    """
+    # Cada texto distinto se interpreta una sola vez
+    codigos, distintos = pd.factorize(coordenadas.astype(object), use_na_sentinel=False)
+    texto = pd.Series(distintos, dtype=object).str.upper().str.strip()
+    vacias = (texto.isna() | texto.isin(["", "-"])).to_numpy()
+    partes = texto.str.extract(PATRON_COORDENADAS)
+    reconocidas = partes["lat_grados"].notna().to_numpy() & ~vacias
+    # "S 34°36' W 58°22'": con el hemisferio adelante, la letra que sigue a la
+    # latitud es la de la longitud
+    adelante = partes["lat_hemisferio_antes"].notna() & partes["lon_hemisferio_antes"].isna()
+    partes.loc[adelante, "lon_hemisferio_antes"] = partes.loc[adelante, "lat_hemisferio"]
+    partes.loc[adelante, "lat_hemisferio"] = np.nan
+
+    primero, hemisferio_primero, primero_ok = _componente_valor(partes, "lat")
+    segundo, hemisferio_segundo, segundo_ok = _componente_valor(partes, "lon")
+    al_reves = np.isin(hemisferio_primero, ["E", "W", "O"]) & np.isin(hemisferio_segundo, ["N", "S"])
+    lat = np.where(al_reves, segundo, primero)
+    lon = np.where(al_reves, primero, segundo)
+
+    en_rango = primero_ok & segundo_ok & (np.abs(lat) <= 90) & (np.abs(lon) <= 180)
+    estado = np.select([vacias, ~reconocidas, ~en_rango], [VACIA, NO_RECONOCIDA, FUERA_DE_RANGO], default=OK)
+    validas = estado == OK
+    return pd.DataFrame({
+        "Latitud": np.where(validas, lat, np.nan)[codigos],
+        "Longitud": np.where(validas, lon, np.nan)[codigos],
+        "Estado Coordenadas": estado[codigos],
+    }, index=coordenadas.index)
+
+def formatear_coordenadas(parseadas, originales):
+    """
+    Texto "lat,lon" con 6 decimales de las coordenadas válidas; "-" para las
+    vacías y el texto original para las que no se pudieron leer.
+    """
+    texto = (parseadas["Latitud"].map("{:.6f}".format) + "," + parseadas["Longitud"].map("{:.6f}".format))
+    texto = texto.where(parseadas["Estado Coordenadas"] == OK, originales)
+    return texto.where(parseadas["Estado Coordenadas"] != VACIA, "-")
@@ -0,0 +1,120 @@
+import hashlib
+import re
+import unicodedata
+from functools import lru_cache
+from dependencias import mapeo_dependencias
+
+# --- CONFIGURACIÓN ---
+SIMILITUD_MINIMA = 0.75  # coeficiente de Dice entre trigramas para aceptar un nombre aproximado
+# Línea "Dependencia: ..." del parte (no la de "Codigo de Dependencia:")
+PATRON_DEPENDENCIA = re.compile(r"(?:^|[>\n])\s*Dependencia\s*:\s*([^<\n]+)", re.IGNORECASE)
+
+# Índice armado una sola vez por proceso (ver indice_dependencias)
+_INDICE = {}
+
+
+# --- NORMALIZACIÓN ---
+def normalizar_nombre(texto):
+    """
+    "Comisaría FF.CC.  Mitre" -> "COMISARIA FF CC MITRE": mayúsculas, sin
+    tildes, sin puntuación y con un solo espacio entre palabras.
+    """
+    texto = unicodedata.normalize("NFKD", str(texto).upper())
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^A-Z0-9]+", " ", texto).split())
+
+def trigramas(nombre):
+    """Trigramas del nombre normalizado, con un espacio de borde para que pesen los comienzos de palabra"""
+    nombre = f" {nombre} "
+    return {nombre[i:i + 3] for i in range(len(nombre) - 2)}
+
+
+# --- ÍNDICE ---
+def version_tabla(mapeo):
+    """Versión de la tabla de dependencias: cambia si cambia cualquier código o nombre"""
+    contenido = "\n".join(f"{codigo}={nombre}" for codigo, nombre in sorted(mapeo.items()))
+    return hashlib.sha1(contenido.encode("utf-8")).hexdigest()[:12]
+
+def armar_indice(mapeo):
+    """
+    {"version", "nombres": {código: nombre}, "por_nombre": {nombre normalizado:
+    [códigos]}, "trigramas": {trigrama: [códigos]}, "cantidad_trigramas":
+    {código: cantidad}}
+    """
+    indice = {"version": version_tabla(mapeo), "nombres": dict(mapeo), "por_nombre": {},
+              "trigramas": {}, "cantidad_trigramas": {}}
+    for codigo, nombre in mapeo.items():
+        normalizado = normalizar_nombre(nombre)
+        indice["por_nombre"].setdefault(normalizado, []).append(codigo)
+        propios = trigramas(normalizado)
+        indice["cantidad_trigramas"][codigo] = len(propios)
+        for trigrama in propios:
+            indice["trigramas"].setdefault(trigrama, []).append(codigo)
+    return indice
+
+def indice_dependencias():
+    """Índice de la tabla de dependencias.py (se arma la primera vez que se pide)"""
+    if not _INDICE:
+        _INDICE.update(armar_indice(mapeo_dependencias))
+    return _INDICE
+
+VERSION_DEPENDENCIAS = version_tabla(mapeo_dependencias)
+
+
+# --- BÚSQUEDAS ---
+def nombre_por_codigo(codigo):
+    """Nombre de la dependencia con ese código, o None"""
+    if codigo in (None, "", "-"):
+        return None
+    return indice_dependencias()["nombres"].get(str(codigo).strip())
+
+@lru_cache(maxsize=4096)
+def codigo_por_nombre(texto):
+    """
+    Código de la dependencia a partir del nombre tal como viene en el parte.
+    Primero busca el nombre normalizado exacto; si no está, el más parecido
+    por trigramas (con SIMILITUD_MINIMA). Devuelve None si no hay ninguno o
+    si el nombre corresponde a más de un código.
+    """
+    normalizado = normalizar_nombre(texto)
+    if not normalizado:
+        return None
+    indice = indice_dependencias()
+    codigos = indice["por_nombre"].get(normalizado)
+    if codigos:
+        return codigos[0] if len(codigos) == 1 else None
+
+    propios = trigramas(normalizado)
+    comunes = {}
+    for trigrama in propios:
+        for codigo in indice["trigramas"].get(trigrama, ()):
+            comunes[codigo] = comunes.get(codigo, 0) + 1
+    mejores, mejor = [], 0.0
+    for codigo, cantidad in comunes.items():
+        similitud = 2 * cantidad / (len(propios) + indice["cantidad_trigramas"][codigo])
+        if similitud > mejor:
+            mejores, mejor = [codigo], similitud
+        elif similitud == mejor:
+            mejores.append(codigo)
+    if mejor < SIMILITUD_MINIMA or len(mejores) > 1:
+        return None
+    return mejores[0]
+
+def dependencia_del_texto(texto):
+    """Nombre de la dependencia de la línea "Dependencia:" del parte ("" si no está)"""
+    match = PATRON_DEPENDENCIA.search(texto)
+    return match.group(1).strip() if match else ""
+
+def resolver_dependencia(codigo, texto_dependencia=""):
+    """
+    (código, nombre) de la dependencia: por código si está en la tabla; si
+    no (falta o la renombraron), por el nombre que trae el parte. Si no se
+    encuentra devuelve (codigo, None).
+    """
+    nombre = nombre_por_codigo(codigo)
+    if nombre:
+        return str(codigo).strip(), nombre
+    encontrado = codigo_por_nombre(texto_dependencia) if texto_dependencia else None
+    if encontrado:
+        return encontrado, indice_dependencias()["nombres"][encontrado]
+    return codigo, None
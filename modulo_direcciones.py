@@ -1,13 +1,18 @@
 import os
 import pandas as pd
 import re
-from PyPDF2 import PdfReader
+from modulo_documentos import abrir_almacen, cerrar_almacen, texto_documento
 
 # --- RUTAS ---
 DIR_PARTES = r"C:\Users\ecastro\Desktop\PARTES"
 BASE_SICPEF = r"C:\Users\ecastro\Desktop\SICPEF 2025.xlsx"
 BASE_CAUSA = r"C:\Users\ecastro\Desktop\prueba_causa.xlsx"
 RESULTADO = r"C:\Users\ecastro\Desktop\prueba_direcciones.xlsx"
+DIRECTORIO_CACHE = os.path.join(DIR_PARTES, ".cache")  # texto ya extraído de cada PDF (None = sin cache)
+
+# Textos de los PDF compartidos entre modulo_causa y modulo_direcciones:
+# cada PDF se lee una sola vez por corrida
+ALMACEN = abrir_almacen(DIRECTORIO_CACHE)
 
 # --- CARGAR COLUMNAS Y DATOS BASE ---
 df_base = pd.read_excel(BASE_SICPEF)
@@ -19,14 +24,7 @@ df_causa = pd.read_excel(BASE_CAUSA)
 # --- FUNCIONES ---
 def leer_pdf(path_pdf):
     """Extrae texto de un PDF como string"""
-    try:
-        reader = PdfReader(path_pdf)
-        texto = ""
-        for page in reader.pages:
-            texto += (page.extract_text() or "") + "\n"
-        return texto
-    except:
-        return ""
+    return texto_documento(ALMACEN, path_pdf)
 
 def extraer_direcciones(texto):
     """Devuelve lista de direcciones (LUGAR n) encontradas en el PDF, tolerando saltos y espacios."""
@@ -94,6 +92,8 @@ for _, fila_causa in df_causa.iterrows():
             fila[k] = v
         registros.append(fila)
 
+cerrar_almacen(ALMACEN)
+
 # --- EXPORTAR RESULTADO ---
 df_final = pd.DataFrame(registros, columns=columnas_finales)
 df_final.to_excel(RESULTADO, index=False)
@@ -0,0 +1,93 @@
+import os
+from modulo_cache import cargar_entrada, guardar_entrada, iterar_paginas
+from modulo_pdf import version_motor
+from modulo_secciones import empieza_bloque_posterior
+
+# --- CONFIGURACIÓN ---
+CLAVE_ALMACEN = "documentos"  # documentos.json dentro del directorio de cache
+
+
+# --- FUNCIONES ---
+def abrir_almacen(directorio_cache=None):
+    """
+    Almacén de textos de PDF compartido entre etapas (modulo_causa,
+    modulo_direcciones). Con directorio_cache arranca con los textos que dejó
+    la etapa anterior; sin cache vive solo en memoria.
+    """
+    documentos = cargar_entrada(directorio_cache, CLAVE_ALMACEN) if directorio_cache else None
+    return {
+        "directorio_cache": directorio_cache,
+        "documentos": documentos or {},
+        "usados": set(),
+        "cambios": False,
+    }
+
+def _firma_archivo(ruta):
+    """Tamaño y fecha de modificación: si cambian, el texto guardado ya no sirve"""
+    estado = os.stat(ruta)
+    return [estado.st_size, estado.st_mtime_ns]
+
+def _leer_paginas(ruta_pdf, directorio_cache, bloques, previas):
+    """
+    (páginas, completo): sigue leyendo página por página después de las
+    previas y, si se pidieron bloques, corta en la primera página donde
+    empieza un bloque posterior a ellos.
+    """
+    paginas = list(previas)
+    for pagina in iterar_paginas(ruta_pdf, directorio_cache, previas):
+        paginas.append(pagina)
+        if bloques and empieza_bloque_posterior(pagina, bloques):
+            return paginas, False
+    return paginas, True
+
+def _alcanza(documento, bloques):
+    """True si las páginas guardadas sirven para lo pedido"""
+    if documento["completo"]:
+        return True
+    return bool(bloques) and any(empieza_bloque_posterior(pagina, bloques) for pagina in documento["paginas"])
+
+def texto_documento(almacen, ruta_pdf, bloques=None):
+    """
+    Texto del PDF (cada página terminada en "\\n"). Se extrae una sola vez:
+    mientras no cambien el archivo ni el motor de PDF se devuelve el del almacén.
+    Con bloques (ver modulo_secciones.BLOQUES_PARTE, por ejemplo
+    ("cabecera", "recursos")) se deja de extraer al terminar la página donde
+    esos bloques ya quedaron completos; un pedido posterior del texto entero
+    extrae solo las páginas que faltan.
+    Devuelve "" si el PDF no se puede leer.
+    """
+    clave = os.path.normcase(os.path.abspath(ruta_pdf))
+    almacen["usados"].add(clave)
+    try:
+        firma = _firma_archivo(ruta_pdf)
+    except OSError:
+        return ""
+    motor = version_motor()
+    documento = almacen["documentos"].get(clave)
+    if (documento is None or documento["firma"] != firma or documento.get("motor") != motor
+            or "paginas" not in documento):  # los almacenes viejos guardaban el texto unido
+        documento = {"paginas": [], "completo": False}
+    if not _alcanza(documento, bloques):
+        try:
+            paginas, completo = _leer_paginas(ruta_pdf, almacen["directorio_cache"], bloques, documento["paginas"])
+        except Exception:
+            paginas, completo = [], True
+        documento = almacen["documentos"][clave] = {"firma": firma, "motor": motor, "paginas": paginas,
+                                                     "completo": completo}
+        almacen["cambios"] = True
+    return "".join(pagina + "\n" for pagina in documento["paginas"])
+
+def cerrar_almacen(almacen, podar=False):
+    """
+    Guarda el almacén para la etapa siguiente (si hay cache y algo cambió).
+    Con podar se descartan los documentos que no se usaron en esta pasada
+    (PDF borrados o movidos).
+    """
+    if podar:
+        sobrantes = set(almacen["documentos"]) - almacen["usados"]
+        for clave in sobrantes:
+            del almacen["documentos"][clave]
+        almacen["cambios"] = almacen["cambios"] or bool(sobrantes)
+    if almacen["directorio_cache"] and almacen["cambios"]:
+        guardar_entrada(almacen["directorio_cache"], CLAVE_ALMACEN, almacen["documentos"])
+        almacen["cambios"] = False
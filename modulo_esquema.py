@@ -0,0 +1,324 @@
+import re
+
+FLAGS = re.IGNORECASE | re.DOTALL
+
+# Caracteres que IGNORECASE iguala a una letra ASCII pero que str.lower() no
+# convierte (ı ~ i, ſ ~ s). Si aparecen, se usa la búsqueda por regex.
+PLEGADOS_ESPECIALES = ("ı", "ſ")
+
+
+# --- LIMPIEZA ---
+def limpiar_dni(dni):
+    return re.sub(r"\D", "", dni)
+
+def a_mayusculas(valor):
+    return valor.strip().upper() if isinstance(valor, str) else valor
+
+
+# --- ESQUEMAS ---
+# Cada campo: (columna, etiqueta, valor, limpiar, defecto)
+#   etiqueta + valor es la regex completa; el grupo 1 es el dato.
+#   limpiar se aplica al dato encontrado; si queda vacío se usa defecto.
+MAY = a_mayusculas
+LINEA = r"\s*([^\n<]+)"        # hasta fin de línea o "<"
+HASTA_MENOR = r"\s*(.+?)\s*<"  # hasta el próximo "<"
+OBSERVACION = r"\s*(.+?)\s*(?=<|$)"
+NUMERO = r"\s*(\d+)"
+
+CAMPOS = {
+    "cabecera": [
+        ("Código Dependencia", "Codigo de Dependencia:", NUMERO, MAY, ""),
+        ("Sumario", "Sumario:", HASTA_MENOR, MAY, ""),
+        ("Delito", "Delito 1:", HASTA_MENOR, MAY, ""),
+        ("Delito 2", "Delito 2:", HASTA_MENOR, MAY, "-"),
+        ("Delito 3", "Delito 3:", HASTA_MENOR, MAY, "-"),
+        ("Detalle de Delito", "Detalle de Delito:", HASTA_MENOR, MAY, "-"),
+        ("Modalidad", "Modalidad 1:", HASTA_MENOR, MAY, ""),
+        ("Juzgado / Fiscalía", r"Juzgado\s*/?\s*Fiscal[ií]a\s*:?", r"\s*([\s\S]+?)(?=<|\n|$)", MAY, ""),
+        ("Secretaría", "Secretaria:", HASTA_MENOR, MAY, ""),
+        ("Causa Nro.", "Causa Nro.:", HASTA_MENOR, MAY, ""),
+        ("Carátula", "Caratula:", HASTA_MENOR, MAY, ""),
+    ],
+    # Campos que se buscan sobre el texto normalizado (sin saltos ni espacios dobles)
+    "cabecera_norm": [
+        ("Fecha y Hora", "Fecha y Hora:", r"\s*([\d\-]+\s*-\s*\d{2}:\d{2})", None, ""),
+        ("Tipo Intervención", r"Tipo de Intervenci[oó]n:", LINEA, MAY, ""),
+    ],
+    "lugares": [
+        ("Calle", "Calle:", HASTA_MENOR, MAY, ""),
+        ("Localidad", "Localidad:", HASTA_MENOR, MAY, ""),
+        ("Departamento / Comuna", "Departamento / Partido / Comuna:", HASTA_MENOR, MAY, ""),
+        ("Provincia", "Provincia:", HASTA_MENOR, MAY, ""),
+        ("Coordenadas", "Coordenadas:", r"\s*([^\n<]+)", None, ""),
+    ],
+    "armas": [
+        ("Tipo", "Tipo:", LINEA, MAY, ""),
+        ("Detalles", "Detalles:", LINEA, MAY, ""),
+        ("Marca", "Marca:", LINEA, MAY, ""),
+        ("Modelo", "Modelo:", LINEA, MAY, ""),
+        ("Calibre", "Calibre:", LINEA, MAY, ""),
+        ("Numeración", "Numeracion:", LINEA, MAY, ""),
+        ("Pedido de Secuestro", "Pedido de Secuestro:", LINEA, MAY, ""),
+        ("Observaciones", "Observaciones:", OBSERVACION, MAY, ""),
+    ],
+    "drogas": [
+        ("Tipo", "Tipo:", LINEA, MAY, ""),
+        ("Cantidad", "Cantidad:", r"\s*([\d.,]+)", None, ""),
+        ("Medición", "Medicion:", LINEA, MAY, ""),
+        ("Observaciones", "Observaciones:", OBSERVACION, MAY, ""),
+    ],
+    "elementos": [
+        ("Incautación", "Incautacion:", LINEA, MAY, ""),
+        ("Tipo", "Tipo:", LINEA, MAY, ""),
+        ("Subtipo", "Subtipo:", LINEA, MAY, ""),
+        ("Cantidad", "Cantidad:", r"\s*([\d.,]+)", None, ""),
+        ("Medición", "Medicion:", LINEA, MAY, ""),
+        ("Aforo", "Aforo:", r"\$([\d.,]*)", None, ""),
+        ("Observaciones", "Observaciones:", OBSERVACION, MAY, ""),
+    ],
+    "imputados": [
+        ("Nombres", "Nombres:", LINEA, MAY, ""),
+        ("Apellidos", "Apellidos:", LINEA, MAY, ""),
+        ("Edad", "Edad:", NUMERO, None, ""),
+        ("Género", "Genero:", LINEA, MAY, ""),
+        ("DNI", "DNI:", r"\s*([.\d]+)", limpiar_dni, ""),
+        ("Nacionalidad", "Nacionalidad:", LINEA, MAY, ""),
+        ("Domicilio", "Domicilio:", LINEA, MAY, ""),
+        ("Situación Procesal", r"Situacion\s*Procesal\s*:", r"\s*([\w\s]+)", MAY, ""),
+        ("Posee Captura", r"Posee\s*Captura\s*:", r"\s*([\w\s]+)", MAY, ""),
+        ("Motivo Captura", "Motivo del Pedido de Captura:", LINEA, MAY, ""),
+        ("Alias", "Alias:", LINEA, MAY, "-"),
+        ("Banda Criminal", "Banda Criminal:", LINEA, MAY, "-"),
+    ],
+    "victimas": [
+        ("Nombres", "Nombres:", LINEA, MAY, ""),
+        ("Apellidos", "Apellidos:", LINEA, MAY, ""),
+        ("Edad", "Edad:", NUMERO, None, ""),
+        ("Género", "Genero:", LINEA, MAY, ""),
+        ("DNI", "DNI:", r"\s*([.\d]+)", limpiar_dni, ""),
+        ("Nacionalidad", "Nacionalidad:", LINEA, MAY, ""),
+        ("Domicilio", "Domicilio:", LINEA, MAY, ""),
+    ],
+    "vehiculos": [
+        ("Marca", "Marca:", LINEA, MAY, ""),
+        ("Modelo", "Modelo:", LINEA, MAY, ""),
+        ("Dominio", "Dominio:", LINEA, MAY, ""),
+        ("Tipo", "Tipo:", LINEA, MAY, ""),
+        ("Detalles", "Detalles:", OBSERVACION, MAY, ""),
+    ],
+    "otros": [
+        ("Efectivos", "Efectivos:", NUMERO, None, "-"),
+        ("Moviles", "Moviles:", NUMERO, None, "-"),
+        ("Motos", "Motos:", NUMERO, None, "-"),
+        ("Canes", "Canes:", NUMERO, None, "-"),
+        ("Morphrapid", "Morphrapid:", NUMERO, None, "-"),
+        ("Scanners", "Scanners:", NUMERO, None, "-"),
+        ("Caballos", "Caballos:", NUMERO, None, "-"),
+    ],
+}
+
+# Variante de no_lee.py: etiquetas con espacios opcionales alrededor de ":"
+# y valores que cortan también en salto de línea. Unificado la usa para los
+# partes que modulo_formato clasifica como NO LEE.
+HASTA_FIN = r"\s*(.+?)(?:<|\n|$)"
+OBSERVACION_FIN = r"\s*(.+?)(?=<|\n|$)"
+
+CAMPOS_NO_LEE = {
+    "cabecera": [
+        ("Código Dependencia", r"Codigo\s*de\s*Dependencia\s*:", NUMERO, MAY, ""),
+        ("Dependencia", r"Dependencia\s*:", HASTA_FIN, MAY, ""),
+        ("Sumario", r"Sumario\s*:", HASTA_FIN, MAY, ""),
+        ("Delito", r"Delito\s*1\s*:", HASTA_FIN, MAY, ""),
+        ("Delito 2", r"Delito\s*2\s*:", HASTA_FIN, MAY, "-"),
+        ("Delito 3", r"Delito\s*3\s*:", HASTA_FIN, MAY, "-"),
+        ("Detalle de Delito", r"Detalle\s*de\s*Delito\s*:", HASTA_FIN, MAY, "-"),
+        ("Modalidad", r"Modalidad\s*1\s*:", HASTA_FIN, MAY, ""),
+        ("Juzgado / Fiscalía", r"Juzgado\s*/?\s*Fiscal[ií]a\s*:?", r"\s*([\s\S]+?)(?=<|\n|$)", MAY, ""),
+        ("Secretaría", r"Secretaria\s*:", HASTA_FIN, MAY, ""),
+        ("Causa Nro.", r"Causa\s*(?:Nro\.?|Numero)\s*:?", r"\s*(.+?)(?:<|\n|$)", MAY, ""),
+        ("Carátula", r"Caratula\s*:", HASTA_FIN, MAY, ""),
+    ],
+    "cabecera_norm": [
+        ("Fecha", r"Fecha\s*y\s*Hora\s*:", r"\s*([0-9]{2}-[0-9]{2}-[0-9]{4})", None, "-"),
+        ("Hora", r"Fecha\s*y\s*Hora\s*:", r"[^:]*?([0-9]{2}:[0-9]{2})", None, "-"),
+        ("Tipo Intervención", r"Tipo\s*de\s*Intervencion\s*:?", r"\s*([A-ZÁÉÍÓÚÑ\s]+?)(?=<|\n|$)", MAY, "-"),
+    ],
+    "lugares": [
+        ("Calle", r"Calle\s*:", HASTA_FIN, MAY, ""),
+        ("Localidad", r"Localidad\s*:", HASTA_FIN, MAY, ""),
+        ("Departamento / Comuna", r"Departamento\s*/\s*Partido\s*/\s*Comuna\s*:", HASTA_FIN, MAY, ""),
+        ("Provincia", r"Provincia\s*:", HASTA_FIN, MAY, ""),
+        ("Coordenadas", r"Coordenadas\s*:", r"\s*([^\n<]+)", None, ""),
+    ],
+    "armas": [
+        ("Tipo", r"Tipo\s*:", LINEA, MAY, ""),
+        ("Detalles", r"Detalles\s*:", LINEA, MAY, ""),
+        ("Marca", r"Marca\s*:", LINEA, MAY, ""),
+        ("Modelo", r"Modelo\s*:", LINEA, MAY, ""),
+        ("Calibre", r"Calibre\s*:", LINEA, MAY, ""),
+        ("Numeración", r"Numeracion\s*:", LINEA, MAY, ""),
+        ("Pedido de Secuestro", r"Pedido\s*de\s*Secuestro\s*:", LINEA, MAY, ""),
+        ("Observaciones", r"Observaciones\s*:", OBSERVACION_FIN, MAY, ""),
+    ],
+    "drogas": [
+        ("Tipo", r"Tipo\s*:", LINEA, MAY, ""),
+        ("Cantidad", r"Cantidad\s*:", r"\s*([\d.,]+)", None, ""),
+        ("Medición", r"Medicion\s*:", LINEA, MAY, ""),
+        ("Observaciones", r"Observaciones\s*:", OBSERVACION_FIN, MAY, ""),
+    ],
+    "elementos": [
+        ("Incautación", r"Incautacion\s*:", LINEA, MAY, ""),
+        ("Tipo", r"Tipo\s*:", LINEA, MAY, ""),
+        ("Subtipo", r"Subtipo\s*:", LINEA, MAY, ""),
+        ("Cantidad", r"Cantidad\s*:", r"\s*([\d.,]+)", None, ""),
+        ("Medición", r"Medicion\s*:", LINEA, MAY, ""),
+        ("Aforo", r"Aforo\s*:", r"\$([\d.,]*)", None, ""),
+        ("Observaciones", r"Observaciones\s*:", OBSERVACION_FIN, MAY, ""),
+    ],
+    "imputados": [
+        ("Nombres", r"Nombres\s*:", LINEA, MAY, ""),
+        ("Apellidos", r"Apellidos\s*:", LINEA, MAY, ""),
+        ("Edad", r"Edad\s*:", NUMERO, None, ""),
+        ("Género", r"Genero\s*:", LINEA, MAY, ""),
+        ("DNI", r"DNI\s*:", r"\s*([.\d]+)", limpiar_dni, ""),
+        ("Nacionalidad", r"Nacionalidad\s*:", LINEA, MAY, ""),
+        ("Domicilio", r"Domicilio\s*:", LINEA, MAY, ""),
+        ("Situación Procesal", r"Situacion\s*Procesal\s*:", LINEA, MAY, ""),
+        ("Posee Captura", r"Posee\s*Captura\s*:", LINEA, MAY, ""),
+        ("Motivo Captura", r"Motivo\s*del\s*Pedido\s*de\s*Captura\s*:", LINEA, MAY, ""),
+        ("Alias", r"Alias\s*:", LINEA, MAY, "-"),
+        ("Banda Criminal", r"Banda\s*Criminal\s*:", LINEA, MAY, "-"),
+    ],
+    "victimas": [
+        ("Nombres", r"Nombres\s*:", LINEA, MAY, ""),
+        ("Apellidos", r"Apellidos\s*:", LINEA, MAY, ""),
+        ("Edad", r"Edad\s*:", NUMERO, None, ""),
+        ("Género", r"Genero\s*:", LINEA, MAY, ""),
+        ("DNI", r"DNI\s*:", r"\s*([.\d]+)", limpiar_dni, ""),
+        ("Nacionalidad", r"Nacionalidad\s*:", LINEA, MAY, ""),
+        ("Domicilio", r"Domicilio\s*:", LINEA, MAY, ""),
+    ],
+    "vehiculos": [
+        ("Marca", r"Marca\s*:", LINEA, MAY, ""),
+        ("Modelo", r"Modelo\s*:", LINEA, MAY, ""),
+        ("Dominio", r"Dominio\s*:", LINEA, MAY, ""),
+        ("Tipo", r"Tipo\s*:", LINEA, MAY, ""),
+        ("Detalles", r"Detalles\s*:", OBSERVACION_FIN, MAY, ""),
+    ],
+    "otros": [
+        ("Efectivos", r"Efectivos\s*:", NUMERO, None, "-"),
+        ("Moviles", r"Moviles\s*:", NUMERO, None, "-"),
+        ("Motos", r"Motos\s*:", NUMERO, None, "-"),
+        ("Canes", r"Canes\s*:", NUMERO, None, "-"),
+        ("Morphrapid", r"Morphrapid\s*:", NUMERO, None, "-"),
+        ("Scanners", r"Scanners\s*:", NUMERO, None, "-"),
+        ("Caballos", r"Caballos\s*:", NUMERO, None, "-"),
+    ],
+}
+
+
+# --- COMPILACIÓN ---
+def _alternativa_global(etiqueta):
+    """True si la etiqueta tiene un "|" fuera de grupos y clases"""
+    nivel, en_clase, escapado = 0, False, False
+    for caracter in etiqueta:
+        if escapado:
+            escapado = False
+        elif caracter == "\\":
+            escapado = True
+        elif en_clase:
+            en_clase = caracter != "]"
+        elif caracter == "[":
+            en_clase = True
+        elif caracter == "(":
+            nivel += 1
+        elif caracter == ")":
+            nivel -= 1
+        elif caracter == "|" and nivel == 0:
+            return True
+    return False
+
+def prefijo_literal(etiqueta):
+    r"""Texto fijo con el que empieza la etiqueta ("tipo" para r"Tipo\s*:"), o None"""
+    if _alternativa_global(etiqueta):
+        return None
+    for i, caracter in enumerate(etiqueta):
+        if caracter in "\\[](){}|.^$*+?":
+            # un cuantificador vuelve opcional al carácter anterior
+            prefijo = etiqueta[:i - 1] if caracter in "*?{" else etiqueta[:i]
+            break
+    else:
+        prefijo = etiqueta
+    return prefijo.lower() or None
+
+def compilar_campos(campos):
+    """
+    Precompila cada campo y guarda el prefijo literal de la etiqueta en
+    minúsculas, para ubicar candidatos con str.find antes de probar la regex.
+    El dato es el grupo 1: la etiqueta no puede tener grupos que capturen.
+    """
+    compilados = []
+    for columna, etiqueta, valor, limpiar, defecto in campos:
+        patron = re.compile(etiqueta + valor, FLAGS)
+        if re.compile(etiqueta, FLAGS).groups:
+            raise ValueError(f"La etiqueta de {columna!r} tiene grupos de captura: usar (?:...) ({etiqueta!r})")
+        compilados.append((columna, patron, prefijo_literal(etiqueta), limpiar, defecto))
+    return compilados
+
+def compilar_esquema(campos_por_seccion):
+    return {seccion: compilar_campos(campos) for seccion, campos in campos_por_seccion.items()}
+
+ESQUEMA = compilar_esquema(CAMPOS)
+ESQUEMA_NO_LEE = compilar_esquema(CAMPOS_NO_LEE)
+
+
+# --- EXTRACCIÓN ---
+def _minusculas(texto):
+    """texto.lower() si conserva las posiciones y los plegados de IGNORECASE, si no None"""
+    minusculas = texto.lower()
+    if len(minusculas) != len(texto) or any(c in minusculas for c in PLEGADOS_ESPECIALES):
+        return None
+    return minusculas
+
+def _buscar(patron, literal, texto, minusculas, desde=0):
+    """Equivale a patron.search(texto, desde), probando solo donde aparece la etiqueta"""
+    if literal is None or minusculas is None:
+        return patron.search(texto, desde)
+    pos = minusculas.find(literal, desde)
+    while pos != -1:
+        match = patron.match(texto, pos)
+        if match:
+            return match
+        pos = minusculas.find(literal, pos + 1)
+    return None
+
+def _limpiar(dato, limpiar, defecto):
+    dato = dato.strip()
+    if limpiar:
+        dato = limpiar(dato)
+    return dato or defecto
+
+def extraer_campos(campos, texto):
+    """
+    Devuelve {columna: valor} con la primera coincidencia de cada campo,
+    en el orden del esquema (mismo resultado que extraer_unico campo por campo).
+    """
+    minusculas = _minusculas(texto)
+    resultado = {}
+    for columna, patron, literal, limpiar, defecto in campos:
+        match = _buscar(patron, literal, texto, minusculas)
+        resultado[columna] = _limpiar(match.group(1), limpiar, defecto) if match else defecto
+    return resultado
+
+def extraer_listas(campos, texto):
+    """Devuelve {columna: [valores]} con todas las coincidencias de cada campo (como extraer_todos)"""
+    minusculas = _minusculas(texto)
+    resultado = {}
+    for columna, patron, literal, limpiar, defecto in campos:
+        valores = []
+        match = _buscar(patron, literal, texto, minusculas)
+        while match:
+            valores.append(_limpiar(match.group(1), limpiar, defecto))
+            match = _buscar(patron, literal, texto, minusculas, max(match.end(), match.start() + 1))
+        resultado[columna] = valores
+    return resultado
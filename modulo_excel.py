@@ -0,0 +1,109 @@
+import os
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+
+# --- FORMATO DEL ENCABEZADO (el mismo que usa DataFrame.to_excel) ---
+_LINEA = Side(style="thin")
+FUENTE_ENCABEZADO = Font(bold=True)
+BORDE_ENCABEZADO = Border(left=_LINEA, right=_LINEA, top=_LINEA, bottom=_LINEA)
+ALINEACION_ENCABEZADO = Alignment(horizontal="center", vertical="top")
+
+
+# --- FUNCIONES ---
+def abrir_libro(ruta, hojas):
+    """
+    Crea un libro en modo solo escritura (openpyxl write_only: las filas van
+    a disco a medida que se agregan, la memoria no crece con la cantidad de
+    filas) con las hojas en el orden dado. Se guarda con cerrar_libro.
+    """
+    libro = Workbook(write_only=True)
+    return {
+        "ruta": ruta,
+        "libro": libro,
+        "hojas": {nombre: libro.create_sheet(nombre) for nombre in hojas},
+        "encabezados": {},
+        "filas": {nombre: 0 for nombre in hojas},
+    }
+
+def _celda_encabezado(hoja, titulo):
+    celda = WriteOnlyCell(hoja, value=titulo)
+    celda.font = FUENTE_ENCABEZADO
+    celda.border = BORDE_ENCABEZADO
+    celda.alignment = ALINEACION_ENCABEZADO
+    return celda
+
+def _filas(df, encabezado):
+    """Filas de df en el orden del encabezado, con los vacíos como "" (igual que to_excel)"""
+    valores = df.reindex(columns=encabezado).astype(object)
+    valores = valores.where(valores.notna(), "")
+    return valores.itertuples(index=False, name=None)
+
+def agregar_filas(salida, nombre, df):
+    """
+    Agrega las filas de df al final de la hoja. La primera vez escribe el
+    encabezado con las columnas de df; después las columnas se alinean a ese
+    encabezado. Los valores vacíos (NaN/None) quedan como celdas vacías.
+    """
+    hoja = salida["hojas"][nombre]
+    encabezado = salida["encabezados"].get(nombre)
+    if encabezado is None:
+        encabezado = salida["encabezados"][nombre] = list(df.columns)
+        hoja.append([_celda_encabezado(hoja, titulo) for titulo in encabezado])
+
+    for fila in _filas(df, encabezado):
+        hoja.append(fila)
+    salida["filas"][nombre] += len(df)
+
+def cerrar_libro(salida):
+    """Escribe el libro en disco. Las hojas que no recibieron filas quedan vacías."""
+    salida["libro"].save(salida["ruta"])
+
+def libro_bloqueado(ruta):
+    """True si el Excel existe y otro programa lo tiene abierto (en Windows Excel no deja escribirlo)"""
+    try:
+        with open(ruta, "r+b"):
+            return False
+    except FileNotFoundError:
+        return False
+    except PermissionError:
+        return True
+
+def _escribir_encabezado(hoja, encabezado):
+    for columna, titulo in enumerate(encabezado, start=1):
+        celda = hoja.cell(row=1, column=columna, value=titulo)
+        celda.font = FUENTE_ENCABEZADO
+        celda.border = BORDE_ENCABEZADO
+        celda.alignment = ALINEACION_ENCABEZADO
+
+def agregar_a_libro(ruta, hojas, reemplazar=None):
+    """
+    Agrega al final de cada hoja de un Excel existente las filas de
+    hojas ({nombre: df}), alineadas al encabezado que ya tiene la hoja (las
+    columnas nuevas se agregan al final). Las celdas que ya estaban no se tocan. Las hojas de reemplazar ({nombre: df},
+    resúmenes) se reescriben enteras en el mismo lugar. Se escribe a un
+    temporal y se reemplaza, así el archivo nunca queda a medio guardar.
+    """
+    libro = load_workbook(ruta)
+    for nombre, df in hojas.items():
+        hoja = libro[nombre] if nombre in libro.sheetnames else libro.create_sheet(nombre)
+        encabezado = [celda.value for celda in hoja[1] if celda.value is not None]
+        nuevas = [columna for columna in df.columns if columna not in encabezado]
+        if nuevas:
+            # Columnas que la hoja todavía no tenía: van al final del encabezado
+            encabezado += nuevas
+            _escribir_encabezado(hoja, encabezado)
+        for fila in _filas(df, encabezado):
+            hoja.append(fila)
+    for nombre, df in (reemplazar or {}).items():
+        posicion = None
+        if nombre in libro.sheetnames:
+            posicion = libro.sheetnames.index(nombre)
+            del libro[nombre]
+        hoja = libro.create_sheet(nombre, posicion)
+        _escribir_encabezado(hoja, list(df.columns))
+        for fila in _filas(df, list(df.columns)):
+            hoja.append(fila)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    libro.save(temporal)
+    os.replace(temporal, ruta)
@@ -0,0 +1,101 @@
+from array import array
+import numpy as np
+import pandas as pd
+
+# --- CONFIGURACIÓN ---
+# Columnas con pocos valores distintos que se repiten en muchas filas: cada
+# celda se guarda como un código (entero de 4 bytes) y cada valor distinto
+# una sola vez. Las demás (Observaciones, Domicilio, DNI...) van en una lista.
+COLUMNAS_CATEGORICAS = {
+    "Archivo", "Lugar Nro", "Código Dependencia", "Dependencia", "Delito", "Delito 2", "Delito 3",
+    "Modalidad", "Tipo Intervención", "Localidad", "Departamento / Comuna", "Provincia",
+    "Tipo", "Subtipo", "Incautación", "Medición", "Aforo", "Marca", "Calibre", "Pedido de Secuestro",
+    "Género", "Nacionalidad", "Situación Procesal", "Posee Captura",
+    "Cantidad de Armamento", "Cantidad de Victimas",
+}
+FALTA = float("nan")  # celda de una fila que no tenía esa columna (como en pd.DataFrame de dicts)
+
+
+# --- FUNCIONES ---
+def nueva_tabla():
+    """
+    Tabla compacta de una sección: una columna por campo en lugar de un dict
+    por fila (los nombres de los campos no se repiten en cada fila).
+    """
+    return {"filas": 0, "columnas": {}}
+
+def _nueva_columna(nombre, relleno):
+    if nombre in COLUMNAS_CATEGORICAS:
+        return {"codigos": array("i", [-1]) * relleno, "valores": [], "indice": {}}
+    return {"valores": [FALTA] * relleno}
+
+def _largo(columna):
+    return len(columna["codigos"] if "codigos" in columna else columna["valores"])
+
+def _agregar(columna, valor):
+    if "codigos" not in columna:
+        columna["valores"].append(valor)
+        return
+    codigo = columna["indice"].get(valor)
+    if codigo is None:
+        codigo = columna["indice"][valor] = len(columna["valores"])
+        columna["valores"].append(valor)
+    columna["codigos"].append(codigo)
+
+def _agregar_falta(columna):
+    if "codigos" in columna:
+        columna["codigos"].append(-1)
+    else:
+        columna["valores"].append(FALTA)
+
+def acumular_filas(tabla, filas):
+    """Agrega a la tabla las filas (dicts) que devolvió el extractor para un parte"""
+    columnas = tabla["columnas"]
+    for fila in filas:
+        n = tabla["filas"]
+        for nombre, valor in fila.items():
+            columna = columnas.get(nombre)
+            if columna is None:
+                columna = columnas[nombre] = _nueva_columna(nombre, n)
+            _agregar(columna, valor)
+        tabla["filas"] = n + 1
+        if len(fila) < len(columnas):
+            for columna in columnas.values():
+                if _largo(columna) == n:
+                    _agregar_falta(columna)
+
+def _valores(columna):
+    if "codigos" not in columna:
+        return columna["valores"]
+    # El código -1 (falta) toma el último elemento: FALTA
+    valores = np.array(columna["valores"] + [FALTA], dtype=object)
+    return valores[np.frombuffer(columna["codigos"], dtype=np.int32)].tolist()
+
+def a_dataframe(filas, columns=None):
+    """
+    pd.DataFrame(filas, columns=columns) para una tabla compacta o una lista
+    de dicts: mismas columnas, en el mismo orden y con los mismos tipos.
+    """
+    if isinstance(filas, list):
+        return pd.DataFrame(filas, columns=columns)
+    nombres = list(filas["columnas"]) if columns is None else list(columns)
+    datos = {}
+    for nombre in nombres:
+        columna = filas["columnas"].get(nombre)
+        if columna is None:
+            datos[nombre] = np.full(filas["filas"], FALTA, dtype=object)
+        else:
+            datos[nombre] = _valores(columna)
+    return pd.DataFrame(datos, columns=nombres)
+
+def iterar_filas(filas):
+    """Las filas como dicts (sin las columnas que la fila no tenía), de una tabla compacta o una lista"""
+    if isinstance(filas, list):
+        yield from filas
+        return
+    columnas = {nombre: _valores(columna) for nombre, columna in filas["columnas"].items()}
+    for i in range(filas["filas"]):
+        yield {nombre: valores[i] for nombre, valores in columnas.items() if valores[i] is not FALTA}
+
+def cantidad_filas(filas):
+    return len(filas) if isinstance(filas, list) else filas["filas"]
@@ -0,0 +1,22 @@
+# --- FORMATOS DE PARTE ---
+PRINCIPAL = "PRINCIPAL"  # campos "> Etiqueta: valor <": esquema principal
+NO_LEE = "NO LEE"        # campos sin el "<" de cierre: esquema de no_lee.py
+SIN_TEXTO = "SIN TEXTO"  # el PDF no tiene texto extraíble (escaneado o dañado)
+
+# Si menos de esta proporción de los ">" tiene su "<", los valores del esquema
+# principal (que cortan en "<") se comerían los campos siguientes.
+PROPORCION_MINIMA_CIERRES = 0.5
+
+
+# --- FUNCIONES ---
+def clasificar_formato(texto):
+    """
+    Devuelve el formato del parte (PRINCIPAL, NO_LEE o SIN_TEXTO) según cómo
+    viene delimitado su texto, para elegir el esquema con el que se extrae.
+    """
+    if not texto.strip():
+        return SIN_TEXTO
+    aperturas = texto.count(">")
+    if aperturas and texto.count("<") < aperturas * PROPORCION_MINIMA_CIERRES:
+        return NO_LEE
+    return PRINCIPAL
@@ -0,0 +1,71 @@
+import os
+import shutil
+from datetime import datetime
+from modulo_cache import cargar_entrada, guardar_entrada, hash_archivo
+from modulo_ingesta import listar_pdfs
+
+# --- CONFIGURACIÓN ---
+CLAVE_MANIFIESTO = "manifiesto"  # manifiesto.json en la carpeta de estado (junto al cache)
+
+
+# --- FUNCIONES ---
+def parte_operativo(archivo):
+    """Parte Operativo de un PDF, tal como lo toma Unificado del nombre del archivo"""
+    return os.path.splitext(archivo)[0].strip().upper()
+
+def cargar_manifiesto(directorio):
+    """{parte operativo: {"archivo", "hash", "procesado"}} de los partes ya cargados"""
+    return cargar_entrada(directorio, CLAVE_MANIFIESTO) or {}
+
+def guardar_manifiesto(directorio, manifiesto):
+    guardar_entrada(directorio, CLAVE_MANIFIESTO, manifiesto)
+
+def partes_nuevos(directorio, manifiesto, directorio_en_la_base=None, archivos=None):
+    """
+    Devuelve {archivo: hash} de los PDF del directorio que todavía no se
+    cargaron: ni su Parte Operativo ni su contenido figuran en el manifiesto
+    y no hay un PDF con el mismo nombre en EN LA BASE. Con archivos se
+    revisan solo esos.
+    """
+    en_la_base = set()
+    if directorio_en_la_base and os.path.isdir(directorio_en_la_base):
+        en_la_base = {parte_operativo(archivo) for archivo in listar_pdfs(directorio_en_la_base)}
+    hashes_cargados = {registro["hash"] for registro in manifiesto.values()}
+
+    nuevos = {}
+    for archivo in listar_pdfs(directorio) if archivos is None else archivos:
+        parte = parte_operativo(archivo)
+        if parte in en_la_base:
+            continue
+        sha = hash_archivo(os.path.join(directorio, archivo))
+        if parte in manifiesto:
+            if manifiesto[parte]["hash"] != sha:
+                print(f"Aviso: {archivo} cambió desde que se cargó el {manifiesto[parte]['procesado']}; no se vuelve a procesar")
+            continue
+        if sha in hashes_cargados:
+            print(f"Aviso: {archivo} tiene el mismo contenido que un parte ya cargado; se omite")
+            continue
+        nuevos[archivo] = sha
+    return nuevos
+
+def registrar_partes(manifiesto, nuevos):
+    """Anota en el manifiesto los partes procesados ({archivo: hash})"""
+    procesado = datetime.now().isoformat(timespec="seconds")
+    for archivo, sha in nuevos.items():
+        manifiesto[parte_operativo(archivo)] = {"archivo": archivo, "hash": sha, "procesado": procesado}
+
+def mover_a_en_la_base(directorio, archivos, directorio_en_la_base):
+    """Mueve los PDF ya cargados a la carpeta EN LA BASE"""
+    os.makedirs(directorio_en_la_base, exist_ok=True)
+    for archivo in archivos:
+        shutil.move(os.path.join(directorio, archivo), os.path.join(directorio_en_la_base, archivo))
+
+def reiniciar_manifiesto(directorio, hashes):
+    """
+    Después de una corrida completa el manifiesto queda con exactamente los
+    PDF procesados ({archivo: hash}, los que ya se calcularon para el cache:
+    ver "hash" en las métricas de cada archivo), sin volver a leerlos.
+    """
+    manifiesto = {}
+    registrar_partes(manifiesto, hashes)
+    guardar_manifiesto(directorio, manifiesto)
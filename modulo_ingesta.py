@@ -0,0 +1,87 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from modulo_cache import hash_bytes, leer_paginas, leer_registros
+from modulo_filas import acumular_filas, nueva_tabla
+from modulo_metricas import anotar, iniciar_archivo, registrar_archivo, terminar_archivo
+from modulo_pdf import version_motor
+from modulo_pipeline import EN_VUELO_POR_WORKER, leer_adelantado, mapa_acotado
+
+# --- APARTADOS QUE DEVUELVE CADA EXTRACTOR ---
+SECCIONES = ("cabeceras", "lugares", "armas", "drogas", "elementos",
+             "imputados", "victimas", "vehiculos", "otros")
+
+
+# --- FUNCIONES ---
+def listar_pdfs(directorio):
+    """Devuelve los PDF del directorio ordenados por nombre de archivo"""
+    return sorted(a for a in os.listdir(directorio) if a.lower().endswith(".pdf"))
+
+def leer_texto_pdf(ruta_pdf, directorio_cache=None, datos=None):
+    """Extrae el texto completo de un PDF, pagina por pagina (de datos, si ya se leyó)"""
+    return "".join(leer_paginas(ruta_pdf, directorio_cache, datos))
+
+def _procesar_archivo(tarea):
+    """
+    Extrae el texto de un PDF ya leído (datos) y aplica el extractor. Corre
+    dentro de cada proceso hijo. Las métricas del archivo (modulo_metricas),
+    con el hash del PDF, vuelven en filas["metricas"].
+    """
+    directorio, archivo, extractor, directorio_cache, datos = tarea
+    ruta_pdf = os.path.join(directorio, archivo)
+    iniciar_archivo(archivo, ruta_pdf)
+    anotar("motor", version_motor())
+    anotar("extractor", f"{extractor.__module__}.{extractor.__qualname__}")
+    if directorio_cache:
+        filas = leer_registros(ruta_pdf, archivo, extractor, directorio_cache, datos)
+    else:
+        if datos is not None:
+            anotar("hash", hash_bytes(datos))
+        filas = extractor(archivo, leer_texto_pdf(ruta_pdf, datos=datos))
+    filas = {**filas, "metricas": terminar_archivo(filas)}
+    return archivo, filas
+
+def iterar_directorio(directorio, extractor, workers=1, directorio_cache=None, archivos=None):
+    """
+    Igual que procesar_directorio, pero devuelve (archivo, filas) de cada PDF
+    a medida que se procesan (siempre en orden de nombre de archivo), sin
+    acumular los resultados.
+    Trabaja en etapas con colas acotadas (modulo_pipeline): un hilo lee los
+    PDF del disco por adelantado, los workers extraen el texto y los campos y
+    quien consume (por ejemplo el que escribe el Excel) recibe cada parte
+    mientras siguen los demás. La memoria no crece con la cantidad de PDF.
+    """
+    if archivos is None:
+        archivos = listar_pdfs(directorio)
+    archivos = sorted(archivos)
+    tareas = ((directorio, archivo, extractor, directorio_cache, datos)
+              for archivo, datos in leer_adelantado(directorio, archivos))
+
+    if workers > 1 and len(archivos) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from mapa_acotado(pool, _procesar_archivo, tareas, workers * EN_VUELO_POR_WORKER)
+    else:
+        yield from map(_procesar_archivo, tareas)
+
+def procesar_directorio(directorio, extractor, workers=1, directorio_cache=None, archivos=None, metricas=None):
+    """
+    Procesa todos los PDF del directorio con extractor(archivo, texto), que
+    devuelve un dict {seccion: [filas]}. Las filas de todos los PDF se juntan
+    en tablas compactas por sección (modulo_filas; el DataFrame se arma con
+    a_dataframe). Con workers > 1 los PDF se reparten
+    en un pool de procesos; el resultado se une siempre en orden de nombre
+    de archivo, asi que la salida es la misma con 1 o con N procesos.
+    Con directorio_cache los PDF que no cambiaron no se vuelven a leer ni
+    a parsear (ver modulo_cache). Con archivos se procesan solo esos PDF.
+    Si el extractor devuelve además "formato" (ver modulo_formato), se
+    muestra junto al nombre del archivo. Con metricas (modulo_metricas) se
+    registran los tiempos, páginas, bytes y filas de cada archivo.
+    El extractor tiene que estar definido a nivel de modulo (picklable).
+    """
+    acumulado = {seccion: nueva_tabla() for seccion in SECCIONES}
+    for archivo, filas in iterar_directorio(directorio, extractor, workers, directorio_cache, archivos):
+        print(f"Procesando: {archivo}" + (f" [{filas['formato']}]" if "formato" in filas else ""))
+        if metricas is not None:
+            registrar_archivo(metricas, filas["metricas"])
+        for seccion in SECCIONES:
+            acumular_filas(acumulado[seccion], filas.get(seccion, []))
+    return acumulado
@@ -0,0 +1,148 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+# --- CONFIGURACIÓN ---
+ARCHIVOS_EN_RESUMEN = 10  # partes más lentos (y de peor calidad) que se listan en el resumen
+PUNTAJE_A_REVISAR = 0.75  # partes con puntaje de calidad (modulo_calidad) menor a esto van en "a_revisar"
+
+# Métricas del archivo que se está procesando en este proceso (cada hijo del
+# pool tiene la suya); las etapas medidas fuera de un archivo no se anotan.
+_ACTUAL = {"archivo": None}
+
+
+# --- MEDICIÓN ---
+def abrir_metricas():
+    """Métricas de una corrida: etapas generales y un registro por archivo"""
+    return {"inicio": time.perf_counter(), "segundos": None, "etapas": {}, "archivos": []}
+
+def _sumar(etapas, etapa, segundos):
+    acumulado = etapas.setdefault(etapa, {"segundos": 0.0, "veces": 0})
+    acumulado["segundos"] += segundos
+    acumulado["veces"] += 1
+
+@contextmanager
+def medir(etapa, metricas=None):
+    """
+    Suma el tiempo del bloque a la etapa: en metricas (etapas de la corrida)
+    o, sin metricas, en el archivo iniciado con iniciar_archivo.
+    """
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        segundos = time.perf_counter() - inicio
+        if metricas is not None:
+            _sumar(metricas["etapas"], etapa, segundos)
+        elif _ACTUAL["archivo"] is not None:
+            _sumar(_ACTUAL["archivo"]["etapas"], etapa, segundos)
+
+def anotar(dato, valor):
+    """Guarda un dato del archivo actual (por ejemplo "paginas")"""
+    if _ACTUAL["archivo"] is not None:
+        _ACTUAL["archivo"][dato] = valor
+
+def iniciar_archivo(archivo, ruta):
+    _ACTUAL["archivo"] = {
+        "archivo": archivo,
+        "bytes": os.path.getsize(ruta),
+        "paginas": None,
+        "filas": 0,
+        "motor": None,  # motor de PDF y versión (modulo_pdf)
+        "extractor": None,  # función que extrajo los campos
+        "cache": None,  # "registros" (no se leyó ni parseó), "texto" (solo se parseó), "nuevo" o None (sin cache)
+        "formato": None,  # esquema con que se leyó (modulo_formato)
+        "calidad": None,  # puntaje y cobertura de campos, si el extractor la devuelve (modulo_calidad)
+        "hash": None,  # SHA-256 del PDF (el de la clave del cache; sirve para el manifiesto)
+        "segundos": 0.0,
+        "inicio": time.perf_counter(),
+        "etapas": {},
+    }
+
+def terminar_archivo(filas):
+    """Cierra el registro del archivo actual con las filas que emitió (y su formato y calidad) y lo devuelve"""
+    registro = _ACTUAL["archivo"]
+    _ACTUAL["archivo"] = None
+    registro["segundos"] = time.perf_counter() - registro.pop("inicio")
+    registro["filas"] = sum(len(valor) for valor in filas.values() if isinstance(valor, list))
+    registro["formato"] = filas.get("formato")
+    registro["calidad"] = filas.get("calidad")
+    return registro
+
+def registrar_archivo(metricas, registro):
+    if registro is not None:
+        metricas["archivos"].append(registro)
+
+
+# --- REPORTE ---
+def cerrar_metricas(metricas):
+    """Fija la duración total y devuelve el reporte (etapas de la corrida + suma de las de cada archivo)"""
+    metricas["segundos"] = time.perf_counter() - metricas["inicio"]
+    etapas = {etapa: dict(datos) for etapa, datos in metricas["etapas"].items()}
+    for registro in metricas["archivos"]:
+        for etapa, datos in registro["etapas"].items():
+            acumulado = etapas.setdefault(etapa, {"segundos": 0.0, "veces": 0})
+            acumulado["segundos"] += datos["segundos"]
+            acumulado["veces"] += datos["veces"]
+    archivos = metricas["archivos"]
+    paginas = sum(registro["paginas"] or 0 for registro in archivos)
+    segundos = metricas["segundos"]
+    con_calidad = sorted((registro for registro in archivos if registro.get("calidad")),
+                         key=lambda registro: (registro["calidad"]["puntaje"], registro["archivo"]))
+    return {
+        "segundos": segundos,
+        "archivos": len(archivos),
+        "paginas": paginas,
+        "bytes": sum(registro["bytes"] for registro in archivos),
+        "filas": sum(registro["filas"] for registro in archivos),
+        "archivos_por_segundo": len(archivos) / segundos if segundos else None,
+        "paginas_por_segundo": paginas / segundos if segundos else None,
+        "etapas": dict(sorted(etapas.items(), key=lambda item: -item[1]["segundos"])),
+        "calidad": {
+            "puntaje_promedio": (sum(registro["calidad"]["puntaje"] for registro in con_calidad) / len(con_calidad)
+                                 if con_calidad else None),
+            "lugares_no_coinciden": sum(1 for registro in con_calidad if not registro["calidad"]["lugares_coinciden"]),
+            "formatos": {formato: sum(1 for registro in archivos if registro.get("formato") == formato)
+                         for formato in sorted({registro.get("formato") or "-" for registro in archivos})},
+            # Peor puntaje primero
+            "a_revisar": [registro["archivo"] for registro in con_calidad
+                          if registro["calidad"]["puntaje"] < PUNTAJE_A_REVISAR],
+        },
+        "por_archivo": sorted(archivos, key=lambda registro: -registro["segundos"]),
+    }
+
+def resumen_metricas(reporte):
+    """Tabla de texto con las etapas (de la más lenta a la más rápida) y los partes más lentos"""
+    lineas = [
+        f"{reporte['archivos']} archivos, {reporte['paginas']} páginas, "
+        f"{reporte['bytes'] / 1e6:.1f} MB, {reporte['filas']} filas en {reporte['segundos']:.2f} s",
+        f"{reporte['archivos_por_segundo'] or 0:.1f} archivos/s, {reporte['paginas_por_segundo'] or 0:.1f} páginas/s "
+        "(los tiempos por etapa se suman sobre todos los archivos, aunque corran en paralelo)",
+        "",
+        f"{'Etapa':<28}{'Segundos':>10}{'Veces':>8}",
+    ]
+    for etapa, datos in reporte["etapas"].items():
+        lineas.append(f"{etapa:<28}{datos['segundos']:>10.3f}{datos['veces']:>8}")
+    lineas += ["", f"{'Archivo':<28}{'Segundos':>10}{'Páginas':>8}{'KB':>8}{'Filas':>7}"]
+    for registro in reporte["por_archivo"][:ARCHIVOS_EN_RESUMEN]:
+        paginas = "-" if registro["paginas"] is None else registro["paginas"]
+        lineas.append(f"{registro['archivo']:<28}{registro['segundos']:>10.3f}{paginas:>8}"
+                      f"{registro['bytes'] // 1024:>8}{registro['filas']:>7}")
+    calidad = reporte.get("calidad") or {}
+    if calidad.get("puntaje_promedio") is not None:
+        por_archivo = {registro["archivo"]: registro for registro in reporte["por_archivo"]}
+        lineas += ["", f"Calidad: puntaje promedio {calidad['puntaje_promedio']:.2f}, "
+                       f"{len(calidad['a_revisar'])} partes con menos de {PUNTAJE_A_REVISAR}, "
+                       f"{calidad['lugares_no_coinciden']} con LUGAR distinto de Calle",
+                   f"{'A revisar':<28}{'Puntaje':>8}{'Vacíos':>8}{'LUGAR':>7}{'Calle':>7}  Formato"]
+        for archivo in calidad["a_revisar"][:ARCHIVOS_EN_RESUMEN]:
+            registro = por_archivo[archivo]
+            datos = registro["calidad"]
+            lineas.append(f"{archivo:<28}{datos['puntaje']:>8.2f}{len(datos['cabecera_vacios']):>8}"
+                          f"{datos['lugares_texto']:>7}{datos['lugares_calle']:>7}  {registro['formato']}")
+    return "\n".join(lineas)
+
+def guardar_metricas(reporte, ruta):
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(reporte, f, ensure_ascii=False, indent=2)
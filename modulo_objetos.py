@@ -0,0 +1,101 @@
+import re
+from bisect import bisect_left
+from modulo_cache import cargar_entrada, guardar_entrada
+from modulo_filas import iterar_filas
+from modulo_incremental import parte_operativo
+
+# --- CONFIGURACIÓN ---
+CLAVE_OBJETOS = "objetos"  # objetos.json en la carpeta de estado (junto al cache)
+# {tipo: (sección, columna con el identificador)}
+TIPOS = {
+    "dominios": ("vehiculos", "Dominio"),
+    "numeraciones": ("armas", "Numeración"),
+}
+LARGO_MINIMO = 4  # un identificador más corto (o sin dígitos) no se indexa: "-", "S/N", "NO POSEE"...
+
+
+# --- FUNCIONES ---
+def normalizar_identificador(valor):
+    """"AB 646 KS" -> "AB646KS": mayúsculas, solo letras y dígitos. None si no parece un dominio o numeración."""
+    identificador = re.sub(r"[^A-Z0-9]", "", str(valor or "").upper())
+    if len(identificador) < LARGO_MINIMO or not any(c.isdigit() for c in identificador):
+        return None
+    return identificador
+
+def con_pedido(valor):
+    return str(valor or "").strip().upper().startswith("SI")
+
+def nuevo_indice_objetos():
+    """{tipo: {identificador: [[archivo, lugar, con pedido de secuestro]]}, "archivos": {archivo: {tipo: [identificadores]}}}"""
+    return {**{tipo: {} for tipo in TIPOS}, "archivos": {}}
+
+def cargar_indice_objetos(directorio):
+    return cargar_entrada(directorio, CLAVE_OBJETOS) or nuevo_indice_objetos()
+
+def guardar_indice_objetos(directorio, indice):
+    guardar_entrada(directorio, CLAVE_OBJETOS, indice)
+
+def quitar_archivos(indice, archivos):
+    """Saca del índice lo que aportaron esos partes (para volver a cargarlos sin duplicar)"""
+    for archivo in archivos:
+        for tipo, identificadores in indice["archivos"].pop(archivo, {}).items():
+            for identificador in identificadores:
+                apariciones = [a for a in indice[tipo].get(identificador, []) if a[0] != archivo]
+                if apariciones:
+                    indice[tipo][identificador] = apariciones
+                else:
+                    indice[tipo].pop(identificador, None)
+
+def indexar_objetos(indice, tablas):
+    """
+    Agrega al índice los dominios de los vehículos y las numeraciones de las
+    armas de las tablas ({sección: filas}). Un parte que ya estaba se reemplaza;
+    los de corridas anteriores quedan.
+    """
+    filas = {tipo: list(iterar_filas(tablas.get(seccion, []))) for tipo, (seccion, _) in TIPOS.items()}
+    quitar_archivos(indice, {fila["Archivo"] for lista in filas.values() for fila in lista})
+    for tipo, (_, columna) in TIPOS.items():
+        for fila in filas[tipo]:
+            identificador = normalizar_identificador(fila.get(columna))
+            if identificador is None:
+                continue
+            indice[tipo].setdefault(identificador, []).append(
+                [fila["Archivo"], str(fila.get("Lugar Nro", "")), con_pedido(fila.get("Pedido de Secuestro"))])
+            propios = indice["archivos"].setdefault(fila["Archivo"], {}).setdefault(tipo, [])
+            if identificador not in propios:
+                propios.append(identificador)
+    return indice
+
+def buscar(indice, tipo, valor):
+    """[(Parte Operativo, archivo, lugar, con pedido de secuestro)] de ese dominio o numeración"""
+    identificador = normalizar_identificador(valor)
+    return [(parte_operativo(archivo), archivo, lugar, pedido)
+            for archivo, lugar, pedido in indice[tipo].get(identificador, [])] if identificador else []
+
+def claves_ordenadas(indice, tipo):
+    """Identificadores ordenados, para buscar_prefijo (se arma una vez y sirve para muchas búsquedas)"""
+    return sorted(indice[tipo])
+
+def buscar_prefijo(claves, prefijo):
+    """Identificadores de claves_ordenadas que empiezan con el prefijo (normalizado)"""
+    prefijo = re.sub(r"[^A-Z0-9]", "", str(prefijo).upper())
+    # Los identificadores solo tienen A-Z y 0-9: todos los que empiezan con
+    # el prefijo quedan antes de prefijo + "~"
+    return claves[bisect_left(claves, prefijo):bisect_left(claves, prefijo + "~")]
+
+def antecedentes(indice, tipo, valores, archivos):
+    """
+    Para cada fila (valor, archivo): (Partes Operativos de los otros partes en
+    que aparece, "SI"/"NO" según si en alguno tenía Pedido de Secuestro).
+    "-" en ambos si el valor no es un identificador.
+    """
+    resultado = []
+    for valor, archivo in zip(valores, archivos):
+        identificador = normalizar_identificador(valor)
+        if identificador is None:
+            resultado.append(("-", "-"))
+            continue
+        otros = [a for a in indice[tipo].get(identificador, []) if a[0] != archivo]
+        partes = list(dict.fromkeys(parte_operativo(a[0]) for a in otros))
+        resultado.append((", ".join(partes) or "-", "SI" if any(a[2] for a in otros) else "NO"))
+    return resultado
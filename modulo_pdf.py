@@ -0,0 +1,96 @@
+import importlib
+import io
+import importlib.util
+from importlib import metadata
+from modulo_metricas import medir
+
+# --- CONFIGURACIÓN ---
+# Motor con el que se extrae el texto de los PDF en todos los scripts.
+# "pypdf2" es el de siempre; "pymupdf" y "pdfium" son mucho más rápidos pero
+# opcionales (pip install pymupdf / pip install pypdfium2) y no sacan
+# exactamente el mismo texto: antes de cambiarlo correr paridad_motores.py.
+MOTOR_PDF = "pypdf2"
+
+
+# --- MOTORES ---
+def _normalizar(texto):
+    """Saltos de línea como los de PyPDF2: "\\n" y sin salto al final de la página"""
+    return texto.replace("\r\n", "\n").replace("\r", "\n").rstrip("\n")
+
+def _paginas_pypdf2(modulo, ruta_pdf, desde):
+    with medir("abrir PDF"):
+        reader = modulo.PdfReader(io.BytesIO(ruta_pdf) if isinstance(ruta_pdf, bytes) else ruta_pdf)
+    for page in reader.pages[desde:]:
+        with medir("extract_text"):
+            texto = page.extract_text() or ""
+        yield texto
+
+def _paginas_pymupdf(modulo, ruta_pdf, desde):
+    with medir("abrir PDF"):
+        if isinstance(ruta_pdf, bytes):
+            documento = modulo.open(stream=ruta_pdf, filetype="pdf")
+        else:
+            documento = modulo.open(ruta_pdf)
+    try:
+        for i in range(desde, len(documento)):
+            with medir("extract_text"):
+                texto = _normalizar(documento[i].get_text())
+            yield texto
+    finally:
+        documento.close()
+
+def _paginas_pdfium(modulo, ruta_pdf, desde):
+    with medir("abrir PDF"):
+        documento = modulo.PdfDocument(ruta_pdf)
+    try:
+        for i in range(desde, len(documento)):
+            with medir("extract_text"):
+                textpage = documento[i].get_textpage()
+                texto = _normalizar(textpage.get_text_range())
+                textpage.close()
+            yield texto
+    finally:
+        documento.close()
+
+# motor: (paquete que hay que importar, páginas del PDF)
+MOTORES = {
+    "pypdf2": ("PyPDF2", _paginas_pypdf2),
+    "pymupdf": ("pymupdf", _paginas_pymupdf),
+    "pdfium": ("pypdfium2", _paginas_pdfium),
+}
+
+
+# --- FUNCIONES ---
+def _motor(motor):
+    motor = motor or MOTOR_PDF
+    if motor not in MOTORES:
+        raise ValueError(f"Motor de PDF desconocido: {motor!r} (opciones: {', '.join(MOTORES)})")
+    return motor
+
+def motor_disponible(motor):
+    """True si el paquete del motor está instalado"""
+    return importlib.util.find_spec(MOTORES[_motor(motor)][0]) is not None
+
+def version_motor(motor=None):
+    """"pypdf2-3.0.1": va en la clave del cache, porque otro motor u otra versión puede extraer otro texto"""
+    motor = _motor(motor)
+    try:
+        version = metadata.version(MOTORES[motor][0])
+    except metadata.PackageNotFoundError:
+        version = "?"
+    return f"{motor}-{version}"
+
+def paginas_pdf(ruta_pdf, motor=None, desde=0):
+    """
+    Texto de cada página del PDF a medida que se pide (las que no se piden no
+    se procesan), con el motor dado o MOTOR_PDF. ruta_pdf puede ser también
+    el contenido del PDF ya leído (bytes). Con desde se empieza en esa página
+    (0 es la primera) sin procesar las anteriores.
+    """
+    motor = _motor(motor)
+    paquete, paginas = MOTORES[motor]
+    try:
+        modulo = importlib.import_module(paquete)
+    except ImportError as e:
+        raise ImportError(f"El motor de PDF {motor!r} necesita el paquete {paquete} (pip install {paquete})") from e
+    return paginas(modulo, ruta_pdf, desde)
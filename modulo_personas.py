@@ -0,0 +1,155 @@
+import pandas as pd
+from modulo_cache import cargar_entrada, guardar_entrada
+from modulo_dependencias import normalizar_nombre
+from modulo_filas import iterar_filas
+from modulo_incremental import parte_operativo
+
+# --- CONFIGURACIÓN ---
+CLAVE_PERSONAS = "personas"  # personas.json en la carpeta de estado (junto al cache)
+ROLES = {"imputados": "IMPUTADO", "victimas": "VICTIMA"}  # secciones que se indexan
+DIGITOS_DNI = (6, 9)  # largo aceptado de un DNI sin ceros adelante; fuera de eso se busca por nombre
+REINCIDENCIA_MINIMA = 2  # partes distintos para aparecer en la hoja de reincidentes
+COLUMNAS_REINCIDENTES = ["DNI", "Apellidos", "Nombres", "Edad", "Partes", "Como Imputado",
+                         "Como Victima", "Partes Operativos"]
+
+
+# --- CLAVES ---
+def normalizar_dni(dni):
+    """DNI solo con dígitos y sin ceros adelante, o None si falta o no tiene un largo posible"""
+    digitos = "".join(c for c in str(dni or "") if c.isdigit()).lstrip("0")
+    return digitos if DIGITOS_DNI[0] <= len(digitos) <= DIGITOS_DNI[1] else None
+
+def clave_bloqueo(fila):
+    """
+    "APELLIDOS|NOMBRES|EDAD" normalizados: une a una persona sin DNI (o con
+    uno ilegible) con la misma persona en otro parte. None sin apellido o nombre.
+    """
+    apellidos = normalizar_nombre(fila.get("Apellidos", ""))
+    nombres = normalizar_nombre(fila.get("Nombres", ""))
+    if not apellidos or not nombres:
+        return None
+    edad = str(fila.get("Edad", "")).strip()
+    return f"{apellidos}|{nombres}|{edad if edad.isdigit() else ''}"
+
+
+# --- ÍNDICE ---
+def nuevo_indice():
+    """
+    {"personas": {id: {"dni", "apellidos", "nombres", "edad", "claves",
+    "apariciones": [[archivo, lugar, rol]]}}, "claves": {"DNI:..." o
+    "NOMBRE:...": id}, "archivos": {archivo: [ids]}, "siguiente": n}
+    Una clave de nombre que comparten personas con DNI distinto vale None.
+    """
+    return {"personas": {}, "claves": {}, "archivos": {}, "siguiente": 1}
+
+def cargar_indice(directorio):
+    return cargar_entrada(directorio, CLAVE_PERSONAS) or nuevo_indice()
+
+def guardar_indice(directorio, indice):
+    guardar_entrada(directorio, CLAVE_PERSONAS, indice)
+
+def _nueva_persona(indice):
+    persona = f"P{indice['siguiente']}"
+    indice["siguiente"] += 1
+    indice["personas"][persona] = {"dni": None, "apellidos": "", "nombres": "", "edad": "",
+                                   "claves": [], "apariciones": []}
+    return persona
+
+def _agregar_clave(indice, persona, clave):
+    if clave not in indice["personas"][persona]["claves"]:
+        indice["personas"][persona]["claves"].append(clave)
+    indice["claves"][clave] = persona
+
+def _ubicar(indice, dni, bloqueo):
+    """id de la persona de la fila (nueva si no estaba)"""
+    clave_dni = f"DNI:{dni}" if dni else None
+    clave_nombre = f"NOMBRE:{bloqueo}" if bloqueo else None
+    persona = indice["claves"].get(clave_dni) if clave_dni else None
+    if persona is None and clave_nombre:
+        candidata = indice["claves"].get(clave_nombre)
+        # La misma persona por nombre, salvo que ya tenga otro DNI (homónimo)
+        if candidata and not (dni and indice["personas"][candidata]["dni"] not in (None, dni)):
+            persona = candidata
+        elif candidata:
+            indice["claves"][clave_nombre] = None  # nombre ambiguo: ya no se usa para unir
+    if persona is None:
+        persona = _nueva_persona(indice)
+    if clave_dni:
+        indice["personas"][persona]["dni"] = dni
+        _agregar_clave(indice, persona, clave_dni)
+    if clave_nombre and indice["claves"].get(clave_nombre, persona) == persona:
+        _agregar_clave(indice, persona, clave_nombre)
+    return persona
+
+def quitar_archivos(indice, archivos):
+    """Saca del índice lo que aportaron esos partes (para volver a cargarlos sin duplicar)"""
+    for archivo in archivos:
+        for persona in indice["archivos"].pop(archivo, []):
+            datos = indice["personas"].get(persona)
+            if datos is None:
+                continue
+            datos["apariciones"] = [a for a in datos["apariciones"] if a[0] != archivo]
+            if not datos["apariciones"]:
+                for clave in datos["claves"]:
+                    if indice["claves"].get(clave) == persona:
+                        del indice["claves"][clave]
+                del indice["personas"][persona]
+
+def indexar_partes(indice, tablas):
+    """
+    Agrega al índice los imputados y víctimas de las tablas ({sección: filas},
+    como las de procesar_directorio). Un parte que ya estaba se reemplaza.
+    """
+    filas = {seccion: list(iterar_filas(tablas.get(seccion, []))) for seccion in ROLES}
+    quitar_archivos(indice, {fila["Archivo"] for lista in filas.values() for fila in lista})
+    for seccion, rol in ROLES.items():
+        for fila in filas[seccion]:
+            dni, bloqueo = normalizar_dni(fila.get("DNI")), clave_bloqueo(fila)
+            if not dni and not bloqueo:
+                continue
+            persona = _ubicar(indice, dni, bloqueo)
+            datos = indice["personas"][persona]
+            for campo, columna in (("apellidos", "Apellidos"), ("nombres", "Nombres"), ("edad", "Edad")):
+                valor = str(fila.get(columna, "")).strip()
+                if valor and valor != "-":
+                    datos[campo] = valor
+            datos["apariciones"].append([fila["Archivo"], str(fila.get("Lugar Nro", "")), rol])
+            archivos = indice["archivos"].setdefault(fila["Archivo"], [])
+            if persona not in archivos:
+                archivos.append(persona)
+    return indice
+
+
+# --- CONSULTAS ---
+def persona_por_dni(indice, dni):
+    """id de la persona con ese DNI, o None"""
+    dni = normalizar_dni(dni)
+    return indice["claves"].get(f"DNI:{dni}") if dni else None
+
+def partes_de_persona(indice, persona):
+    """[(Parte Operativo, archivo, lugar, rol)] de todos los partes en que aparece la persona"""
+    datos = indice["personas"].get(persona)
+    if datos is None:
+        return []
+    return [(parte_operativo(archivo), archivo, lugar, rol) for archivo, lugar, rol in datos["apariciones"]]
+
+def reincidentes(indice, minimo=REINCIDENCIA_MINIMA):
+    """DataFrame con las personas que aparecen en al menos minimo partes distintos, las de más partes primero"""
+    filas = []
+    for datos in indice["personas"].values():
+        archivos = list(dict.fromkeys(a[0] for a in datos["apariciones"]))
+        if len(archivos) < minimo:
+            continue
+        roles = [a[2] for a in datos["apariciones"]]
+        filas.append({
+            "DNI": datos["dni"] or "-",
+            "Apellidos": datos["apellidos"] or "-",
+            "Nombres": datos["nombres"] or "-",
+            "Edad": datos["edad"] or "-",
+            "Partes": len(archivos),
+            "Como Imputado": roles.count("IMPUTADO"),
+            "Como Victima": roles.count("VICTIMA"),
+            "Partes Operativos": ", ".join(parte_operativo(archivo) for archivo in archivos),
+        })
+    df = pd.DataFrame(filas, columns=COLUMNAS_REINCIDENTES)
+    return df.sort_values(["Partes", "Apellidos", "Nombres"], ascending=[False, True, True], ignore_index=True)
@@ -0,0 +1,72 @@
+import os
+import queue
+import threading
+from collections import deque
+
+# --- CONFIGURACIÓN ---
+PDFS_ADELANTADOS = 4  # PDF leídos del disco por adelantado (cola de lectura; acota la memoria)
+EN_VUELO_POR_WORKER = 2  # PDF en proceso o esperando su turno por cada worker del pool
+ESPERA_COLA = 0.5  # segundos entre reintentos del hilo lector cuando la cola está llena
+
+_FIN = object()
+
+
+# --- ETAPAS ---
+def _lector(directorio, archivos, cola, cortar):
+    for archivo in archivos:
+        try:
+            with open(os.path.join(directorio, archivo), "rb") as f:
+                item = (archivo, f.read(), None)
+        except OSError as e:
+            item = (archivo, None, e)
+        while not cortar.is_set():
+            try:
+                cola.put(item, timeout=ESPERA_COLA)
+                break
+            except queue.Full:
+                continue
+        if cortar.is_set():
+            return
+    cola.put(_FIN)
+
+def leer_adelantado(directorio, archivos, adelantados=PDFS_ADELANTADOS):
+    """
+    Devuelve (archivo, bytes) de cada PDF, en orden. Un hilo los va leyendo
+    del disco (OneDrive puede tardar en bajar cada archivo) mientras el resto
+    procesa los anteriores; nunca hay más de adelantados leídos sin usar.
+    Un error de lectura sale al llegar a ese archivo.
+    """
+    cola = queue.Queue(maxsize=max(1, adelantados))
+    cortar = threading.Event()
+    hilo = threading.Thread(target=_lector, args=(directorio, list(archivos), cola, cortar), daemon=True)
+    hilo.start()
+    try:
+        while True:
+            item = cola.get()
+            if item is _FIN:
+                return
+            archivo, datos, error = item
+            if error is not None:
+                raise error
+            yield archivo, datos
+    finally:
+        # Si quien consume corta antes (error, Ctrl+C), el hilo deja de leer
+        cortar.set()
+
+def mapa_acotado(pool, funcion, tareas, en_vuelo):
+    """
+    Como pool.map(funcion, tareas), pero toma las tareas de a una a medida
+    que se liberan lugares: nunca hay más de en_vuelo enviadas sin entregar
+    (pool.map las envía todas de entrada). Los resultados salen en orden.
+    """
+    pendientes = deque()
+    try:
+        for tarea in tareas:
+            pendientes.append(pool.submit(funcion, tarea))
+            if len(pendientes) >= en_vuelo:
+                yield pendientes.popleft().result()
+        while pendientes:
+            yield pendientes.popleft().result()
+    finally:
+        for futuro in pendientes:
+            futuro.cancel()
@@ -0,0 +1,69 @@
+import re
+
+# --- CONFIGURACIÓN ---
+TIPOS_SECCION = ("IMPUTADO", "VICTIMA", "DROGA", "ELEMENTO", "VEHICULO", "ARMA")
+
+# Una sola pasada: marcas de LUGAR n y palabras que abren/cierran apartados
+PATRON_MARCAS = re.compile(rf"LUGAR\s+(\d+)|({'|'.join(TIPOS_SECCION)})", re.IGNORECASE)
+PATRON_CAMPOS_CLAVE = re.compile(r"(Tipo:|Nombres:|Incautacion:|Marca:)", re.IGNORECASE)
+
+# Bloques de un parte en el orden en que aparecen y la marca con que empieza
+# cada uno (la cabecera es lo que está antes de todo)
+BLOQUES_PARTE = ("cabecera", "recursos", "lugares", "apartados", "resena")
+INICIOS_BLOQUE = {
+    "recursos": re.compile(r"RECURSOS\s+AFECTADOS|Efectivos\s*:", re.IGNORECASE),
+    "lugares": re.compile(r"LUGAR\s+\d+", re.IGNORECASE),
+    "apartados": re.compile(rf"(?:{'|'.join(TIPOS_SECCION)})\s+\d+", re.IGNORECASE),
+    "resena": re.compile(r"RESE[ÑN]A\s*:", re.IGNORECASE),
+}
+
+
+# --- FUNCIONES ---
+def tokenizar_secciones(texto):
+    """
+    Recorre el texto una sola vez y devuelve los apartados en orden, como
+    dicts {"tipo", "lugar", "inicio", "fin", "bloque"}.
+    Un apartado empieza en "<TIPO> " y termina donde aparece cualquier otra
+    palabra de TIPOS_SECCION (o al final del texto). "lugar" es el número del
+    último "LUGAR n" anterior al apartado ("1" si no hay ninguno).
+    """
+    # Igual que "$" sin MULTILINE: el final deja afuera un "\n" final
+    fin_texto = len(texto) - 1 if texto.endswith("\n") else len(texto)
+    secciones = []
+    abierta = None
+    lugar = "1"
+    for marca in PATRON_MARCAS.finditer(texto):
+        if marca.group(1) is not None:
+            lugar = marca.group(1)
+            continue
+        if abierta is not None:
+            abierta["fin"] = marca.start()
+            abierta = None
+        if texto.startswith(" ", marca.end()):
+            abierta = {"tipo": marca.group(2).upper(), "lugar": lugar,
+                       "inicio": marca.start(), "fin": fin_texto}
+            secciones.append(abierta)
+
+    for seccion in secciones:
+        seccion["bloque"] = texto[seccion["inicio"]:seccion["fin"]]
+    return secciones
+
+def extraer_bloques_con_lugar(tipo, secciones):
+    """
+    Devuelve [(bloque, lugar_nro)] de los apartados de un tipo (ARMA, DROGA,
+    ELEMENTO, IMPUTADO, VICTIMA, VEHICULO) que tengan algún campo clave.
+    """
+    return [
+        (seccion["bloque"], seccion["lugar"])
+        for seccion in secciones
+        if seccion["tipo"] == tipo and PATRON_CAMPOS_CLAVE.search(seccion["bloque"])
+    ]
+
+def empieza_bloque_posterior(texto, bloques):
+    """
+    True si en el texto empieza algún bloque posterior a los pedidos (por
+    ejemplo "LUGAR 1" para ("cabecera", "recursos")): a partir de ahí los
+    bloques pedidos ya están completos.
+    """
+    ultimo = max(BLOQUES_PARTE.index(bloque) for bloque in bloques)
+    return any(INICIOS_BLOQUE[bloque].search(texto) for bloque in BLOQUES_PARTE[ultimo + 1:])
@@ -0,0 +1,104 @@
+import sqlite3
+import pandas as pd
+from modulo_filas import iterar_filas
+from modulo_ingesta import SECCIONES
+
+# --- CONFIGURACIÓN ---
+# Índices además de los de Archivo y (Archivo, Lugar Nro), que tienen todas
+# las tablas que llevan esas columnas: {tabla: [columnas]}
+INDICES = {
+    "cabeceras": ["Parte Operativo", "Código Dependencia"],
+    "imputados": ["DNI"],
+    "victimas": ["DNI"],
+    "vehiculos": ["Dominio"],
+    "armas": ["Numeración"],
+}
+
+
+# --- FUNCIONES ---
+def _nombre(identificador):
+    """Nombre de tabla o columna entre comillas ("Juzgado / Fiscalía" tiene espacios y barra)"""
+    return '"' + identificador.replace('"', '""') + '"'
+
+def _columnas(conexion, tabla):
+    return [fila[1] for fila in conexion.execute(f"PRAGMA table_info({_nombre(tabla)})")]
+
+def _crear_indice(conexion, tabla, columnas):
+    nombre = "idx_" + "_".join([tabla, *columnas]).lower().replace(" ", "_").replace("/", "")
+    lista = ", ".join(_nombre(columna) for columna in columnas)
+    conexion.execute(f"CREATE INDEX IF NOT EXISTS {_nombre(nombre)} ON {_nombre(tabla)} ({lista})")
+
+def _asegurar_tabla(conexion, tabla, columnas):
+    """
+    Crea la tabla (o le agrega las columnas que falten) con sus índices. Las
+    columnas van sin tipo, así cada valor queda como lo dio el extractor
+    (texto o número), igual que en el Excel.
+    """
+    existentes = _columnas(conexion, tabla)
+    if not existentes:
+        conexion.execute(f"CREATE TABLE {_nombre(tabla)} ({', '.join(_nombre(c) for c in columnas)})")
+    else:
+        for columna in columnas:
+            if columna not in existentes:
+                conexion.execute(f"ALTER TABLE {_nombre(tabla)} ADD COLUMN {_nombre(columna)}")
+    todas = existentes + [columna for columna in columnas if columna not in existentes]
+    if "Archivo" in todas:
+        _crear_indice(conexion, tabla, ["Archivo"])
+        if "Lugar Nro" in todas:
+            _crear_indice(conexion, tabla, ["Archivo", "Lugar Nro"])
+    for columna in INDICES.get(tabla, []):
+        if columna in todas:
+            _crear_indice(conexion, tabla, [columna])
+
+def abrir_base(ruta):
+    """Conexión a la base SQLite (se crea si no existe). Una tabla por sección de SECCIONES."""
+    return sqlite3.connect(ruta)
+
+def guardar_partes(conexion, tablas):
+    """
+    Guarda las filas ({sección: filas}, como las de procesar_directorio)
+    reemplazando, en todas las tablas, las que ya hubiera de los mismos
+    archivos: volver a cargar un parte no lo duplica. Todo en una transacción.
+    """
+    tablas = {seccion: list(iterar_filas(tablas.get(seccion, []))) for seccion in SECCIONES}
+    archivos = {fila["Archivo"] for filas in tablas.values() for fila in filas}
+    with conexion:
+        for seccion in SECCIONES:
+            filas = tablas[seccion]
+            columnas = list(dict.fromkeys(columna for fila in filas for columna in fila))
+            if columnas:
+                _asegurar_tabla(conexion, seccion, columnas)
+            elif not _columnas(conexion, seccion):
+                continue
+            conexion.executemany(f"DELETE FROM {_nombre(seccion)} WHERE {_nombre('Archivo')} = ?",
+                                 [(archivo,) for archivo in archivos])
+            if filas:
+                lista = ", ".join(_nombre(columna) for columna in columnas)
+                marcas = ", ".join("?" for _ in columnas)
+                conexion.executemany(f"INSERT INTO {_nombre(seccion)} ({lista}) VALUES ({marcas})",
+                                     [tuple(fila.get(columna) for columna in columnas) for fila in filas])
+
+def leer_tablas(conexion, archivos=None):
+    """
+    Filas guardadas ({sección: [filas]}) ordenadas por archivo y en el orden en
+    que se cargaron, listas para armar las hojas del Excel. Con archivos, solo
+    las de esos archivos.
+    """
+    tablas = {}
+    for seccion in SECCIONES:
+        columnas = _columnas(conexion, seccion)
+        if not columnas:
+            tablas[seccion] = []
+            continue
+        consulta = f"SELECT * FROM {_nombre(seccion)}"
+        parametros = []
+        if archivos is not None:
+            parametros = list(archivos)
+            consulta += f" WHERE {_nombre('Archivo')} IN ({', '.join('?' for _ in parametros)})"
+        consulta += f" ORDER BY {_nombre('Archivo')}, rowid"
+        tablas[seccion] = [dict(zip(columnas, fila)) for fila in conexion.execute(consulta, parametros)]
+    return tablas
+
+def consultar(conexion, sql, parametros=()):
+    """DataFrame con el resultado de una consulta, por ejemplo por DNI o Dominio"""
+    return pd.read_sql_query(sql, conexion, params=parametros)
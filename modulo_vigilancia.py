@@ -0,0 +1,70 @@
+import os
+import time
+from modulo_ingesta import listar_pdfs
+
+# --- CONFIGURACIÓN ---
+INTERVALO = 1.0  # segundos entre dos revisiones de la carpeta
+ESPERA_ESTABLE = 2.0  # segundos que un PDF tiene que quedar sin cambiar de tamaño ni fecha antes de procesarlo
+PREFIJOS_IGNORADOS = ("~$", ".~lock", ".")  # archivos de bloqueo de Office/LibreOffice y ocultos
+FIN_PDF = b"%%EOF"  # marca de fin de un PDF; una copia a medio escribir todavía no la tiene
+BYTES_FINALES = 2048  # bytes del final del archivo donde se busca FIN_PDF
+
+
+# --- FUNCIONES ---
+def es_pdf_a_vigilar(archivo):
+    return not archivo.startswith(PREFIJOS_IGNORADOS)
+
+def _estado(ruta):
+    """(tamaño, fecha de modificación) o None si el archivo ya no está"""
+    try:
+        estado = os.stat(ruta)
+    except OSError:
+        return None
+    return estado.st_size, estado.st_mtime_ns
+
+def pdf_completo(ruta):
+    """True si el PDF se puede abrir y termina con %%EOF (mientras se copia, Windows no deja abrirlo)"""
+    try:
+        with open(ruta, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - BYTES_FINALES))
+            return FIN_PDF in f.read()
+    except OSError:
+        return False
+
+def esperar_pdfs(directorio, intervalo=INTERVALO, espera=ESPERA_ESTABLE):
+    """
+    Revisa el directorio cada intervalo segundos y, en cada vuelta, devuelve
+    la lista de PDF que llegaron (o cambiaron) y ya terminaron de escribirse:
+    sin cambios durante espera segundos y completos. Cada versión de un
+    archivo se entrega una sola vez; la lista puede venir vacía. No termina
+    nunca: se corta con Ctrl+C.
+    """
+    vistos = {}  # archivo: (estado, desde cuándo tiene ese estado)
+    entregados = {}  # archivo: estado con el que se entregó
+    while True:
+        ahora = time.monotonic()
+        listos = []
+        presentes = set()
+        for archivo in filter(es_pdf_a_vigilar, listar_pdfs(directorio)):
+            ruta = os.path.join(directorio, archivo)
+            estado = _estado(ruta)
+            if estado is None:
+                continue
+            presentes.add(archivo)
+            if entregados.get(archivo) == estado:
+                continue
+            anterior = vistos.get(archivo)
+            if anterior is None or anterior[0] != estado:
+                vistos[archivo] = (estado, ahora)
+            elif ahora - anterior[1] >= espera and estado[0] and pdf_completo(ruta):
+                listos.append(archivo)
+                entregados[archivo] = estado
+                del vistos[archivo]
+
+        # Los que ya no están (movidos a EN LA BASE o borrados) se olvidan
+        for registro in (vistos, entregados):
+            for archivo in set(registro) - presentes:
+                del registro[archivo]
+        yield listos
+        time.sleep(intervalo)
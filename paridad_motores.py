@@ -0,0 +1,158 @@
+import re
+import sys
+import time
+import warnings
+from benchmark import cargar_corpus, CARPETAS_CORPUS
+from modulo_pdf import MOTORES, motor_disponible, paginas_pdf
+import Unificado
+import modulo_causa
+
+warnings.filterwarnings("ignore", category=FutureWarning)
+
+# Compara, PDF por PDF de las carpetas del corpus (las del benchmark), los
+# campos que sacan Unificado.py y modulo_causa.py con cada motor de PDF contra
+# los del motor de referencia. Sirve para decidir si se puede cambiar MOTOR_PDF.
+
+# --- CONFIGURACIÓN ---
+MOTOR_REFERENCIA = "pypdf2"
+# Diferencias que no hacen fallar la comparación:
+#   "espacios": el mismo valor salvo espacios y saltos de línea
+#   "recupera": el motor encuentra un valor donde la referencia no tenía ("" o "-")
+TOLERADAS = {"espacios", "recupera"}
+VACIOS = {"", "-", "None", "nan"}
+DIFERENCIAS_A_LISTAR = 50  # por motor (se listan solo las no toleradas; de las demás se da la cantidad)
+
+
+# --- EXTRACCIÓN ---
+def _campos_unificado(archivo, paginas):
+    filas = Unificado.extraer_parte(archivo, "".join(paginas))
+    return {seccion: valor for seccion, valor in filas.items() if isinstance(valor, list)}
+
+def _campos_causa(archivo, paginas):
+    texto = "".join(pagina + "\n" for pagina in paginas)
+    return {"causa": [modulo_causa.extraer_datos(texto)] if texto.strip() else []}
+
+EXTRACTORES = {"Unificado.py": _campos_unificado, "modulo_causa.py": _campos_causa}
+
+def extraer(pdfs, motor):
+    """(segundos de extracción de texto, {(script, archivo): {sección: filas}})"""
+    textos = []
+    inicio = time.perf_counter()
+    for archivo, ruta in pdfs:
+        textos.append((archivo, list(paginas_pdf(ruta, motor))))
+    segundos = time.perf_counter() - inicio
+    campos = {}
+    for script, extractor in EXTRACTORES.items():
+        for archivo, paginas in textos:
+            campos[(script, archivo)] = extractor(archivo, paginas)
+    return segundos, campos
+
+
+# --- COMPARACIÓN ---
+def _sin_espacios(valor):
+    return re.sub(r"\s+", "", valor)
+
+def clasificar(referencia, valor):
+    referencia, valor = str(referencia), str(valor)
+    if referencia == valor:
+        return "igual"
+    if _sin_espacios(referencia) == _sin_espacios(valor):
+        return "espacios"
+    if referencia.strip() in VACIOS:
+        return "recupera"
+    if valor.strip() in VACIOS:
+        return "pierde"
+    return "distinto"
+
+def _distancia(fila, fila_otro):
+    """Cantidad de campos que cambian (salvo espacios) entre dos filas"""
+    return sum(_sin_espacios(str(fila.get(campo, ""))) != _sin_espacios(str(fila_otro.get(campo, "")))
+               for campo in fila.keys() | fila_otro.keys())
+
+def alinear(filas, filas_otro):
+    """
+    Pares (fila, fila del motor) que minimizan los campos distintos, así una
+    fila de más en un motor (un imputado que el otro no vio) no corre a todas
+    las siguientes; la fila sin par va con None.
+    """
+    n, m = len(filas), len(filas_otro)
+    costo = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n + 1):
+        for j in range(m + 1):
+            if i == 0 or j == 0:
+                costo[i][j] = sum(len(f) for f in filas[:i]) + sum(len(f) for f in filas_otro[:j])
+                continue
+            costo[i][j] = min(costo[i - 1][j - 1] + _distancia(filas[i - 1], filas_otro[j - 1]),
+                              costo[i - 1][j] + len(filas[i - 1]),
+                              costo[i][j - 1] + len(filas_otro[j - 1]))
+    pares = []
+    i, j = n, m
+    while i or j:
+        if i and j and costo[i][j] == costo[i - 1][j - 1] + _distancia(filas[i - 1], filas_otro[j - 1]):
+            pares.append((filas[i - 1], filas_otro[j - 1]))
+            i, j = i - 1, j - 1
+        elif i and costo[i][j] == costo[i - 1][j] + len(filas[i - 1]):
+            pares.append((filas[i - 1], None))
+            i -= 1
+        else:
+            pares.append((None, filas_otro[j - 1]))
+            j -= 1
+    return pares[::-1]
+
+def comparar(referencia, otro):
+    """({tipo: cantidad}, [(script, archivo, sección, fila, campo, valor referencia, valor motor, tipo)])"""
+    conteo = {}
+    diferencias = []
+    for (script, archivo), secciones in referencia.items():
+        for seccion, filas in secciones.items():
+            for i, (fila, fila_otro) in enumerate(alinear(filas, otro[(script, archivo)].get(seccion, []))):
+                if fila is None or fila_otro is None:
+                    tipo = "recupera" if fila is None else "pierde"
+                    conteo[tipo] = conteo.get(tipo, 0) + 1
+                    diferencias.append((script, archivo, seccion, i, "(fila)", fila, fila_otro, tipo))
+                    continue
+                for campo in list(fila) + [campo for campo in fila_otro if campo not in fila]:
+                    tipo = clasificar(fila.get(campo, ""), fila_otro.get(campo, ""))
+                    conteo[tipo] = conteo.get(tipo, 0) + 1
+                    if tipo != "igual":
+                        diferencias.append((script, archivo, seccion, i, campo, fila.get(campo, ""),
+                                            fila_otro.get(campo, ""), tipo))
+    return conteo, diferencias
+
+def _corto(valor, largo=40):
+    valor = str(valor).replace("\n", " ")
+    return valor if len(valor) <= largo else valor[:largo - 3] + "..."
+
+
+if __name__ == "__main__":
+    pdfs = cargar_corpus()
+    if not pdfs:
+        sys.exit(f"No hay PDF de muestra en {CARPETAS_CORPUS}")
+    print(f"Corpus: {len(pdfs)} PDF, referencia: {MOTOR_REFERENCIA}")
+    segundos_ref, referencia = extraer(pdfs, MOTOR_REFERENCIA)
+    print(f"{MOTOR_REFERENCIA}: {segundos_ref:.2f} s de extracción de texto")
+
+    fallan = []
+    for motor in MOTORES:
+        if motor == MOTOR_REFERENCIA:
+            continue
+        if not motor_disponible(motor):
+            print(f"\n{motor}: no instalado, se omite")
+            continue
+        segundos, campos = extraer(pdfs, motor)
+        conteo, diferencias = comparar(referencia, campos)
+        print(f"\n{motor}: {segundos:.2f} s de extracción de texto ({segundos_ref / segundos:.1f}x)")
+        print("  " + ", ".join(f"{tipo}: {cantidad}" for tipo, cantidad in sorted(conteo.items())))
+        graves = [diferencia for diferencia in diferencias if diferencia[-1] not in TOLERADAS]
+        for script, archivo, seccion, fila, campo, valor, valor_otro, tipo in graves[:DIFERENCIAS_A_LISTAR]:
+            print(f"  [{tipo}] {script} {archivo} {seccion}[{fila}] {campo}: "
+                  f"{_corto(valor)!r} -> {_corto(valor_otro)!r}")
+        if len(graves) > DIFERENCIAS_A_LISTAR:
+            print(f"  ... y {len(graves) - DIFERENCIAS_A_LISTAR} diferencias más")
+        if graves:
+            fallan.append(motor)
+
+    if fallan:
+        print(f"\nSin paridad con {MOTOR_REFERENCIA}: {', '.join(fallan)}")
+        sys.exit(1)
+    print(f"\nTodos los motores disponibles dan los mismos campos que {MOTOR_REFERENCIA}")
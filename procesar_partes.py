@@ -1,11 +1,15 @@
 import os
 import re
 import pandas as pd
-from PyPDF2 import PdfReader
+from modulo_ingesta import SECCIONES, procesar_directorio
+from modulo_filas import a_dataframe
+from modulo_secciones import tokenizar_secciones, extraer_bloques_con_lugar
 
 # --- CONFIGURACIÓN ---
 DIRECTORIO_PDFS = r"C:\Users\ecastro\Desktop\PARTES"
 SALIDA_EXCEL = r"C:\Users\ecastro\Desktop\resultado_detallado_corregido.xlsx"
+WORKERS = os.cpu_count() or 1  # procesos para leer los PDF en paralelo (1 = secuencial)
+DIRECTORIO_CACHE = os.path.join(DIRECTORIO_PDFS, ".cache")  # texto y registros ya extraídos (None = sin cache)
 
 # --- FUNCIONES DE APOYO ---
 def limpiar_dni(dni):
@@ -35,43 +39,10 @@ def extraer_todos(patron, texto, limpiar=None):
         resultados.append(dato)
     return resultados
 
-def extraer_bloques_con_lugar(tipo, texto):
-    """
-    Extrae bloques de un tipo (ARMA, DROGA, ELEMENTO, IMPUTADO, VEHICULO)
-    y asocia el número del LUGAR más cercano antes del bloque.
-    Filtra bloques sin campos clave.
-    """
-    bloques = re.findall(
-        rf"({tipo} .*?)(?=IMPUTADO|VICTIMA|DROGA|ELEMENTO|VEHICULO|ARMA|$)",
-        texto, re.IGNORECASE | re.DOTALL
-    )
-    resultados = []
-    for bloque in bloques:
-        # Filtrar si no hay ninguna pista de datos útiles
-        if not re.search(r"(Tipo:|Nombres:|Incautacion:|Marca:)", bloque, re.IGNORECASE):
-            continue
-        # Buscar el último LUGAR N antes del bloque
-        idx = texto.find(bloque)
-        lugar_match = re.findall(r"LUGAR\s+(\d+)", texto[:idx], re.IGNORECASE)
-        lugar_nro = lugar_match[-1] if lugar_match else "1"
-        resultados.append((bloque, lugar_nro))
-    return resultados
-
-# --- TABLAS ACUMULADAS ---
-cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros = ([] for _ in range(9))
-
-# --- PROCESAR TODOS LOS PDF ---
-for archivo in os.listdir(DIRECTORIO_PDFS):
-    if not archivo.lower().endswith(".pdf"):
-        continue
-
-    ruta_pdf = os.path.join(DIRECTORIO_PDFS, archivo)
-    print(f"Procesando: {archivo}")
-
-    reader = PdfReader(ruta_pdf)
-    texto = ""
-    for page in reader.pages:
-        texto += page.extract_text()
+# --- EXTRACCIÓN DE UN PARTE ---
+def extraer_parte(archivo, texto):
+    """Devuelve las filas de cada apartado extraídas del texto de un parte operativo"""
+    cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros = ([] for _ in range(9))
 
     # --- CABECERA ---
     fecha_hora = extraer_unico(r"Fecha y Hora:\s*([\d\-]+\s*-\s*\d{2}:\d{2})", texto)
@@ -117,8 +88,11 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
             "Coordenadas": coords[i] if i < len(coords) else "",
         })
 
+    # Ubicar todos los apartados y su LUGAR en una sola pasada
+    secciones = tokenizar_secciones(texto)
+
     # --- ARMAS ---
-    for bloque, lugar in extraer_bloques_con_lugar("ARMA", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("ARMA", secciones):
         tipo = a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque))
         detalles = a_mayusculas(extraer_unico(r"Detalles:\s*([^\n<]+)", bloque))
         marca = a_mayusculas(extraer_unico(r"Marca:\s*([^\n<]+)", bloque))
@@ -145,7 +119,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         })
 
     # --- DROGAS ---
-    for bloque, lugar in extraer_bloques_con_lugar("DROGA", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("DROGA", secciones):
         tipo = a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque))
         cantidad = extraer_unico(r"Cantidad:\s*([\d.,]+)", bloque)
         medicion = a_mayusculas(extraer_unico(r"Medicion:\s*([^\n<]+)", bloque))
@@ -164,7 +138,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         })
 
     # --- ELEMENTOS ---
-    for bloque, lugar in extraer_bloques_con_lugar("ELEMENTO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("ELEMENTO", secciones):
         incautacion = a_mayusculas(extraer_unico(r"Incautacion:\s*([^\n<]+)", bloque))
         tipo = a_mayusculas(extraer_unico(r"Tipo:\s*([^\n<]+)", bloque))
         subtipo = a_mayusculas(extraer_unico(r"Subtipo:\s*([^\n<]+)", bloque))
@@ -189,7 +163,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         })
 
     # --- IMPUTADOS ---
-    for bloque, lugar in extraer_bloques_con_lugar("IMPUTADO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("IMPUTADO", secciones):
         nombres = a_mayusculas(extraer_unico(r"Nombres:\s*([^\n<]+)", bloque))
         apellidos = a_mayusculas(extraer_unico(r"Apellidos:\s*([^\n<]+)", bloque))
         edad = extraer_unico(r"Edad:\s*(\d+)", bloque)
@@ -220,7 +194,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         })
 
     # --- VÍCTIMAS ---
-    for bloque in re.findall(r"(VICTIMA .*?)(?=IMPUTADO|VICTIMA|DROGA|ELEMENTO|VEHICULO|ARMA|$)", texto, re.IGNORECASE | re.DOTALL):
+    for bloque in (s["bloque"] for s in secciones if s["tipo"] == "VICTIMA"):
         nombres = a_mayusculas(extraer_unico(r"Nombres:\s*([^\n<]+)", bloque))
         apellidos = a_mayusculas(extraer_unico(r"Apellidos:\s*([^\n<]+)", bloque))
         edad = extraer_unico(r"Edad:\s*(\d+)", bloque)
@@ -244,7 +218,7 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         })
 
     # --- VEHÍCULOS ---
-    for bloque, lugar in extraer_bloques_con_lugar("VEHICULO", texto):
+    for bloque, lugar in extraer_bloques_con_lugar("VEHICULO", secciones):
         marca = a_mayusculas(extraer_unico(r"Marca:\s*([^\n<]+)", bloque))
         modelo = a_mayusculas(extraer_unico(r"Modelo:\s*([^\n<]+)", bloque))
         dominio = a_mayusculas(extraer_unico(r"Dominio:\s*([^\n<]+)", bloque))
@@ -276,16 +250,25 @@ for archivo in os.listdir(DIRECTORIO_PDFS):
         "Caballos": extraer_unico(r"Caballos:\s*(\d+)", texto),
     })
 
-# --- GUARDAR EN VARIAS HOJAS ---
-with pd.ExcelWriter(SALIDA_EXCEL) as writer:
-    pd.DataFrame(cabeceras).to_excel(writer, sheet_name="Cabecera", index=False)
-    pd.DataFrame(lugares).to_excel(writer, sheet_name="Lugares", index=False)
-    pd.DataFrame(armas).to_excel(writer, sheet_name="Armas", index=False)
-    pd.DataFrame(drogas).to_excel(writer, sheet_name="Drogas", index=False)
-    pd.DataFrame(elementos).to_excel(writer, sheet_name="Elementos", index=False)
-    pd.DataFrame(imputados).to_excel(writer, sheet_name="Imputados", index=False)
-    pd.DataFrame(victimas).to_excel(writer, sheet_name="Victimas", index=False)
-    pd.DataFrame(vehiculos).to_excel(writer, sheet_name="Vehiculos", index=False)
-    pd.DataFrame(otros).to_excel(writer, sheet_name="Otros", index=False)
-
-print(f"Procesamiento completo. Archivo guardado en {SALIDA_EXCEL}")
+    return dict(zip(SECCIONES, (cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros)))
+
+
+if __name__ == "__main__":
+    # --- PROCESAR PDFs ---
+    tablas = procesar_directorio(DIRECTORIO_PDFS, extraer_parte, workers=WORKERS,
+                                  directorio_cache=DIRECTORIO_CACHE)
+    cabeceras, lugares, armas, drogas, elementos, imputados, victimas, vehiculos, otros = (tablas[s] for s in SECCIONES)
+
+    # --- GUARDAR EN VARIAS HOJAS ---
+    with pd.ExcelWriter(SALIDA_EXCEL) as writer:
+        a_dataframe(cabeceras).to_excel(writer, sheet_name="Cabecera", index=False)
+        a_dataframe(lugares).to_excel(writer, sheet_name="Lugares", index=False)
+        a_dataframe(armas).to_excel(writer, sheet_name="Armas", index=False)
+        a_dataframe(drogas).to_excel(writer, sheet_name="Drogas", index=False)
+        a_dataframe(elementos).to_excel(writer, sheet_name="Elementos", index=False)
+        a_dataframe(imputados).to_excel(writer, sheet_name="Imputados", index=False)
+        a_dataframe(victimas).to_excel(writer, sheet_name="Victimas", index=False)
+        a_dataframe(vehiculos).to_excel(writer, sheet_name="Vehiculos", index=False)
+        a_dataframe(otros).to_excel(writer, sheet_name="Otros", index=False)
+
+    print(f"Procesamiento completo. Archivo guardado en {SALIDA_EXCEL}")
@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+from modulo_combinar import asegurar_columnas, marcar_procedimiento
+
+# Regresión: las versiones vectorizadas de modulo_combinar tienen que dar lo
+# mismo que las originales fila por fila (copiadas acá tal como estaban en
+# Unificado.py).
+
+
+# --- VERSIONES ORIGINALES ---
+def asegurar_columnas_filas(df, columnas, df_lugares):
+    if df.empty:
+        filas = []
+        for _, row in df_lugares.iterrows():
+            fila = {col: "-" for col in columnas}
+            fila["Archivo"] = row["Archivo"]
+            fila["Lugar Nro"] = str(row["Lugar Nro"])
+            filas.append(fila)
+        return pd.DataFrame(filas, columns=columnas)
+    return df
+
+def marcar_procedimiento_filas(unificado):
+    unificado = unificado.copy()
+    unificado["Procedimiento"] = "-"
+    vistos = set()
+    for idx, row in unificado.iterrows():
+        clave = (row["Archivo"], row["Lugar Nro"])
+        if clave not in vistos:
+            unificado.at[idx, "Procedimiento"] = 1
+            vistos.add(clave)
+    return unificado["Procedimiento"]
+
+
+# --- DATOS ---
+COLUMNAS_ARMAS = ["Archivo", "Lugar Nro", "Tipo", "Marca", "Numeración"]
+
+LUGARES = {
+    "vacio": pd.DataFrame([], columns=["Archivo", "Lugar Nro", "Calle"]),
+    "uno": pd.DataFrame({"Archivo": ["a.pdf"], "Lugar Nro": ["1"], "Calle": ["MITRE"]}),
+    # Lugar Nro repetido, mezclando int y str, y un archivo que vuelve a aparecer
+    "repetidos": pd.DataFrame({
+        "Archivo": ["a.pdf", "a.pdf", "b.pdf", "b.pdf", "a.pdf"],
+        "Lugar Nro": [1, "1", 2, 2, 3],
+        "Calle": ["MITRE", "MITRE", "SARMIENTO", "-", "ALSINA"],
+    }),
+    # Sin la columna Calle (solo las claves)
+    "sin_columnas": pd.DataFrame({"Archivo": ["c.pdf", "c.pdf"], "Lugar Nro": ["1", "2"]}),
+}
+
+UNIFICADOS = {
+    "vacio": pd.DataFrame([], columns=["Archivo", "Lugar Nro", "Calle"]),
+    "sin_repetidos": pd.DataFrame({"Archivo": ["a.pdf", "a.pdf", "b.pdf"], "Lugar Nro": ["1", "2", "1"]}),
+    "repetidos": pd.DataFrame({
+        "Archivo": ["a.pdf", "a.pdf", "a.pdf", "b.pdf", "b.pdf", "a.pdf"],
+        "Lugar Nro": ["1", "1", "2", "1", "1", "1"],
+        "Tipo": ["PISTOLA", "-", "REVOLVER", "-", "-", "ESCOPETA"],
+    }),
+    "mezclados": pd.DataFrame({"Archivo": ["a.pdf"] * 4, "Lugar Nro": [1, "1", 1, "2"]}),
+    "indice_propio": pd.DataFrame({"Archivo": ["a.pdf", "a.pdf", "b.pdf"], "Lugar Nro": ["1", "1", "1"]},
+                                  index=[10, 5, 7]),
+}
+
+
+# --- PRUEBAS ---
+@pytest.mark.parametrize("lugares", LUGARES, ids=list(LUGARES))
+def test_asegurar_columnas_apartado_vacio(lugares):
+    df_lugares = LUGARES[lugares]
+    vacio = pd.DataFrame([], columns=COLUMNAS_ARMAS)
+    esperado = asegurar_columnas_filas(vacio, COLUMNAS_ARMAS, df_lugares)
+    obtenido = asegurar_columnas(vacio, COLUMNAS_ARMAS, df_lugares)
+    assert obtenido.equals(esperado)
+
+def test_asegurar_columnas_apartado_sin_columnas():
+    # Apartado vacío y sin columnas: se rellena con las pedidas
+    vacio = pd.DataFrame()
+    esperado = asegurar_columnas_filas(vacio, COLUMNAS_ARMAS, LUGARES["repetidos"])
+    obtenido = asegurar_columnas(vacio, COLUMNAS_ARMAS, LUGARES["repetidos"])
+    assert obtenido.equals(esperado)
+
+def test_asegurar_columnas_apartado_con_filas():
+    armas = pd.DataFrame({"Archivo": ["a.pdf"], "Lugar Nro": ["1"], "Tipo": ["PISTOLA"]})
+    esperado = asegurar_columnas_filas(armas, COLUMNAS_ARMAS, LUGARES["repetidos"])
+    obtenido = asegurar_columnas(armas, COLUMNAS_ARMAS, LUGARES["repetidos"])
+    assert obtenido.equals(esperado)
+
+@pytest.mark.parametrize("unificado", UNIFICADOS, ids=list(UNIFICADOS))
+def test_marcar_procedimiento(unificado):
+    df = UNIFICADOS[unificado]
+    esperado = marcar_procedimiento_filas(df)
+    obtenido = marcar_procedimiento(df)
+    assert obtenido.equals(esperado)
+    # Asignada como columna (como en los scripts) también queda igual
+    assert df.assign(Procedimiento=obtenido).equals(df.assign(Procedimiento=esperado))
@@ -0,0 +1,22 @@
+import pytest
+from modulo_esquema import ESQUEMA, ESQUEMA_NO_LEE, compilar_campos, extraer_campos
+
+
+# --- CABECERA ---
+@pytest.mark.parametrize("texto, causa", [
+    ("Causa Nro.: 1234/2025\nCaratula: ROBO", "1234/2025"),
+    ("Causa Nro 99-A\n", "99-A"),
+    ("Causa Numero: ipp 5555\n", "IPP 5555"),
+])
+def test_causa_no_lee_es_el_numero(texto, causa):
+    assert extraer_campos(ESQUEMA_NO_LEE["cabecera"], texto)["Causa Nro."] == causa
+
+def test_causa_principal_es_el_numero():
+    texto = "> Causa Nro.: 1234/2025 <"
+    assert extraer_campos(ESQUEMA["cabecera"], texto)["Causa Nro."] == "1234/2025"
+
+
+# --- ESQUEMAS ---
+def test_etiqueta_con_grupo_de_captura():
+    with pytest.raises(ValueError):
+        compilar_campos([("Causa Nro.", r"Causa\s*(Nro\.?|Numero)\s*:?", r"\s*(.+?)(?:<|\n|$)", None, "")])
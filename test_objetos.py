@@ -0,0 +1,38 @@
+from modulo_filas import acumular_filas, iterar_filas, nueva_tabla
+from modulo_objetos import antecedentes, indexar_objetos, nuevo_indice_objetos
+
+
+# --- DATOS ---
+def tablas(*vehiculos):
+    """Tablas de un lote con solo la sección vehiculos: (archivo, dominio, pedido de secuestro)"""
+    tabla = nueva_tabla()
+    acumular_filas(tabla, [{"Archivo": archivo, "Lugar Nro": "1", "Dominio": dominio, "Pedido de Secuestro": pedido}
+                           for archivo, dominio, pedido in vehiculos])
+    return {"vehiculos": tabla}
+
+def anotar_lote(indice, lote):
+    """Como actualizar_objetos en exportar_por_lotes: primero se indexa el lote, después se anota"""
+    indexar_objetos(indice, lote)
+    filas = list(iterar_filas(lote["vehiculos"]))
+    return antecedentes(indice, "dominios", [fila["Dominio"] for fila in filas], [fila["Archivo"] for fila in filas])
+
+
+# --- PRUEBAS ---
+def test_mismo_lote():
+    # Dos partes del mismo lote se ven entre sí
+    indice = nuevo_indice_objetos()
+    lote = tablas(("1-PO-1-2025.pdf", "AB 646 KS", "NO"), ("1-PO-2-2025.pdf", "ab646ks", "SI"))
+    assert anotar_lote(indice, lote) == [("1-PO-2-2025", "SI"), ("1-PO-1-2025", "NO")]
+
+def test_lotes_siguientes():
+    # Un lote ve los anteriores; los anteriores (ya escritos) no ven a los que vienen después
+    indice = nuevo_indice_objetos()
+    primero = anotar_lote(indice, tablas(("1-PO-1-2025.pdf", "AB646KS", "SI")))
+    segundo = anotar_lote(indice, tablas(("1-PO-2-2025.pdf", "AB646KS", "NO")))
+    assert primero == [("-", "NO")]
+    assert segundo == [("1-PO-1-2025", "SI")]
+
+def test_sin_identificador():
+    indice = nuevo_indice_objetos()
+    lote = tablas(("1-PO-1-2025.pdf", "-", "NO"), ("1-PO-2-2025.pdf", "-", "NO"))
+    assert anotar_lote(indice, lote) == [("-", "-"), ("-", "-")]